@@ -2,6 +2,9 @@
 
 This example shows how to open two SpaceMouse devices simultaneously,
 useful for dual-hand control or controlling multiple robots.
+
+DeviceFuser aligns both report streams onto a common timeline, so each
+frame holds samples of both devices taken at the same time.
 """
 
 import time
@@ -34,17 +37,20 @@ def main():
             print()
             print("Move both devices (Ctrl+C to exit)")
 
-            while True:
-                left = left_hand.read()
-                right = right_hand.read()
+            with pyspacemouse.DeviceFuser([left_hand, right_hand], delay=0.01) as fuser:
+                while True:
+                    fuser.poll()
+                    frame = fuser.frame()
+                    left, right = frame.states
 
-                if left.has_motion() or right.has_motion():
-                    print(
-                        f"Left: x={left.x:+.2f} y={left.y:+.2f} z={left.z:+.2f}  |  "
-                        f"Right: x={right.x:+.2f} y={right.y:+.2f} z={right.z:+.2f}"
-                    )
+                    if left.has_motion() or right.has_motion():
+                        print(
+                            f"Left: x={left.x:+.2f} y={left.y:+.2f} z={left.z:+.2f}  |  "
+                            f"Right: x={right.x:+.2f} y={right.y:+.2f} z={right.z:+.2f}  "
+                            f"(skew {frame.skew * 1e3:.1f} ms)"
+                        )
 
-                time.sleep(0.01)
+                    time.sleep(0.01)
 
 
 if __name__ == "__main__":
@@ -41,8 +41,10 @@ from .api import (
     get_connected_devices_by_path,
     get_supported_devices,
     open,
+    open_all,
     open_by_path,
     open_with_config,
+    set_enumeration_cache_ttl,
 )
 
 # Callback types
@@ -50,16 +52,62 @@ from .callbacks import (
     ButtonCallback,
     Config,
     DofCallback,
+    GestureCallback,
 )
 
 # Config helpers (for custom device configurations)
 from .config_helpers import apply_axis_convention, create_device_info, modify_device_info
 
 # Device class
-from .device import SpaceMouseDevice
+from .device import CallbackHandle, SpaceMouseDevice
+
+# Multi-device fusion
+from .fusion import DeviceFuser, FusedFrame
+
+# Gesture recognition
+from .gestures import GestureEvent, GestureRecognizer, GestureThresholds
+
+# Direct hidraw transport (Linux)
+from .hidraw import HidrawDevice
+
+# Hotplug notifications (Linux)
+from .hotplug import HotplugWatcher, watch
 
 # Loader (for advanced usage)
-from .loader import get_device_specs, load_device_specs
+from .loader import get_device_index, get_device_specs, load_device_specs
+
+# Input-to-action mapping
+from .mapping import MappingEngine, MappingRule, load_mapping_rules
+
+# Process-per-device reader pool
+from .pool import DevicePool, PooledDevice
+from .profiling import CallbackProfile
+
+# Real-time reader options
+from .realtime import RealtimeOptions, RealtimeReport, realtime_scope
+
+# Fixed-rate resampling
+from .resample import Resampler
+
+# Session logging
+from .session_log import SessionLogger
+
+# Shared-memory report ring
+from .shm_ring import ReportRing, ReportRingReader
+from .stats import DeviceStats, RunStats
+
+# Axis predicate subscriptions
+from .subscriptions import (
+    AxisPredicate,
+    Subscription,
+    SubscriptionIndex,
+    above,
+    below,
+    between,
+    crosses,
+    outside,
+)
+from .timing import ReportClock
 from .types import (
     AXIS_NAMES,
     Axis,
@@ -94,21 +142,70 @@ __all__ = [
     "ButtonCallback",
     "Config",
     "DofCallback",
+    "GestureCallback",
+    # Gestures
+    "GestureEvent",
+    "GestureRecognizer",
+    "GestureThresholds",
     # Device
     "SpaceMouseDevice",
+    "CallbackHandle",
     # API
     "get_all_hid_devices",
     "get_connected_devices",
     "get_connected_devices_by_path",
     "get_supported_devices",
     "open",
+    "open_all",
     "open_by_path",
     "open_with_config",
+    "set_enumeration_cache_ttl",
+    # Transports
+    "HidrawDevice",
+    # Timing and statistics
+    "CallbackProfile",
+    "DeviceStats",
+    "RunStats",
+    "ReportClock",
+    # Fusion
+    "DeviceFuser",
+    "FusedFrame",
+    # Mapping
+    "MappingEngine",
+    "MappingRule",
+    "load_mapping_rules",
+    # Reader pool
+    "DevicePool",
+    "PooledDevice",
+    # Real-time options
+    "RealtimeOptions",
+    "RealtimeReport",
+    "realtime_scope",
+    # Resampling
+    "Resampler",
+    # Session logging
+    "SessionLogger",
+    # Shared memory
+    "ReportRing",
+    "ReportRingReader",
+    # Subscriptions
+    "AxisPredicate",
+    "Subscription",
+    "SubscriptionIndex",
+    "above",
+    "below",
+    "between",
+    "crosses",
+    "outside",
+    # Hotplug
+    "HotplugWatcher",
+    "watch",
     # Utils
     "print_buttons",
     "print_state",
     "silent_callback",
     # Loader
+    "get_device_index",
     "get_device_specs",
     "load_device_specs",
     # Config helpers
@@ -16,18 +16,161 @@ Usage:
 
 from __future__ import annotations
 
+import copy
+import os
+import stat
+import time
 import warnings
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
 
 from easyhid import Enumeration
 
 from .callbacks import ButtonCallback, Config, DofCallback
 from .config_helpers import apply_axis_convention
 from .device import SpaceMouseDevice
-from .loader import get_device_specs
+from .hidraw import HidrawDevice
+from .loader import get_device_index, get_device_specs
 from .types import AxisConvention, DeviceInfo, SpaceMouseState
 
+if TYPE_CHECKING:
+    from easyhid import HIDDevice
+
+
+class _EnumerationCache:
+    """Optional short-lived cache of the last HID enumeration.
+
+    Disabled by default (ttl of 0). When enabled, discovery and open calls
+    made within ttl seconds of each other share one enumeration.
+
+    The enumerated HID devices are only used as descriptions (path, IDs,
+    strings) and are never opened themselves: every open gets a new handle
+    from _new_handle(), so two opens of a cached device never share one.
+    """
+
+    __slots__ = ("ttl", "_devices", "_timestamp", "_index")
+
+    def __init__(self) -> None:
+        self.ttl = 0.0
+        self._devices: Optional[List[HIDDevice]] = None
+        self._timestamp = 0.0
+        self._index: Optional[_EnumerationIndex] = None
+
+    def get(self) -> List[HIDDevice]:
+        """Return the cached device list, enumerating again if it expired."""
+        now = time.monotonic()
+        if self._devices is not None and now - self._timestamp < self.ttl:
+            return self._devices
+
+        try:
+            hid = Enumeration()
+        except AttributeError as e:
+            raise RuntimeError(
+                "HID API is probably not installed. See https://spacemouse.kubaandrysek.cz for details."
+            ) from e
+
+        self._devices = hid.device_list
+        self._timestamp = now
+        return self._devices
+
+    def index(self) -> _EnumerationIndex:
+        """Return the index of the (possibly cached) enumeration."""
+        devices = self.get()
+        index = self._index
+        if index is None or index.devices is not devices:
+            index = self._index = _EnumerationIndex(devices)
+        return index
+
+    def clear(self) -> None:
+        """Drop the cached enumeration."""
+        self._devices = None
+        self._index = None
+
+
+class _EnumerationIndex:
+    """Enumerated HID devices indexed by VID/PID, path and device number.
+
+    The indexes by VID/PID and by path are built from the enumerated
+    values without any filesystem access. The index by st_rdev (e.g. the
+    major/minor number of /dev/hidraw3) is only built, with one stat() per
+    device, when a lookup by path misses.
+    """
+
+    __slots__ = ("devices", "_by_hid_id", "_by_path", "_by_rdev")
+
+    def __init__(self, devices: List[HIDDevice]) -> None:
+        self.devices = devices
+        self._by_hid_id: Dict[Tuple[int, int], List[HIDDevice]] = {}
+        self._by_path: Dict[str, HIDDevice] = {}
+        for dev in devices:
+            self._by_hid_id.setdefault((dev.vendor_id, dev.product_id), []).append(dev)
+            self._by_path.setdefault(os.fsdecode(dev.path), dev)
+        self._by_rdev: Optional[Dict[int, HIDDevice]] = None
+
+    def find(self, hid_id: Tuple[int, int]) -> List[HIDDevice]:
+        """Return the devices with a (vendor_id, product_id), in enumeration order."""
+        return self._by_hid_id.get(hid_id, [])
+
+    def lookup(self, path: str, rdev: int = 0) -> Optional[HIDDevice]:
+        """Find the device enumerated at a canonical path or device number."""
+        dev = self._by_path.get(path)
+        if dev is not None or not rdev:
+            return dev
+        if self._by_rdev is None:
+            self._by_rdev = {}
+            for dev_path, dev in self._by_path.items():
+                try:
+                    st = os.stat(dev_path)
+                except (OSError, ValueError):
+                    continue
+                if st.st_rdev:
+                    self._by_rdev.setdefault(st.st_rdev, dev)
+        return self._by_rdev.get(rdev)
+
+
+def _new_handle(hid_device: HIDDevice) -> HIDDevice:
+    """Return a new, unopened handle for an enumerated HID device."""
+    return copy.copy(hid_device)
+
+
+_enumeration_cache = _EnumerationCache()
+
+
+def set_enumeration_cache_ttl(ttl: float) -> None:
+    """Enable or disable caching of HID enumeration results.
+
+    Enumerating HID devices can be slow on hosts with many peripherals.
+    With a positive ttl, calls such as get_connected_devices() followed by
+    open() within ttl seconds share a single enumeration. Devices plugged in
+    or removed during that window are not seen until the cache expires.
+
+    Args:
+        ttl: Maximum age of a cached enumeration in seconds. 0 disables
+             the cache (the default).
+    """
+    if ttl < 0:
+        raise ValueError("ttl must be >= 0")
+    _enumeration_cache.ttl = ttl
+    _enumeration_cache.clear()
+
+
+def _enumerate_hid_devices() -> List[HIDDevice]:
+    """Return all connected HID devices, honouring the enumeration cache."""
+    return _enumeration_cache.get()
+
+
+def _find_supported_devices(
+    hid_devices: Sequence[HIDDevice],
+) -> List[Tuple[HIDDevice, DeviceInfo]]:
+    """Pair each enumerated HID device with its spec, skipping unsupported ones."""
+    index = get_device_index()
+    supported = []
+    for hid_device in hid_devices:
+        spec = index.get((hid_device.vendor_id, hid_device.product_id))
+        if spec is not None:
+            supported.append((hid_device, spec))
+    return supported
+
 
 def get_connected_devices() -> List[str]:
     """Return a list of the supported devices currently connected.
@@ -39,22 +182,7 @@ def get_connected_devices() -> List[str]:
     Raises:
         RuntimeError: If HID API is not installed.
     """
-    try:
-        hid = Enumeration()
-    except AttributeError as e:
-        raise RuntimeError(
-            "HID API is probably not installed. See https://spacemouse.kubaandrysek.cz for details."
-        ) from e
-
-    device_specs = get_device_specs()
-    devices = []
-
-    for hid_device in hid.find():
-        for name, spec in device_specs.items():
-            if hid_device.vendor_id == spec.vendor_id and hid_device.product_id == spec.product_id:
-                devices.append(name)
-
-    return devices
+    return [spec.name for _, spec in _find_supported_devices(_enumerate_hid_devices())]
 
 
 def get_supported_devices() -> List[Tuple[str, int, int]]:
@@ -75,13 +203,6 @@ def get_all_hid_devices() -> List[Tuple[str, str, int, int]]:
     Raises:
         RuntimeError: If HID API is not installed.
     """
-    try:
-        hid = Enumeration()
-    except AttributeError as e:
-        raise RuntimeError(
-            "HID API is probably not installed. See https://spacemouse.kubaandrysek.cz for details."
-        ) from e
-
     return [
         (
             dev.product_string or "",
@@ -89,7 +210,7 @@ def get_all_hid_devices() -> List[Tuple[str, str, int, int]]:
             dev.vendor_id,
             dev.product_id,
         )
-        for dev in hid.find()
+        for dev in _enumerate_hid_devices()
     ]
 
 
@@ -129,7 +250,7 @@ def _create_and_open_device(
             )
         spec = apply_axis_convention(spec, axis_convention)
 
-    mouse = SpaceMouseDevice(info=spec, device=hid_device)
+    mouse = SpaceMouseDevice(info=spec, device=hid_device, axis_convention=axis_convention)
     mouse.configure(
         callback=callback,
         dof_callback=dof_callback,
@@ -138,7 +259,7 @@ def _create_and_open_device(
         button_callbacks=button_callbacks,
     )
     mouse.open()
-    hid_device.set_nonblocking(nonblocking)
+    mouse.set_nonblocking(nonblocking)
     return mouse
 
 
@@ -152,12 +273,18 @@ def open_by_path(
     nonblocking: bool = True,
     device_spec: Optional[DeviceInfo] = None,
     axis_convention: Optional[AxisConvention] = None,
+    backend: str = "hidapi",
 ) -> SpaceMouseDevice:
     """Open a SpaceMouse device by its filesystem path.
 
     This is mutually exclusive with open() - use this when you know the
     exact device path, use open() for automatic device discovery.
 
+    The path may be a symlink such as a persistent udev alias. It is
+    resolved once and looked up in an index of the enumerated device paths;
+    only if that misses are enumerated paths stat()ed to match the device
+    number of the requested node.
+
     Args:
         path: Filesystem path to the HID device (e.g., "/dev/hidraw0")
         callback: Called on every state change
@@ -175,6 +302,10 @@ def open_by_path(
                          compatibility. Use AxisConvention.HID_Z_UP for a
                          right-handed Z-up frame. Mutually exclusive with
                          device_spec.
+        backend: HID transport. "hidapi" (default) uses hidapi through
+                 easyhid. "hidraw" (Linux only) reads the /dev/hidraw* node
+                 directly into a reusable buffer, skips HID enumeration and
+                 makes device.fileno() available for poll/epoll.
 
     Returns:
         SpaceMouseDevice instance (use as context manager for auto-cleanup)
@@ -182,25 +313,29 @@ def open_by_path(
     Raises:
         FileNotFoundError: If the specified path does not exist
         ValueError: If the device at path is not a supported SpaceMouse
-                    (unless device_spec is provided)
+                    (unless device_spec is provided), or backend is unknown
     """
-    path = Path(path)
+    if backend not in ("hidapi", "hidraw"):
+        raise ValueError(f"Unknown backend: '{backend}'. Available: ['hidapi', 'hidraw']")
 
-    if not path.exists():
-        raise FileNotFoundError(f"Device path '{path}' does not exist.")
+    try:
+        st = os.stat(path)
+    except OSError:
+        raise FileNotFoundError(f"Device path '{path}' does not exist.") from None
 
-    # Resolve path in case it's relative or a symlink
-    path = path.resolve()
+    # Resolve relative paths and symlinks such as udev aliases
+    path = Path(os.path.realpath(path))
 
     # Find the HID device at this path
-    hid = Enumeration()
     hid_device = None
 
-    for dev in hid.device_list:
-        dev_path = Path(dev.path).resolve()
-        if dev_path == path:
-            hid_device = dev
-            break
+    if backend == "hidraw":
+        hid_device = HidrawDevice(str(path))
+    else:
+        rdev = st.st_rdev if stat.S_ISCHR(st.st_mode) else 0
+        hid_device = _enumeration_cache.index().lookup(str(path), rdev)
+        if hid_device is not None:
+            hid_device = _new_handle(hid_device)
 
     if hid_device is None:
         raise FileNotFoundError(f"No HID device found at path '{path}'.")
@@ -210,16 +345,7 @@ def open_by_path(
     if is_custom_spec:
         spec = device_spec
     else:
-        all_specs = get_device_specs()
-        spec = None
-
-        for device_s in all_specs.values():
-            if (
-                hid_device.vendor_id == device_s.vendor_id
-                and hid_device.product_id == device_s.product_id
-            ):
-                spec = device_s
-                break
+        spec = get_device_index().get((hid_device.vendor_id, hid_device.product_id))
 
         if spec is None:
             raise ValueError(
@@ -293,27 +419,25 @@ def open(
     """
     device_specs = get_device_specs()
 
+    if device is not None and device not in device_specs:
+        raise ValueError(f"Unknown device: '{device}'. Available: {list(device_specs.keys())}")
+
+    # A single enumeration serves both auto-detection and the device lookup
+    enumeration = _enumeration_cache.index()
+
     # Auto-detect device if not specified
     if device is None:
-        connected = get_connected_devices()
+        connected = _find_supported_devices(enumeration.devices)
         if not connected:
             raise RuntimeError("No connected or supported devices found.")
-        device = connected[0]
-
-    if device not in device_specs:
-        raise ValueError(f"Unknown device: '{device}'. Available: {list(device_specs.keys())}")
+        device = connected[0][1].name
 
     # Use provided spec exactly as-is, or get from TOML and apply convention.
     is_custom_spec = device_spec is not None
     spec = device_spec if is_custom_spec else device_specs[device]
 
     # Find matching HID devices
-    hid = Enumeration()
-    found = []
-
-    for hid_dev in hid.find():
-        if hid_dev.vendor_id == spec.vendor_id and hid_dev.product_id == spec.product_id:
-            found.append(hid_dev)
+    found = enumeration.find(spec.hid_id)
 
     if not found:
         raise RuntimeError(f"Device '{device}' not found.")
@@ -327,7 +451,7 @@ def open(
 
     return _create_and_open_device(
         spec=spec,
-        hid_device=hid_dev,
+        hid_device=_new_handle(hid_dev),
         callback=callback,
         dof_callback=dof_callback,
         dof_callbacks=dof_callbacks,
@@ -339,6 +463,69 @@ def open(
     )
 
 
+def open_all(
+    callback: Optional[Callable[[SpaceMouseState], None]] = None,
+    dof_callback: Optional[Callable[[SpaceMouseState], None]] = None,
+    dof_callbacks: Optional[Sequence[DofCallback]] = None,
+    button_callback: Optional[Callable[[SpaceMouseState, List[int]], None]] = None,
+    button_callbacks: Optional[Sequence[ButtonCallback]] = None,
+    nonblocking: bool = True,
+    axis_convention: Optional[AxisConvention] = None,
+) -> List[SpaceMouseDevice]:
+    """Open every supported SpaceMouse device that is currently connected.
+
+    All devices are found from a single HID enumeration and configured with
+    the same callbacks and axis convention:
+
+        devices = pyspacemouse.open_all(axis_convention=AxisConvention.HID_Z_UP)
+        try:
+            for device in devices:
+                print(device.name, device.read())
+        finally:
+            for device in devices:
+                device.close()
+
+    Args:
+        callback: Called on every state change
+        dof_callback: Called on axis state changes
+        dof_callbacks: List of per-axis callbacks
+        button_callback: Called on button state changes
+        button_callbacks: List of per-button callbacks
+        nonblocking: If True, use non-blocking reads (required for callbacks)
+        axis_convention: Coordinate convention for axis values (see open()).
+
+    Returns:
+        List of opened SpaceMouseDevice instances, in enumeration order.
+        Empty list if no supported devices are connected.
+
+    Raises:
+        RuntimeError: If HID API is not installed or a device fails to open.
+                      Devices opened before the failure are closed again.
+    """
+    devices: List[SpaceMouseDevice] = []
+    try:
+        for hid_dev, spec in _find_supported_devices(_enumerate_hid_devices()):
+            print(f"{spec.name} found at {hid_dev.path}")
+            devices.append(
+                _create_and_open_device(
+                    spec=spec,
+                    hid_device=_new_handle(hid_dev),
+                    callback=callback,
+                    dof_callback=dof_callback,
+                    dof_callbacks=dof_callbacks,
+                    button_callback=button_callback,
+                    button_callbacks=button_callbacks,
+                    nonblocking=nonblocking,
+                    axis_convention=axis_convention,
+                )
+            )
+    except Exception:
+        for opened in devices:
+            opened.close()
+        raise
+    return devices
+
+
 def open_with_config(
     config: Config,
     nonblocking: bool = True,
@@ -380,21 +567,7 @@ def get_connected_devices_by_path() -> Dict[str, str]:
     Raises:
         RuntimeError: If HID API is not installed.
     """
-    try:
-        hid = Enumeration()
-    except AttributeError as e:
-        raise RuntimeError(
-            "HID API is probably not installed. See https://spacemouse.kubaandrysek.cz for details."
-        ) from e
-
-    device_specs = get_device_specs()
-    devices_by_path = {}
-
-    # hid.find() is all connected HID devices,
-    # device_specs is all supported Spacemouse devices.
-    for hid_device in hid.find():
-        for name, spec in device_specs.items():
-            if hid_device.vendor_id == spec.vendor_id and hid_device.product_id == spec.product_id:
-                devices_by_path[hid_device.path] = name
-
-    return devices_by_path
+    return {
+        hid_device.path: spec.name
+        for hid_device, spec in _find_supported_devices(_enumerate_hid_devices())
+    }
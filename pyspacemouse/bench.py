@@ -0,0 +1,283 @@
+"""Report rate and latency benchmark for PySpaceMouse.
+
+Used by ``pyspacemouse --bench``. Reads a device for a fixed duration and
+measures report rate, read() call latency, time from a report being
+received to the callback running, decode throughput and CPU usage of the
+read loop.
+
+run_thread_scaling() compares the decode throughput of one reader thread
+with that of several threads each reading its own device. With the GIL the
+threads take turns; free-threaded builds decode them in parallel.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import List
+
+from .device import SpaceMouseDevice, receive_clock_ns
+from .synthetic import encode_report
+from .types import AXIS_NAMES, DeviceInfo, SpaceMouseState
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return float(sorted_values[index])
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Benchmark summary. Durations are in microseconds.
+
+    Attributes:
+        device: Device name
+        synthetic: True if a synthetic stand-in device was used
+        duration: Measured wall-clock duration in seconds
+        reports: Reports received
+        report_rate: Reports per second
+        reads: read() calls made (including empty reads)
+        read_latency_mean: Mean duration of a read() call
+        read_latency_p99: 99th percentile duration of a read() call
+        callback_latency_mean: Mean time from report receive to callback
+        callback_latency_p99: 99th percentile time from receive to callback
+        decode_throughput: Reports per second _process can decode (no callbacks)
+        cpu_percent: CPU time of this process as percentage of wall time
+    """
+
+    device: str
+    synthetic: bool
+    duration: float
+    reports: int
+    report_rate: float
+    reads: int
+    read_latency_mean: float
+    read_latency_p99: float
+    callback_latency_mean: float
+    callback_latency_p99: float
+    decode_throughput: float
+    cpu_percent: float
+
+    def as_dict(self) -> dict:
+        """Return the result as a JSON-serializable dict."""
+        return asdict(self)
+
+    def summary(self) -> str:
+        """Return a human-readable multi-line summary."""
+        source = "synthetic device" if self.synthetic else "hardware"
+        return "\n".join(
+            [
+                f"Benchmark: {self.device} ({source}), {self.duration:.1f} s",
+                f"  Reports:           {self.reports} ({self.report_rate:.1f} /s)",
+                f"  read() calls:      {self.reads}",
+                f"  read() latency:    mean {self.read_latency_mean:.1f} us, "
+                f"p99 {self.read_latency_p99:.1f} us",
+                f"  Report->callback:  mean {self.callback_latency_mean:.1f} us, "
+                f"p99 {self.callback_latency_p99:.1f} us",
+                f"  Decode throughput: {self.decode_throughput:,.0f} reports/s",
+                f"  CPU usage:         {self.cpu_percent:.1f} %",
+            ]
+        )
+
+
+@dataclass(frozen=True)
+class ThreadScalingResult:
+    """Decode throughput with one and with several reader threads.
+
+    Attributes:
+        threads: Reader threads in the parallel run (one device each)
+        single: Reports per second decoded by one reader thread
+        parallel: Reports per second decoded by all reader threads together
+        gil_enabled: Whether the interpreter ran with the GIL
+    """
+
+    threads: int
+    single: float
+    parallel: float
+    gil_enabled: bool
+
+    @property
+    def speedup(self) -> float:
+        """Parallel throughput relative to one thread."""
+        return self.parallel / self.single if self.single else 0.0
+
+    def as_dict(self) -> dict:
+        """Return the result as a JSON-serializable dict."""
+        return {**asdict(self), "speedup": self.speedup}
+
+    def summary(self) -> str:
+        """Return a human-readable multi-line summary."""
+        gil = "GIL enabled" if self.gil_enabled else "free-threaded"
+        return "\n".join(
+            [
+                f"Reader thread scaling ({gil})",
+                f"  1 thread:   {self.single:,.0f} reports/s",
+                f"  {self.threads} threads: {self.parallel:,.0f} reports/s ({self.speedup:.2f}x)",
+            ]
+        )
+
+
+def _channel_reports(info: DeviceInfo) -> List[bytes]:
+    """Return one representative report per channel of a device spec."""
+    channels = {spec.channel for spec in info.mappings.values()}
+    channels.update(spec.channel for spec in info.button_specs)
+    values = dict.fromkeys(AXIS_NAMES, 0.5)
+    buttons = [1] * len(info.button_specs)
+    return [bytes(encode_report(info, channel, values, buttons)) for channel in sorted(channels)]
+
+
+def _decode_throughput(device: SpaceMouseDevice, reports: List[bytes], seconds: float) -> float:
+    """Measure how many reports per second _process decodes with callbacks disabled."""
+    if not reports:
+        return 0.0
+    bench_device = SpaceMouseDevice(info=device.info)
+    bench_device.enable_stats(False)
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for report in reports:
+            bench_device._process(report)
+        count += len(reports)
+    return count / (time.perf_counter() - start)
+
+
+def run_benchmark(
+    device: SpaceMouseDevice,
+    duration: float = 5.0,
+    poll_interval: float = 0.0005,
+    synthetic: bool = False,
+) -> BenchResult:
+    """Benchmark a non-blocking device for the given duration.
+
+    The read loop polls the device and sleeps poll_interval seconds after
+    each empty read, like a typical application loop. Any callbacks
+    already configured on the device are replaced for the duration.
+
+    Args:
+        device: Open SpaceMouseDevice
+        duration: Seconds to read for
+        poll_interval: Sleep after an empty read, in seconds
+        synthetic: Mark the result as coming from a synthetic device
+
+    Returns:
+        BenchResult with the measured values.
+    """
+    callback_latencies: List[int] = []
+
+    def on_state(state: SpaceMouseState) -> None:
+        callback_latencies.append(receive_clock_ns() - state.t_ns)
+
+    device.configure(callback=on_state)
+    device.set_nonblocking(True)
+
+    read_latencies: List[int] = []
+    reads = 0
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    deadline = wall_start + duration
+    last_t_ns = device.read().t_ns
+    while time.perf_counter() < deadline:
+        start = receive_clock_ns()
+        state = device.read()
+        read_latencies.append(receive_clock_ns() - start)
+        reads += 1
+        if state.t_ns != last_t_ns:
+            last_t_ns = state.t_ns
+        else:
+            time.sleep(poll_interval)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    device.clear_callbacks()
+
+    # One representative report per channel for the decode benchmark
+    reports = _channel_reports(device.info)
+
+    read_latencies.sort()
+    callback_latencies.sort()
+    received = len(callback_latencies)
+    return BenchResult(
+        device=device.name,
+        synthetic=synthetic,
+        duration=wall,
+        reports=received,
+        report_rate=received / wall if wall else 0.0,
+        reads=reads,
+        read_latency_mean=sum(read_latencies) / len(read_latencies) / 1e3 if reads else 0.0,
+        read_latency_p99=_percentile(read_latencies, 0.99) / 1e3,
+        callback_latency_mean=sum(callback_latencies) / received / 1e3 if received else 0.0,
+        callback_latency_p99=_percentile(callback_latencies, 0.99) / 1e3,
+        decode_throughput=_decode_throughput(device, reports, min(1.0, duration / 5)),
+        cpu_percent=100.0 * cpu / wall if wall else 0.0,
+    )
+
+
+def _threaded_throughput(
+    info: DeviceInfo, reports: List[bytes], threads: int, seconds: float
+) -> float:
+    """Decode reports in parallel threads, one device each; return total reports/s."""
+    devices = []
+    for _ in range(threads):
+        device = SpaceMouseDevice(info=info)
+        device.add_listener(lambda state: None)
+        devices.append(device)
+    counts = [0] * threads
+    barrier = threading.Barrier(threads + 1)
+    deadline = [0.0]
+
+    def reader(index: int) -> None:
+        process = devices[index]._process
+        count = 0
+        barrier.wait()
+        while time.perf_counter() < deadline[0]:
+            for report in reports:
+                process(report)
+            count += len(reports)
+        counts[index] = count
+
+    workers = [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    start = time.perf_counter()
+    deadline[0] = start + seconds
+    barrier.wait()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def run_thread_scaling(
+    info: DeviceInfo, threads: int = 4, duration: float = 1.0
+) -> ThreadScalingResult:
+    """Compare the decode throughput of 1 and of several reader threads.
+
+    Each thread decodes reports into its own SpaceMouseDevice (with a
+    listener attached), as when several devices are read from separate
+    threads. The read path takes no locks, so on free-threaded builds the
+    throughput grows with the number of threads.
+
+    Args:
+        info: Device spec to decode reports for
+        threads: Reader threads in the parallel run
+        duration: Seconds per run
+
+    Returns:
+        ThreadScalingResult with both throughputs.
+
+    Raises:
+        ValueError: If threads is less than 1.
+    """
+    if threads < 1:
+        raise ValueError("threads must be >= 1")
+    reports = _channel_reports(info)
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return ThreadScalingResult(
+        threads=threads,
+        single=_threaded_throughput(info, reports, 1, duration),
+        parallel=_threaded_throughput(info, reports, threads, duration),
+        gil_enabled=is_gil_enabled() if is_gil_enabled is not None else True,
+    )
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Union
 
 if TYPE_CHECKING:
+    from .gestures import GestureEvent
     from .types import SpaceMouseState
 
 # Type aliases for callback signatures
@@ -17,6 +18,7 @@ StateCallback = Callable[["SpaceMouseState"], None]
 ButtonChangeCallback = Callable[["SpaceMouseState", List[int]], None]
 ButtonPressCallback = Callable[["SpaceMouseState", List[int], Union[int, List[int]]], None]
 DofValueCallback = Callable[["SpaceMouseState", float], None]
+GestureEventCallback = Callable[["SpaceMouseState", "GestureEvent"], None]
 
 
 @dataclass(slots=True)
@@ -71,6 +73,36 @@ class DofCallback:
             raise TypeError("callback_minus must be callable or None")
 
 
+@dataclass(slots=True)
+class GestureCallback:
+    """Callback triggered when a gesture is recognized (see GestureRecognizer).
+
+    Attributes:
+        gesture: Gesture kind to watch ('flick', 'hold' or 'twist')
+        callback: Function called with (state, event)
+        axis: Only trigger for this axis (None for any axis)
+        direction: Only trigger for this direction, 1 or -1 (None for both)
+    """
+
+    gesture: str
+    callback: GestureEventCallback
+    axis: Optional[str] = None
+    direction: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        """Validate the callback configuration."""
+        valid_gestures = ("flick", "hold", "twist")
+        if self.gesture not in valid_gestures:
+            raise ValueError(f"gesture must be one of {valid_gestures}, got '{self.gesture}'")
+        valid_axes = ("x", "y", "z", "roll", "pitch", "yaw")
+        if self.axis is not None and self.axis not in valid_axes:
+            raise ValueError(f"axis must be one of {valid_axes} or None, got '{self.axis}'")
+        if self.direction not in (None, 1, -1):
+            raise ValueError(f"direction must be 1, -1 or None, got {self.direction!r}")
+        if not callable(self.callback):
+            raise TypeError("callback must be callable")
+
+
 @dataclass(slots=True)
 class Config:
     """Configuration container for all callback types.
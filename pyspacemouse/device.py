@@ -8,24 +8,260 @@ Supports context manager protocol for safe resource cleanup:
     with pyspacemouse.open() as device:
         while True:
             state = device.read()
+
+Threading: each device is meant to be read by one thread at a time, which
+owns its decode state (the SpaceMouseState returned by read(), the report
+clocks, statistics and DoF callback throttling). Other threads can call
+snapshot(), sample_at(), configure(), reload_spec() and the listener
+methods at any time. Callback and listener tables, and the decode layout,
+are replaced with a single assignment, and every decoded report publishes
+an immutable snapshot, so
+no lock is taken on the read path. This also holds on free-threaded
+(no-GIL) builds, where devices read from separate threads decode in
+parallel.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import io
+import logging
+import os
+import threading
+import time
 import timeit
-from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
 
-from easyhid import HIDException
+from easyhid import Enumeration, HIDException
 
 from .callbacks import ButtonCallback, Config, DofCallback
-from .types import AXIS_NAMES, ButtonState, DeviceInfo, SpaceMouseState
+from .config_helpers import apply_axis_convention
+from .hidraw import HidrawDevice
+from .loader import get_device_index, get_device_specs, load_device_specs
+from .prediction import AxisPredictor
+from .profiling import CallbackProfile, CallbackProfiler, callback_name
+from .realtime import RealtimeOptions, realtime_scope
+from .stats import DeviceStats, RunStats, StatsCollector
+from .timing import ReportClock
+from .types import AXIS_NAMES, AxisConvention, ButtonState, DeviceInfo, SpaceMouseState
 
 if TYPE_CHECKING:
     from easyhid import Device as HIDDevice
 
+logger = logging.getLogger("pyspacemouse")
+
 # High-accuracy clock for timing
 high_acc_clock = timeit.default_timer
 
+# Integer nanosecond clock for report receive timestamps (same clock as above)
+receive_clock_ns = time.perf_counter_ns
+
+
+# Connection event callbacks receive the device that lost or regained its connection
+ConnectionCallback = Callable[["SpaceMouseDevice"], None]
+
+
+class _ReconnectPolicy:
+    """Settings and backoff state for automatic reconnection."""
+
+    __slots__ = (
+        "on_disconnect",
+        "on_reconnect",
+        "initial_delay",
+        "max_delay",
+        "delay",
+        "next_attempt",
+        "lost",
+        "lost_handle",
+        "search",
+        "found",
+    )
+
+    def __init__(
+        self,
+        on_disconnect: Optional[ConnectionCallback],
+        on_reconnect: Optional[ConnectionCallback],
+        initial_delay: float,
+        max_delay: float,
+    ) -> None:
+        self.on_disconnect = on_disconnect
+        self.on_reconnect = on_reconnect
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.delay = initial_delay
+        self.next_attempt = 0.0
+        self.lost = False
+        self.lost_handle: Optional[HIDDevice] = None
+        # Helper thread looking for the device, and the handle it found
+        self.search: Optional[threading.Thread] = None
+        self.found: Optional[HIDDevice] = None
+
+
+class _DecodeLayout:
+    """Everything needed to read and decode reports for one DeviceInfo.
+
+    Bundles the spec, decode tables indexed by report ID, the ButtonState
+    sized for the spec and, for transports with readinto(), the report
+    buffer. SpaceMouseDevice swaps the whole layout in one attribute
+    assignment, so a report is always read and decoded with either the old
+    or the new spec, even when reload_spec() runs in another thread.
+    """
+
+    __slots__ = (
+        "info",
+        "axes",
+        "buttons",
+        "axis_scale",
+        "button_state",
+        "read_buffer",
+        "read_view",
+    )
+
+    def __init__(self, info: DeviceInfo, button_state: ButtonState, buffered: bool = False) -> None:
+        self.info = info
+        # report ID -> ((axis_name, byte1, byte2, scale), ...)
+        self.axes: Dict[int, tuple] = {}
+        for axis_name, spec in info.mappings.items():
+            entry = (axis_name, spec.byte1, spec.byte2, spec.scale)
+            self.axes[spec.channel] = self.axes.get(spec.channel, ()) + (entry,)
+        # report ID -> ((button_index, byte, mask), ...)
+        self.buttons: Dict[int, tuple] = {}
+        for btn_idx, spec in enumerate(info.button_specs):
+            if spec.channel is None:
+                continue
+            entry = (btn_idx, spec.byte, 1 << spec.bit)
+            self.buttons[spec.channel] = self.buttons.get(spec.channel, ()) + (entry,)
+        self.axis_scale = info.axis_scale
+        # Button states decoded with this layout, one per button spec
+        self.button_state = button_state
+        # Reusable report buffer for transports supporting readinto()
+        self.read_buffer: Optional[bytearray] = None
+        self.read_view: Optional[memoryview] = None
+        if buffered:
+            self.read_buffer = bytearray(info.bytes_to_read)
+            self.read_view = memoryview(self.read_buffer)
+
+
+class _SpecWatch:
+    """File and mtime polled by read() for automatic spec reloads."""
+
+    __slots__ = ("path", "interval", "mtime", "next_check")
+
+    def __init__(self, path: str, interval: float) -> None:
+        self.path = path
+        self.interval = interval
+        self.mtime = os.stat(path).st_mtime_ns
+        self.next_check = time.monotonic() + interval
+
+
+class _CallbackTable:
+    """Immutable set of callbacks, replaced as a whole by configure()."""
+
+    __slots__ = (
+        "callback",
+        "dof_callback",
+        "dof_callbacks",
+        "button_callback",
+        "button_callbacks",
+        "raw",
+        "wrappers",
+    )
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[SpaceMouseState], None]] = None,
+        dof_callback: Optional[Callable[[SpaceMouseState], None]] = None,
+        dof_callbacks: Optional[Sequence[DofCallback]] = None,
+        button_callback: Optional[Callable[[SpaceMouseState, List[int]], None]] = None,
+        button_callbacks: Optional[Sequence[ButtonCallback]] = None,
+        raw: tuple = (None, None, None, None, None),
+        wrappers: tuple = (),
+    ) -> None:
+        self.callback = callback
+        self.dof_callback = dof_callback
+        self.dof_callbacks = tuple(dof_callbacks) if dof_callbacks else ()
+        self.button_callback = button_callback
+        self.button_callbacks = tuple(button_callbacks) if button_callbacks else ()
+        # Callbacks as passed to configure(), before profiling wrappers
+        self.raw = raw
+        self.wrappers = wrappers
+
+
+HANDLER_EVENTS = ("state", "dof", "axis", "button")
+
+
+class CallbackHandle:
+    """Registration returned by SpaceMouseDevice.on().
+
+    Attributes:
+        event: Event the handler is registered for
+        fn: The registered handler
+    """
+
+    __slots__ = ("_device", "event", "fn", "options", "last_call")
+
+    def __init__(self, device: SpaceMouseDevice, event: str, fn: Callable, options) -> None:
+        self._device: Optional[SpaceMouseDevice] = device
+        self.event = event
+        self.fn = fn
+        # Event-specific filters (DofCallback for "axis", button tuple for "button")
+        self.options = options
+        # Time of the last "axis" call, for sleep (owned by the reading thread)
+        self.last_call = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Whether the handler is still registered."""
+        return self._device is not None
+
+    def remove(self) -> None:
+        """Unregister the handler. Calling it again has no effect."""
+        device = self._device
+        if device is not None:
+            self._device = None
+            device._remove_handle(self)
+
+    def __repr__(self) -> str:
+        state = "active" if self._device is not None else "removed"
+        name = getattr(self.fn, "__qualname__", None) or repr(self.fn)
+        return f"<CallbackHandle {self.event!r} {name} ({state})>"
+
+
+class _HandlerTable:
+    """Immutable snapshot of the handlers registered with on(), per event.
+
+    Registering or removing a handler replaces the table with a copy that
+    differs in one entry; the reading thread only ever sees whole tables.
+    """
+
+    __slots__ = ("state", "dof", "axis", "button")
+
+    def __init__(self, state=(), dof=(), axis=(), button=()) -> None:
+        self.state: Tuple[Callable, ...] = state
+        self.dof: Tuple[Callable, ...] = dof
+        # (handle, DofCallback with the handler functions to call)
+        self.axis: Tuple[Tuple[CallbackHandle, DofCallback], ...] = axis
+        # (handler, button indices or None)
+        self.button: Tuple[Tuple[Callable, Optional[Tuple[int, ...]]], ...] = button
+
+    def with_entry(self, event: str, entry) -> _HandlerTable:
+        """Return a copy with entry appended to the handlers of event."""
+        table = _HandlerTable(self.state, self.dof, self.axis, self.button)
+        setattr(table, event, getattr(self, event) + (entry,))
+        return table
+
+    def without_entry(self, event: str, index: int) -> _HandlerTable:
+        """Return a copy without the handler of event at index."""
+        table = _HandlerTable(self.state, self.dof, self.axis, self.button)
+        entries = getattr(self, event)
+        setattr(table, event, entries[:index] + entries[index + 1 :])
+        if not (table.state or table.dof or table.axis or table.button):
+            return _NO_HANDLERS
+        return table
+
+
+_NO_HANDLERS = _HandlerTable()
+
 
 def _to_int16(y1: int, y2: int) -> int:
     """Convert two 8-bit bytes to a signed 16-bit integer."""
@@ -52,45 +288,85 @@ class SpaceMouseDevice:
     """
 
     __slots__ = (
-        "_info",
+        "_layout",
+        "_axis_convention",
+        "_spec_watch",
         "_device",
         "_state",
+        "_published",
+        "_report_id",
         "_last_axis_time",
-        "_callback",
-        "_dof_callback",
-        "_dof_callbacks",
-        "_button_callback",
-        "_button_callbacks",
+        "_report_clocks",
+        "_stats",
+        "_callbacks",
+        "_handles",
+        "_handler_table",
+        "_lock",
+        "_listeners",
+        "_raw_listeners",
+        "_spec_listeners",
+        "_predictor",
+        "_profiler",
         "_nonblocking",
+        "_reconnect",
+        "_path",
+        "_raw_serial",
         "_product_name",
         "_vendor_name",
         "_version_number",
         "_serial_number",
     )
 
-    def __init__(self, info: DeviceInfo, device: Optional[HIDDevice] = None) -> None:
+    def __init__(
+        self,
+        info: DeviceInfo,
+        device: Optional[HIDDevice] = None,
+        axis_convention: Optional[AxisConvention] = None,
+    ) -> None:
         """Initialize the SpaceMouseDevice.
 
         Args:
             info: Device specification from loader
             device: Optional HID device instance
+            axis_convention: Convention already applied to info, re-applied
+                             when the spec is reloaded from TOML (None for
+                             custom specs)
         """
-        self._info = info
+        self._layout = _DecodeLayout(info, ButtonState([0] * len(info.button_specs)))
+        self._axis_convention = axis_convention
+        self._spec_watch: Optional[_SpecWatch] = None
         self._device = device
 
         # Initialize state
-        self._state = SpaceMouseState(buttons=ButtonState([0] * len(info.button_specs)))
+        self._state = SpaceMouseState(buttons=self._layout.button_state)
+        self._publish()
+        self._report_id = 0
         self._last_axis_time = {axis: 0.0 for axis in AXIS_NAMES}
-
-        # Callbacks (None by default)
-        self._callback: Optional[Callable[[SpaceMouseState], None]] = None
-        self._dof_callback: Optional[Callable[[SpaceMouseState], None]] = None
-        self._dof_callbacks: Optional[Sequence[DofCallback]] = None
-        self._button_callback: Optional[Callable[[SpaceMouseState, List[int]], None]] = None
-        self._button_callbacks: Optional[Sequence[ButtonCallback]] = None
+        self._report_clocks: Dict[int, ReportClock] = {}
+        self._stats: Optional[StatsCollector] = StatsCollector(self._report_clocks)
+
+        # Callbacks (none by default) and listeners, replaced as a whole
+        self._callbacks = _CallbackTable()
+        # Handlers registered with on(): per event, the handles in insertion
+        # order with their (dispatch table entry, profiling wrappers), and the
+        # dispatch table holding the entries in the same order
+        self._handles: Dict[str, Dict[CallbackHandle, Tuple[object, tuple]]] = {
+            e: {} for e in HANDLER_EVENTS
+        }
+        self._handler_table: _HandlerTable = _NO_HANDLERS
+        # Serializes writers of the callback and listener tables; readers never lock
+        self._lock = threading.Lock()
+        self._listeners: Tuple[Callable[[SpaceMouseState], None], ...] = ()
+        self._raw_listeners: Tuple[Callable[[bytes | memoryview, int], None], ...] = ()
+        self._spec_listeners: Tuple[Callable[[DeviceInfo], None], ...] = ()
+        self._profiler: Optional[CallbackProfiler] = None
+        self._predictor: Optional[AxisPredictor] = None
         self._nonblocking = True
+        self._reconnect: Optional[_ReconnectPolicy] = None
 
         # Connection details (populated on open)
+        self._path: str = ""
+        self._raw_serial: str = ""
         self._product_name: str = ""
         self._vendor_name: str = ""
         self._version_number: str = ""
@@ -115,12 +391,12 @@ class SpaceMouseDevice:
     @property
     def info(self) -> DeviceInfo:
         """Get the static device information."""
-        return self._info
+        return self._layout.info
 
     @property
     def name(self) -> str:
         """Get the device name."""
-        return self._info.name
+        return self._layout.info.name
 
     @property
     def connected(self) -> bool:
@@ -132,6 +408,33 @@ class SpaceMouseDevice:
         """Get the current device state (triggers a read)."""
         return self.read()
 
+    @property
+    def report_id(self) -> int:
+        """Get the report ID of the last decoded report (0 before the first).
+
+        Listeners and callbacks can use it to tell which channel the current
+        report updated (e.g. translation or rotation).
+        """
+        return self._report_id
+
+    @property
+    def report_clocks(self) -> Dict[int, ReportClock]:
+        """Get the report timing model for each report ID seen so far.
+
+        Each ReportClock exposes the estimated report period and jitter.
+        """
+        return dict(self._report_clocks)
+
+    @property
+    def axis_convention(self) -> Optional[AxisConvention]:
+        """Axis convention applied to the spec (None for custom specs)."""
+        return self._axis_convention
+
+    @property
+    def path(self) -> str:
+        """Get the HID path of the device (empty until opened)."""
+        return self._path
+
     @property
     def product_name(self) -> str:
         """Get the product name from the connected device."""
@@ -176,20 +479,184 @@ class SpaceMouseDevice:
             raise RuntimeError("Failed to open device") from e
 
         # Copy product details
+        self._path = self._device.path or ""
         self._product_name = self._device.product_string or ""
         self._vendor_name = self._device.manufacturer_string or ""
         self._version_number = str(self._device.release_number or "")
 
         # Convert serial number to hex
         serial = self._device.serial_number or ""
+        self._raw_serial = serial
         self._serial_number = "".join(f"{ord(c):02X}" for c in serial)
 
+        # Transports with readinto() decode straight from a preallocated buffer
+        layout = self._layout
+        self._layout = _DecodeLayout(
+            layout.info, layout.button_state, buffered=hasattr(self._device, "readinto")
+        )
+
     def close(self) -> None:
         """Close the connection to the device."""
+        if self._reconnect is not None:
+            self._reconnect.lost = False
         if self._device is not None:
             self._device.close()
             self._device = None
 
+    def set_nonblocking(self, nonblocking: bool) -> None:
+        """Switch between blocking and non-blocking reads.
+
+        The setting is remembered and reapplied after an automatic reconnect.
+        """
+        self._nonblocking = nonblocking
+        if self._device is not None:
+            self._device.set_nonblocking(nonblocking)
+
+    def fileno(self) -> int:
+        """Return the OS file descriptor of the device for select/poll/epoll.
+
+        Raises:
+            io.UnsupportedOperation: If the transport has no file descriptor
+                                     (only the hidraw backend provides one).
+        """
+        if self._device is None or not hasattr(self._device, "fileno"):
+            raise io.UnsupportedOperation("fileno() requires an open hidraw device")
+        return self._device.fileno()
+
+    # -------------------------------------------------------------------------
+    # Automatic reconnection
+    # -------------------------------------------------------------------------
+
+    def enable_reconnect(
+        self,
+        on_disconnect: Optional[ConnectionCallback] = None,
+        on_reconnect: Optional[ConnectionCallback] = None,
+        initial_delay: float = 0.25,
+        max_delay: float = 8.0,
+    ) -> None:
+        """Recover automatically when the device drops (e.g. wireless link loss).
+
+        When a read fails, the device is marked disconnected, all axes and
+        buttons are reset to zero and on_disconnect is called. Subsequent
+        read() calls return the zeroed state. Once the backoff delay has
+        passed, a helper thread looks for the same device (by serial number,
+        falling back to its path), and the next read() after it found one
+        reopens it. The delay doubles after every failed attempt up to
+        max_delay. read() never sleeps or enumerates HID devices, so other
+        devices read in the same loop are not held up.
+
+        Callbacks, device spec (including the axis convention) and the
+        blocking mode are kept across reconnects.
+
+        Args:
+            on_disconnect: Called with this device when the connection is lost
+            on_reconnect: Called with this device after it has been reopened
+            initial_delay: Seconds to wait before the first reconnect attempt
+            max_delay: Upper bound for the backoff delay in seconds
+        """
+        self._reconnect = _ReconnectPolicy(on_disconnect, on_reconnect, initial_delay, max_delay)
+
+    def disable_reconnect(self) -> None:
+        """Turn off automatic reconnection; read errors propagate again."""
+        self._reconnect = None
+
+    def _connection_lost(self) -> None:
+        """Drop the failed HID handle and reset the state to rest."""
+        policy = self._reconnect
+        lost_handle = self._device
+        try:
+            lost_handle.close()
+        except Exception:
+            pass  # Handle is already unusable
+        self._device = None
+        self._reset_to_rest()
+
+        policy.lost = True
+        policy.lost_handle = lost_handle
+        policy.delay = policy.initial_delay
+        policy.next_attempt = time.monotonic() + policy.delay
+        if policy.on_disconnect is not None:
+            policy.on_disconnect(self)
+
+    def _reset_to_rest(self) -> None:
+        """Return the state to rest, stamped with the time the device was lost."""
+        state = self._state
+        for axis_name in AXIS_NAMES:
+            setattr(state, axis_name, 0.0)
+        for btn_idx in range(len(state.buttons)):
+            state.buttons[btn_idx] = 0
+        state.t_ns = receive_clock_ns()
+        state.t = state.t_smoothed = state.t_ns * 1e-9
+        # Do not extrapolate the motion from before the loss
+        if self._predictor is not None:
+            self._predictor.reset()
+        self._publish()
+
+        # The downtime is neither jitter nor dropped reports
+        for clock in self._report_clocks.values():
+            clock.resync()
+
+    def _try_reconnect(self) -> None:
+        """Advance reconnection without blocking: start a search or open its result."""
+        policy = self._reconnect
+        search = policy.search
+        if search is None:
+            if time.monotonic() >= policy.next_attempt:
+                policy.found = None
+                policy.search = threading.Thread(
+                    target=self._search,
+                    args=(policy, self.info.vendor_id, self.info.product_id),
+                    name=f"pyspacemouse-reconnect-{self.name}",
+                    daemon=True,
+                )
+                policy.search.start()
+            return
+        if search.is_alive():
+            return
+
+        policy.search = None
+        hid_device, policy.found = policy.found, None
+        if hid_device is not None:
+            self._device = hid_device
+            try:
+                self.open()
+                hid_device.set_nonblocking(self._nonblocking)
+            except (RuntimeError, HIDException, OSError):
+                self._device = None
+            else:
+                policy.lost = False
+                policy.delay = policy.initial_delay
+                if policy.on_reconnect is not None:
+                    policy.on_reconnect(self)
+                return
+
+        policy.delay = min(policy.delay * 2, policy.max_delay)
+        policy.next_attempt = time.monotonic() + policy.delay
+
+    def _search(self, policy: _ReconnectPolicy, vendor_id: int, product_id: int) -> None:
+        """Helper thread body: find this device again among the connected HID devices."""
+        lost_handle = policy.lost_handle
+        if isinstance(lost_handle, HidrawDevice):
+            # hidraw handles are path based and can simply be reopened
+            if os.path.exists(lost_handle.path):
+                policy.found = lost_handle
+            return
+
+        try:
+            candidates = Enumeration(vid=vendor_id, pid=product_id).device_list
+        except Exception:
+            return
+
+        if self._raw_serial:
+            for candidate in candidates:
+                if candidate.serial_number == self._raw_serial:
+                    policy.found = candidate
+                    return
+        for candidate in candidates:
+            if candidate.path == self._path:
+                policy.found = candidate
+                return
+
     # -------------------------------------------------------------------------
     # Reading and processing
     # -------------------------------------------------------------------------
@@ -199,60 +666,309 @@ class SpaceMouseDevice:
 
         Returns:
             The current state after processing any available data.
+
+        Raises:
+            HIDException: If reading fails and automatic reconnection is not
+                          enabled (see enable_reconnect()).
         """
-        if not self.connected:
+        if self._spec_watch is not None and time.monotonic() >= self._spec_watch.next_check:
+            self._check_spec_file()
+        if self._device is None:
+            if self._reconnect is not None and self._reconnect.lost:
+                self._try_reconnect()
             return self._state
 
-        data = self._device.read(self._info.bytes_to_read)
+        layout = self._layout
+        try:
+            view = layout.read_view
+            if view is not None:
+                count = self._device.readinto(layout.read_buffer)
+                if count:
+                    t_ns = receive_clock_ns()
+                    self._process(view if count == len(view) else view[:count], t_ns)
+                elif self._stats is not None:
+                    self._stats.empty_reads += 1
+                return self._state
+            data = self._device.read(layout.info.bytes_to_read)
+        except (HIDException, OSError):
+            if self._reconnect is None:
+                raise
+            self._connection_lost()
+            return self._state
         if data:
-            self._process(data)
+            self._process(data, receive_clock_ns())
+        elif self._stats is not None:
+            self._stats.empty_reads += 1
         return self._state
 
-    def _process(self, data: bytes) -> None:
-        """Process incoming HID data and update state."""
-        dof_changed = False
-        button_changed = False
+    def run(
+        self,
+        callback: Optional[Callable[[SpaceMouseState], None]] = None,
+        duration: Optional[float] = None,
+        stop: Optional[threading.Event] = None,
+        min_interval: float = 0.0005,
+        max_interval: float = 0.05,
+        backoff: float = 1.5,
+        realtime: Optional[RealtimeOptions] = None,
+    ) -> RunStats:
+        """Poll the device in the calling thread with adaptive sleeps.
+
+        Queued reports are read back to back. After an empty read the loop
+        sleeps min_interval while an axis is deflected or a button is held.
+        While the device is at rest (all axes zero, no buttons) each empty
+        read lengthens the sleep by the backoff factor, up to max_interval.
+        The first new report snaps back to fast polling. An idle device
+        thus costs about 1 / max_interval wakeups per second instead of a
+        busy loop.
+
+            device.run(lambda state: print(state.x), stop=stop_event)
+
+        Args:
+            callback: Called with the state after every report (in addition
+                      to the configured callbacks)
+            duration: Seconds to run (None: until stop is set)
+            stop: Event that ends the loop when set; it also wakes the loop
+                  from its sleep
+            min_interval: Sleep after an empty read while the device is in use
+            max_interval: Longest sleep while the device is at rest
+            backoff: Factor by which the sleep grows per empty read at rest
+            realtime: CPU affinity, scheduling policy, memory locking and GC
+                      settings for the loop (best effort, see
+                      RealtimeOptions); restored when the loop ends
+
+        Returns:
+            RunStats with CPU time, wakeups and report counts of the loop,
+            and the real-time settings that took effect.
+
+        Raises:
+            ValueError: If the intervals or the backoff factor are invalid.
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1.0:
+            raise ValueError("backoff must be >= 1")
+
+        with realtime_scope(realtime) as realtime_report:
+            stats = self._run(callback, duration, stop, min_interval, max_interval, backoff)
+        if realtime_report is not None:
+            stats = dataclasses.replace(stats, realtime=realtime_report)
+        return stats
+
+    def _run(
+        self,
+        callback: Optional[Callable[[SpaceMouseState], None]],
+        duration: Optional[float],
+        stop: Optional[threading.Event],
+        min_interval: float,
+        max_interval: float,
+        backoff: float,
+    ) -> RunStats:
+        handle = self.on("state", callback) if callback is not None else None
+        nonblocking = self._nonblocking
+        self.set_nonblocking(True)
+        clock = time.perf_counter
+        sleep = stop.wait if stop is not None else time.sleep
+        reads = reports = wakeups = 0
+        idle_time = 0.0
+        interval = min_interval
+        cpu_start = time.thread_time()
+        start = clock()
+        deadline = start + duration if duration is not None else float("inf")
+        last_t_ns = self._state.t_ns
+        try:
+            while stop is None or not stop.is_set():
+                state = self.read()
+                reads += 1
+                if state.t_ns != last_t_ns:
+                    last_t_ns = state.t_ns
+                    reports += 1
+                    interval = min_interval
+                    if clock() < deadline:
+                        continue  # Drain queued reports without sleeping
+                    break
+                at_rest = not (
+                    state.x
+                    or state.y
+                    or state.z
+                    or state.roll
+                    or state.pitch
+                    or state.yaw
+                    or any(state.buttons)
+                )
+                interval = min(interval * backoff, max_interval) if at_rest else min_interval
+                remaining = deadline - clock()
+                if remaining <= 0:
+                    break
+                wait = min(interval, remaining)
+                if interval > min_interval:
+                    idle_time += wait
+                wakeups += 1
+                sleep(wait)
+        finally:
+            if handle is not None:
+                handle.remove()
+            self.set_nonblocking(nonblocking)
+        return RunStats(
+            elapsed=clock() - start,
+            cpu_time=time.thread_time() - cpu_start,
+            reads=reads,
+            reports=reports,
+            wakeups=wakeups,
+            idle_time=idle_time,
+        )
+
+    def read_into(self, buffer, offset: int = 0, t: bool = False, buttons: bool = False) -> int:
+        """Read from the device and write the axis values into a buffer.
+
+        Equivalent to read().write_into(...): the values go straight into a
+        caller-provided float64/float32 buffer such as one row of a
+        preallocated NumPy array, without building intermediate lists.
+
+            log = numpy.empty((n_samples, 7))
+            for row in log:
+                device.read_into(row, t=True)
+
+        Args:
+            buffer: Writable, contiguous buffer with 'd' or 'f' elements
+            offset: Index of the first element to write
+            t: If True, write the timestamp before the axes
+            buttons: If True, write the button bitmask after the axes
+
+        Returns:
+            Number of elements written.
+        """
+        return self.read().write_into(buffer, offset, t, buttons)
+
+    def _process(self, data: bytes | memoryview, t_ns: Optional[int] = None) -> None:
+        """Process incoming HID data and update state.
+
+        Args:
+            data: Raw HID report, starting with the report ID
+            t_ns: Receive timestamp from receive_clock_ns(), taken right after
+                  the read returned. Defaults to now.
+        """
+        if t_ns is None:
+            t_ns = receive_clock_ns()
+        if self._raw_listeners:
+            for raw_listener in self._raw_listeners:
+                raw_listener(data, t_ns)
+        report_id = self._report_id = data[0]
+        layout = self._layout
+        state = self._state
 
         # Process axis data
-        for axis_name, spec in self._info.mappings.items():
-            if data[0] == spec.channel:
-                dof_changed = True
-                if spec.byte1 < len(data) and spec.byte2 < len(data):
-                    raw_value = _to_int16(data[spec.byte1], data[spec.byte2])
-                    scaled_value = spec.scale * raw_value / self._info.axis_scale
-                    setattr(self._state, axis_name, scaled_value)
-
-        # Process button data
-        for btn_idx, spec in enumerate(self._info.button_specs):
-            if spec.channel is None:
-                continue
-            if data[0] == spec.channel:
-                button_changed = True
-                mask = 1 << spec.bit
-                self._state.buttons[btn_idx] = 1 if (data[spec.byte] & mask) else 0
+        axes = layout.axes.get(report_id)
+        dof_changed = axes is not None
+        if dof_changed:
+            size = len(data)
+            axis_scale = layout.axis_scale
+            for axis_name, byte1, byte2, scale in axes:
+                if byte1 < size and byte2 < size:
+                    raw_value = _to_int16(data[byte1], data[byte2])
+                    setattr(state, axis_name, scale * raw_value / axis_scale)
+
+        # Process button data (into the ButtonState sized for this layout).
+        # After reload_spec() resized the buttons, this thread carries the
+        # pressed states over and installs the new ButtonState, so only the
+        # reading thread ever changes the state.
+        state_buttons = layout.button_state
+        resized = state.buttons is not state_buttons
+        if resized:
+            kept = min(len(state_buttons), len(state.buttons))
+            state_buttons[:kept] = state.buttons[:kept]
+            state.buttons = state_buttons
+        buttons = layout.buttons.get(report_id)
+        button_changed = buttons is not None
+        if button_changed:
+            for btn_idx, byte, mask in buttons:
+                state_buttons[btn_idx] = 1 if (data[byte] & mask) else 0
+
+        # Update timestamps: raw receive time and jitter-smoothed time
+        state.t_ns = t_ns
+        state.t = t_ns * 1e-9
+        clock = self._report_clocks.get(report_id)
+        if clock is None:
+            clock = self._report_clocks[report_id] = ReportClock()
+        state.t_smoothed = clock.update(t_ns) * 1e-9
+        if dof_changed and self._predictor is not None:
+            self._predictor.update(axes, state)
+        # Publish a consistent copy for other threads (see snapshot())
+        self._published = (
+            state.t,
+            state.x,
+            state.y,
+            state.z,
+            state.roll,
+            state.pitch,
+            state.yaw,
+            tuple(state_buttons) if button_changed or resized else self._published[7],
+            t_ns,
+            state.t_smoothed,
+        )
 
-        # Update timestamp
-        self._state.t = high_acc_clock()
+        stats = self._stats
+        if stats is not None:
+            if not (dof_changed or button_changed):
+                stats.on_unknown(report_id)
+            stats.countdown -= 1
+            if not stats.countdown:
+                decoded_ns = receive_clock_ns()
+                self._invoke_callbacks(dof_changed, button_changed)
+                stats.on_timing(decoded_ns - t_ns, receive_clock_ns() - decoded_ns)
+                return
 
         # Invoke callbacks
         self._invoke_callbacks(dof_changed, button_changed)
 
+    def _publish(self) -> None:
+        """Publish an immutable copy of the state for snapshot()."""
+        state = self._state
+        self._published = (
+            state.t,
+            state.x,
+            state.y,
+            state.z,
+            state.roll,
+            state.pitch,
+            state.yaw,
+            tuple(state.buttons),
+            state.t_ns,
+            state.t_smoothed,
+        )
+
+    def snapshot(self) -> SpaceMouseState:
+        """Return a copy of the state after the last decoded report.
+
+        Unlike the state returned by read(), which the reading thread keeps
+        updating in place, the copy is consistent (all fields come from the
+        same report) and safe to use from any thread. It does not read the
+        device.
+        """
+        t, x, y, z, roll, pitch, yaw, buttons, t_ns, t_smoothed = self._published
+        return SpaceMouseState(t, x, y, z, roll, pitch, yaw, ButtonState(buttons), t_ns, t_smoothed)
+
     def _invoke_callbacks(self, dof_changed: bool, button_changed: bool) -> None:
         """Invoke registered callbacks based on state changes."""
         state = self._state
+        # Read each table once so a concurrent configure() applies from the next report
+        callbacks = self._callbacks
+
+        # Listeners (loggers, recognizers) attached alongside the callbacks
+        for listener in self._listeners:
+            listener(state)
 
         # General callback
-        if self._callback:
-            self._callback(state)
+        if callbacks.callback:
+            callbacks.callback(state)
 
         # DoF callback
-        if self._dof_callback and dof_changed:
-            self._dof_callback(state)
+        if callbacks.dof_callback and dof_changed:
+            callbacks.dof_callback(state)
 
         # Per-axis DoF callbacks
-        if self._dof_callbacks and dof_changed:
+        if callbacks.dof_callbacks and dof_changed:
             now = high_acc_clock()
-            for dof_cb in self._dof_callbacks:
+            for dof_cb in callbacks.dof_callbacks:
                 axis_name = dof_cb.axis
                 if now >= self._last_axis_time[axis_name] + dof_cb.sleep:
                     axis_val = getattr(state, axis_name)
@@ -268,12 +984,12 @@ class SpaceMouseDevice:
                     self._last_axis_time[axis_name] = now
 
         # General button callback
-        if self._button_callback and button_changed:
-            self._button_callback(state, list(state.buttons))
+        if callbacks.button_callback and button_changed:
+            callbacks.button_callback(state, list(state.buttons))
 
         # Per-button callbacks
-        if self._button_callbacks and button_changed:
-            for btn_cb in self._button_callbacks:
+        if callbacks.button_callbacks and button_changed:
+            for btn_cb in callbacks.button_callbacks:
                 buttons = btn_cb.buttons
                 if isinstance(buttons, int):
                     buttons = [buttons]
@@ -281,6 +997,253 @@ class SpaceMouseDevice:
                 if all(state.buttons[b] for b in buttons):
                     btn_cb.callback(state, list(state.buttons), btn_cb.buttons)
 
+        # Handlers registered with on()
+        handlers = self._handler_table
+        if handlers is not _NO_HANDLERS:
+            self._dispatch_handlers(handlers, dof_changed, button_changed)
+
+    def _dispatch_handlers(
+        self, handlers: _HandlerTable, dof_changed: bool, button_changed: bool
+    ) -> None:
+        """Call the handlers registered with on()."""
+        state = self._state
+        for fn in handlers.state:
+            fn(state)
+        if dof_changed:
+            for fn in handlers.dof:
+                fn(state)
+            if handlers.axis:
+                now = high_acc_clock()
+                for handle, dof_cb in handlers.axis:
+                    if now >= handle.last_call + dof_cb.sleep:
+                        axis_val = getattr(state, dof_cb.axis)
+                        if dof_cb.callback_minus is not None:
+                            if axis_val > dof_cb.filter:
+                                dof_cb.callback(state, axis_val)
+                            elif axis_val < -dof_cb.filter:
+                                dof_cb.callback_minus(state, axis_val)
+                        elif abs(axis_val) > dof_cb.filter:
+                            dof_cb.callback(state, axis_val)
+                        handle.last_call = now
+        if button_changed and handlers.button:
+            buttons = state.buttons
+            for fn, indices in handlers.button:
+                if indices is None or all(buttons[b] for b in indices):
+                    fn(state, list(buttons))
+
+    def add_raw_listener(self, listener: Callable[[bytes | memoryview, int], None]) -> None:
+        """Call listener(data, t_ns) with every raw report before it is decoded.
+
+        data may be a view of a reused buffer; copy it if it must outlive
+        the call.
+        """
+        with self._lock:
+            self._raw_listeners = self._raw_listeners + (listener,)
+
+    def remove_raw_listener(self, listener: Callable[[bytes | memoryview, int], None]) -> None:
+        """Remove a listener added with add_raw_listener().
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        with self._lock:
+            if listener not in self._raw_listeners:
+                raise ValueError("Listener is not registered")
+            listeners = list(self._raw_listeners)
+            listeners.remove(listener)
+            self._raw_listeners = tuple(listeners)
+
+    # -------------------------------------------------------------------------
+    # Prediction
+    # -------------------------------------------------------------------------
+
+    def enable_prediction(
+        self, model: str = "linear", horizon: float = 0.05, clamp: Optional[float] = 1.0
+    ) -> None:
+        """Record a short per-axis history so sample_at() can predict values.
+
+        Args:
+            model: "linear" or "quadratic" extrapolation
+            horizon: Maximum extrapolation beyond the last report, in seconds
+            clamp: Absolute limit of predicted values (None to disable)
+        """
+        self._predictor = AxisPredictor(model, horizon, clamp)
+
+    def disable_prediction(self) -> None:
+        """Stop recording the prediction history."""
+        self._predictor = None
+
+    def sample_at(self, t: Optional[float] = None) -> SpaceMouseState:
+        """Return axis values interpolated or predicted for time t.
+
+        Lets a render loop query the device at its own frame time instead of
+        using the values of the last report. Times use the clock of
+        state.t (time.perf_counter()).
+
+        Args:
+            t: Time in seconds (default: now)
+
+        Returns:
+            A new SpaceMouseState with the predicted axes, t set to the
+            requested time and the current buttons.
+
+        Raises:
+            RuntimeError: If prediction is not enabled (see enable_prediction()).
+        """
+        predictor = self._predictor
+        if predictor is None:
+            raise RuntimeError("Prediction is not enabled. Call enable_prediction() first.")
+        if t is None:
+            t = high_acc_clock()
+        _, x, y, z, roll, pitch, yaw, buttons, _, _ = self._published
+        return SpaceMouseState(
+            t=t,
+            x=predictor.predict("x", t, x),
+            y=predictor.predict("y", t, y),
+            z=predictor.predict("z", t, z),
+            roll=predictor.predict("roll", t, roll),
+            pitch=predictor.predict("pitch", t, pitch),
+            yaw=predictor.predict("yaw", t, yaw),
+            buttons=ButtonState(buttons),
+            t_ns=int(t * 1e9),
+            t_smoothed=t,
+        )
+
+    # -------------------------------------------------------------------------
+    # Spec reloading
+    # -------------------------------------------------------------------------
+
+    def reload_spec(
+        self, spec: Optional[DeviceInfo] = None, toml_path: Optional[str] = None
+    ) -> DeviceInfo:
+        """Swap in a new device spec without closing the HID handle.
+
+        With spec given (e.g. from modify_device_info() or
+        apply_axis_convention()) it is used as-is. Otherwise the entry with
+        the current device name is reloaded from toml_path (default: the
+        bundled devices.toml, whose cached specs are refreshed) and the
+        device's axis convention is applied again.
+
+        The spec, decode tables, button states and read buffer are built
+        first and then swapped in with one assignment, so reports are never
+        read or decoded with a half-updated spec; reload_spec() may be
+        called from any thread. If the number of buttons changed, the
+        reading thread installs the resized buttons (keeping the pressed
+        states) when it decodes the next report. Axis values, callbacks,
+        listeners and statistics are kept. Afterwards every spec listener
+        (see add_spec_listener()) is called with the new spec, in the
+        calling thread.
+
+        Args:
+            spec: New spec to use as-is
+            toml_path: TOML file to reload the spec from when spec is None
+
+        Returns:
+            The spec now in use.
+
+        Raises:
+            ValueError: If the spec is for a different vendor/product ID, or
+                        the TOML file has no entry for this device.
+        """
+        current = self._layout
+        info = current.info
+        if spec is None:
+            if toml_path is None:
+                get_device_specs.cache_clear()
+                get_device_index.cache_clear()
+                specs = get_device_specs()
+            else:
+                specs = load_device_specs(toml_path)
+            spec = specs.get(info.name)
+            if spec is None:
+                raise ValueError(f"No spec named '{info.name}' in {toml_path or 'devices.toml'}")
+            if self._axis_convention is not None:
+                spec = apply_axis_convention(spec, self._axis_convention)
+
+        if spec.hid_id != info.hid_id:
+            raise ValueError(
+                f"Spec '{spec.name}' is for {spec.vendor_id:#06x}:{spec.product_id:#06x}, "
+                f"not {info.vendor_id:#06x}:{info.product_id:#06x}"
+            )
+
+        # Build the complete layout first (with new buttons if their number
+        # changed and a new read buffer) and swap it in with one assignment;
+        # the reading thread installs the buttons at the next report
+        buttons = current.button_state
+        if len(buttons) != len(spec.button_specs):
+            buttons = ButtonState([0] * len(spec.button_specs))
+        self._layout = _DecodeLayout(spec, buttons, buffered=current.read_buffer is not None)
+        for spec_listener in self._spec_listeners:
+            spec_listener(spec)
+        return spec
+
+    def watch_spec(self, toml_path: Optional[str] = None, interval: float = 1.0) -> None:
+        """Reload the spec from a TOML file whenever its mtime changes.
+
+        The file's modification time is checked from read(), at most once
+        per interval seconds. If the changed file cannot be parsed (e.g. it
+        is saved mid-edit) a warning is logged and the current spec is kept.
+
+        Args:
+            toml_path: TOML file to watch (default: the bundled devices.toml)
+            interval: Minimum seconds between mtime checks
+        """
+        path = toml_path or os.path.join(os.path.dirname(__file__), "devices.toml")
+        self._spec_watch = _SpecWatch(path, interval)
+
+    def unwatch_spec(self) -> None:
+        """Stop watching the spec file."""
+        self._spec_watch = None
+
+    def _check_spec_file(self) -> None:
+        watch = self._spec_watch
+        watch.next_check = time.monotonic() + watch.interval
+        try:
+            mtime = os.stat(watch.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == watch.mtime:
+            return
+        watch.mtime = mtime
+        default = watch.path == os.path.join(os.path.dirname(__file__), "devices.toml")
+        try:
+            self.reload_spec(toml_path=None if default else watch.path)
+        except Exception as e:
+            logger.warning("Keeping current spec for %s, reload failed: %s", self.name, e)
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> DeviceStats:
+        """Return a snapshot of this device's runtime statistics.
+
+        Covers report rates per report ID, unknown report IDs, empty reads,
+        decode and callback timings, and estimates of kernel backlog and
+        dropped reports. Collection is on by default and cheap enough to
+        leave enabled; see enable_stats().
+
+        Raises:
+            RuntimeError: If statistics collection is disabled.
+        """
+        if self._stats is None:
+            raise RuntimeError("Statistics are disabled; call enable_stats() first")
+        return self._stats.snapshot()
+
+    def enable_stats(self, enabled: bool = True, sample_interval: int = 16) -> None:
+        """Enable (and reset) or disable runtime statistics collection.
+
+        Args:
+            enabled: False removes all statistics work from the read path
+            sample_interval: Measure decode/callback time on every Nth report
+        """
+        self._stats = StatsCollector(self._report_clocks, sample_interval) if enabled else None
+
+    def reset_stats(self) -> None:
+        """Reset all statistics counters."""
+        if self._stats is not None:
+            self._stats.reset()
+
     def set_led(self, state: bool) -> None:
         """Set the LED state.
 
@@ -296,12 +1259,13 @@ class SpaceMouseDevice:
         """
         if not self.connected:
             return
-        if self._info.led_id is None:
+        led_id = self._layout.info.led_id
+        if led_id is None:
             return  # Device has no LED
 
         # Send HID output report to control LED
         # led_id format: [report_id, on_value]
-        report_id, on_value = self._info.led_id
+        report_id, on_value = led_id
         led_value = on_value if state else 0x00
         try:
             self._device.write(bytearray([report_id, led_value]))
@@ -314,11 +1278,13 @@ class SpaceMouseDevice:
 
     def set_config(self, config: Config) -> None:
         """Apply a configuration object to set callbacks."""
-        self._callback = config.callback
-        self._dof_callback = config.dof_callback
-        self._dof_callbacks = config.dof_callbacks
-        self._button_callback = config.button_callback
-        self._button_callbacks = config.button_callbacks
+        self._apply_callbacks(
+            config.callback,
+            config.dof_callback,
+            config.dof_callbacks,
+            config.button_callback,
+            config.button_callbacks,
+        )
 
     def configure(
         self,
@@ -329,20 +1295,298 @@ class SpaceMouseDevice:
         button_callbacks: Optional[Sequence[ButtonCallback]] = None,
     ) -> None:
         """Configure callbacks individually."""
-        self._callback = callback
-        self._dof_callback = dof_callback
-        self._dof_callbacks = dof_callbacks
-        self._button_callback = button_callback
-        self._button_callbacks = button_callbacks
+        self._apply_callbacks(
+            callback, dof_callback, dof_callbacks, button_callback, button_callbacks
+        )
 
     def clear_callbacks(self) -> None:
         """Remove all registered callbacks."""
-        self._callback = None
-        self._dof_callback = None
-        self._dof_callbacks = None
-        self._button_callback = None
-        self._button_callbacks = None
+        self._apply_callbacks(None, None, None, None, None)
+
+    def _apply_callbacks(
+        self,
+        callback: Optional[Callable[[SpaceMouseState], None]],
+        dof_callback: Optional[Callable[[SpaceMouseState], None]],
+        dof_callbacks: Optional[Sequence[DofCallback]],
+        button_callback: Optional[Callable[[SpaceMouseState, List[int]], None]],
+        button_callbacks: Optional[Sequence[ButtonCallback]],
+    ) -> None:
+        """Store callbacks, wrapped in timing wrappers if profiling is enabled."""
+        with self._lock:
+            self._callbacks = self._build_callbacks(
+                callback, dof_callback, dof_callbacks, button_callback, button_callbacks
+            )
+
+    def _build_callbacks(
+        self,
+        callback: Optional[Callable[[SpaceMouseState], None]],
+        dof_callback: Optional[Callable[[SpaceMouseState], None]],
+        dof_callbacks: Optional[Sequence[DofCallback]],
+        button_callback: Optional[Callable[[SpaceMouseState, List[int]], None]],
+        button_callbacks: Optional[Sequence[ButtonCallback]],
+    ) -> _CallbackTable:
+        raw = (callback, dof_callback, dof_callbacks, button_callback, button_callbacks)
+
+        profiler = self._profiler
+        wrappers = []
+        if profiler is not None:
+
+            def wrap(fn, slot):
+                wrapper = profiler.wrap(fn, callback_name(slot, fn))
+                wrappers.append(wrapper)
+                return wrapper
+
+            if callback:
+                callback = wrap(callback, "callback")
+            if dof_callback:
+                dof_callback = wrap(dof_callback, "dof_callback")
+            if dof_callbacks:
+                dof_callbacks = [
+                    DofCallback(
+                        axis=cb.axis,
+                        callback=wrap(cb.callback, f"dof_callbacks[{i}] ({cb.axis})"),
+                        sleep=cb.sleep,
+                        callback_minus=(
+                            wrap(cb.callback_minus, f"dof_callbacks[{i}] ({cb.axis}, minus)")
+                            if cb.callback_minus is not None
+                            else None
+                        ),
+                        filter=cb.filter,
+                    )
+                    for i, cb in enumerate(dof_callbacks)
+                ]
+            if button_callback:
+                button_callback = wrap(button_callback, "button_callback")
+            if button_callbacks:
+                button_callbacks = [
+                    ButtonCallback(
+                        buttons=cb.buttons,
+                        callback=wrap(cb.callback, f"button_callbacks[{i}] ({cb.buttons})"),
+                    )
+                    for i, cb in enumerate(button_callbacks)
+                ]
+            profiler.retain(wrappers + self._handler_wrappers())
+
+        return _CallbackTable(
+            callback,
+            dof_callback,
+            dof_callbacks,
+            button_callback,
+            button_callbacks,
+            raw,
+            tuple(wrappers),
+        )
+
+    def on(self, event: str, fn: Callable, **filters) -> CallbackHandle:
+        """Register a handler for one event and return its handle.
+
+        Unlike configure(), which replaces all callbacks at once, handlers
+        are added and removed individually (handle.remove()): the
+        registering thread swaps in a copy of the dispatch table that
+        differs in that one entry, so the reading thread never rebuilds it
+        or takes a lock. This is safe from inside a handler or callback and
+        from other threads: changes apply from the next report. Handlers are
+        independent of configure() and clear_callbacks().
+
+        Events and filters:
+            "state": fn(state) after every report
+            "dof": fn(state) after every axis report
+            "axis": fn(state, value) like DofCallback; filters axis
+                    (required), filter, sleep and callback_minus
+            "button": fn(state, buttons) after every button report; with
+                      buttons=index or [indices], only while all of them
+                      are pressed
+
+        Args:
+            event: One of HANDLER_EVENTS
+            fn: Handler to call
+            **filters: Event-specific filters (see above)
+
+        Returns:
+            CallbackHandle; call handle.remove() to unregister.
+
+        Raises:
+            ValueError: If the event is unknown or a filter value is invalid.
+            TypeError: If fn is not callable or a filter is not supported
+                       by the event.
+        """
+        if event not in HANDLER_EVENTS:
+            raise ValueError(f"Unknown event: '{event}'. Available: {list(HANDLER_EVENTS)}")
+        if not callable(fn):
+            raise TypeError("fn must be callable")
+        allowed = {
+            "state": (),
+            "dof": (),
+            "axis": ("axis", "filter", "sleep", "callback_minus"),
+            "button": ("buttons",),
+        }[event]
+        unknown = sorted(set(filters) - set(allowed))
+        if unknown:
+            raise TypeError(f"Event '{event}' does not support filter(s) {unknown}")
+
+        options = None
+        if event == "axis":
+            if "axis" not in filters:
+                raise ValueError("Event 'axis' requires an axis filter")
+            options = DofCallback(callback=fn, **filters)
+        elif event == "button" and filters.get("buttons") is not None:
+            buttons = filters["buttons"]
+            options = (buttons,) if isinstance(buttons, int) else tuple(buttons)
+            if not all(isinstance(b, int) for b in options):
+                raise TypeError("buttons must be int or list of int")
+
+        handle = CallbackHandle(self, event, fn, options)
+        with self._lock:
+            entry = self._handler_entry(handle)
+            self._handles[event][handle] = entry
+            self._handler_table = self._handler_table.with_entry(event, entry[0])
+        return handle
+
+    def _remove_handle(self, handle: CallbackHandle) -> None:
+        with self._lock:
+            handles = self._handles[handle.event]
+            if handle in handles:
+                index = list(handles).index(handle)
+                _, wrappers = handles.pop(handle)
+                self._handler_table = self._handler_table.without_entry(handle.event, index)
+                if wrappers and self._profiler is not None:
+                    self._profiler.retain(list(self._callbacks.wrappers) + self._handler_wrappers())
+
+    def _handler_entry(self, handle: CallbackHandle) -> Tuple[object, tuple]:
+        """Return the dispatch table entry of a handle and its profiling wrappers."""
+        profiler = self._profiler
+        wrappers = []
+
+        def wrap(fn):
+            if profiler is None:
+                return fn
+            wrapper = profiler.wrap(fn, callback_name(f"on('{handle.event}')", fn))
+            wrappers.append(wrapper)
+            return wrapper
+
+        if handle.event == "axis":
+            dof_cb = handle.options
+            if profiler is not None:
+                dof_cb = DofCallback(
+                    axis=dof_cb.axis,
+                    callback=wrap(dof_cb.callback),
+                    sleep=dof_cb.sleep,
+                    callback_minus=(
+                        wrap(dof_cb.callback_minus) if dof_cb.callback_minus is not None else None
+                    ),
+                    filter=dof_cb.filter,
+                )
+            entry = (handle, dof_cb)
+        elif handle.event == "button":
+            entry = (wrap(handle.fn), handle.options)
+        else:
+            entry = wrap(handle.fn)
+        return entry, tuple(wrappers)
+
+    def _handler_wrappers(self) -> list:
+        """Return the profiling wrappers of all handlers registered with on()."""
+        return [
+            wrapper
+            for handles in self._handles.values()
+            for _, wrappers in handles.values()
+            for wrapper in wrappers
+        ]
+
+    def _rebuild_handlers(self) -> None:
+        """Rebuild every handler entry after profiling was toggled (lock held)."""
+        entries = {}
+        for event, handles in self._handles.items():
+            for handle in handles:
+                handles[handle] = self._handler_entry(handle)
+            entries[event] = tuple(entry for entry, _ in handles.values())
+        self._handler_table = _HandlerTable(**entries) if any(entries.values()) else _NO_HANDLERS
+
+    def add_listener(self, listener: Callable[[SpaceMouseState], None]) -> None:
+        """Call listener(state) after every processed report.
+
+        Listeners are independent of the callbacks set with configure() or
+        set_config() and are not affected by clear_callbacks(). They are meant
+        for components that attach to a device, such as SessionLogger.
+        """
+        with self._lock:
+            self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener: Callable[[SpaceMouseState], None]) -> None:
+        """Remove a listener added with add_listener().
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                raise ValueError("Listener is not registered")
+            listeners = list(self._listeners)
+            listeners.remove(listener)
+            self._listeners = tuple(listeners)
+
+    def add_spec_listener(self, listener: Callable[[DeviceInfo], None]) -> None:
+        """Call listener(info) after reload_spec() swapped in a new spec.
+
+        Components that compile tables from the device spec (MappingEngine,
+        GestureRecognizer) use it to recompile them. The listener runs in
+        the thread that reloaded the spec, so it should build its new tables
+        first and swap them in with one assignment.
+        """
+        with self._lock:
+            self._spec_listeners = self._spec_listeners + (listener,)
+
+    def remove_spec_listener(self, listener: Callable[[DeviceInfo], None]) -> None:
+        """Remove a listener added with add_spec_listener().
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        with self._lock:
+            if listener not in self._spec_listeners:
+                raise ValueError("Listener is not registered")
+            listeners = list(self._spec_listeners)
+            listeners.remove(listener)
+            self._spec_listeners = tuple(listeners)
+
+    # -------------------------------------------------------------------------
+    # Callback profiling
+    # -------------------------------------------------------------------------
+
+    def enable_profiling(self, budget: float = 0.001, warn_interval: float = 1.0) -> None:
+        """Time every registered callback and warn about slow ones.
+
+        Each callback (callback, dof_callback, every DofCallback, button_callback
+        every ButtonCallback and every handler registered with on()) gets call
+        counts and a latency histogram.
+        A warning is logged on the "pyspacemouse" logger when a call exceeds
+        the budget, at most once per warn_interval per callback. Callbacks
+        registered later are profiled as well.
+
+        When profiling is disabled (the default) callbacks are called
+        directly, without any profiling overhead.
+
+        Args:
+            budget: Time budget per callback call in seconds
+            warn_interval: Minimum seconds between warnings for one callback
+        """
+        with self._lock:
+            self._profiler = CallbackProfiler(budget, warn_interval)
+            self._callbacks = self._build_callbacks(*self._callbacks.raw)
+            self._rebuild_handlers()
+
+    def disable_profiling(self) -> None:
+        """Stop profiling and call the callbacks directly again."""
+        with self._lock:
+            self._profiler = None
+            self._callbacks = self._build_callbacks(*self._callbacks.raw)
+            self._rebuild_handlers()
+
+    def callback_profiles(self) -> List[CallbackProfile]:
+        """Return timing summaries of all callbacks (empty if profiling is off)."""
+        if self._profiler is None:
+            return []
+        return self._profiler.profiles()
 
     def get_button_name(self, index: int) -> str:
         """Get the name of a button by its index."""
-        return self._info.get_button_name(index)
+        return self._layout.info.get_button_name(index)
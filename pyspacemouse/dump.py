@@ -0,0 +1,93 @@
+"""Streaming of decoded states for ``pyspacemouse --dump``.
+
+StateDumper is registered as the device callback and writes every decoded
+state to a binary stream in one of three formats. Each record is produced
+with a single precompiled %-format or struct pack call, and output is
+block-buffered, so the dump keeps up with the device without per-field
+Python formatting.
+
+Formats:
+    ndjson: {"t": 12.345678, "x": 0.1234, ..., "buttons": 3}
+    csv:    header line, then t,x,...,buttons
+    binary: little-endian records of float64 t, one float32 per selected
+            axis, uint32 button bitmask
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO, Optional, Sequence
+
+from .types import AXIS_NAMES, SpaceMouseState
+
+DUMP_FORMATS = ("ndjson", "csv", "binary")
+
+
+class StateDumper:
+    """Callback that writes decoded states to a binary stream.
+
+    Attributes:
+        written: Number of records written
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        fmt: str = "ndjson",
+        axes: Sequence[str] = AXIS_NAMES,
+        rate: Optional[float] = None,
+    ) -> None:
+        """Initialize the dumper.
+
+        Args:
+            stream: Binary output stream (ideally block-buffered)
+            fmt: One of "ndjson", "csv" or "binary"
+            axes: Axes to include, in output order
+            rate: Maximum records per second (decimation); None writes every state
+
+        Raises:
+            ValueError: If the format or an axis name is unknown.
+        """
+        if fmt not in DUMP_FORMATS:
+            raise ValueError(f"Unknown format: '{fmt}'. Available: {list(DUMP_FORMATS)}")
+        for axis in axes:
+            if axis not in AXIS_NAMES:
+                raise ValueError(f"Unknown axis: '{axis}'. Available: {list(AXIS_NAMES)}")
+
+        self._stream = stream
+        self._axes = tuple(axes)
+        self._interval_ns = int(1e9 / rate) if rate else 0
+        self._next_ns = 0
+        self._fmt = fmt
+        self.written = 0
+
+        if fmt == "binary":
+            self._packer = struct.Struct(f"<d{len(self._axes)}fI")
+        else:
+            if fmt == "ndjson":
+                fields = [b'"t":%.6f'] + [b'"%s":%%.4f' % a.encode() for a in self._axes]
+                fields.append(b'"buttons":%d')
+                self._template = b"{" + b",".join(fields) + b"}\n"
+            else:
+                self._template = b",".join([b"%.6f"] + [b"%.4f"] * len(self._axes) + [b"%d\n"])
+
+    def write_header(self) -> None:
+        """Write the CSV header line (no-op for other formats)."""
+        if self._fmt == "csv":
+            self._stream.write(",".join(["t", *self._axes, "buttons"]).encode() + b"\n")
+
+    def __call__(self, state: SpaceMouseState) -> None:
+        """Write one state, unless it is dropped by rate decimation."""
+        if self._interval_ns:
+            if state.t_ns < self._next_ns:
+                return
+            self._next_ns += self._interval_ns
+            if self._next_ns <= state.t_ns:
+                self._next_ns = state.t_ns + self._interval_ns
+
+        values = (state.t, *[getattr(state, axis) for axis in self._axes], int(state.buttons))
+        if self._fmt == "binary":
+            self._stream.write(self._packer.pack(*values))
+        else:
+            self._stream.write(self._template % values)
+        self.written += 1
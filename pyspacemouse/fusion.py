@@ -0,0 +1,211 @@
+"""Time-aligned fusion of several SpaceMouse devices.
+
+Reading two devices in a loop and pairing "the latest of each" mixes
+samples that are up to a poll interval apart. DeviceFuser records every
+report of each device with its jitter-smoothed timestamp and builds frames
+in which all devices are interpolated (or held) to one common time:
+
+    left = pyspacemouse.open_by_path(path0, axis_convention=AxisConvention.HID_Z_UP)
+    right = pyspacemouse.open_by_path(path1, axis_convention=AxisConvention.HID_Z_UP)
+    fuser = DeviceFuser([left, right], delay=0.01)
+    while True:
+        fuser.poll()
+        frame = fuser.frame()
+        control(frame.states[0], frame.states[1], frame.skew)
+
+All devices share the host's time.perf_counter() clock, so their report
+timestamps are directly comparable.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Deque, List, Optional, Sequence, Tuple
+
+from .types import AXIS_NAMES, ButtonState, SpaceMouseState
+
+if TYPE_CHECKING:
+    from .device import SpaceMouseDevice
+
+FUSION_MODES = ("interpolate", "hold")
+
+# (t, x, y, z, roll, pitch, yaw, buttons)
+_Sample = Tuple[float, float, float, float, float, float, float, Tuple[int, ...]]
+
+
+@dataclass(frozen=True)
+class FusedFrame:
+    """States of all fused devices at one common time.
+
+    Attributes:
+        t: Common timestamp in seconds (time.perf_counter() clock)
+        states: One state per device, in the order given to DeviceFuser
+        ages: Per device, time since its newest report at or before t
+        skew: Largest difference between the devices' newest report times
+            at or before t
+    """
+
+    t: float
+    states: Tuple[SpaceMouseState, ...]
+    ages: Tuple[float, ...]
+    skew: float
+
+
+class DeviceFuser:
+    """Aligns the report streams of several devices onto a common timeline.
+
+    Attributes:
+        devices: Fused devices, in frame order
+        mode: "interpolate" (linear between reports) or "hold" (last report)
+        delay: Default frame time lag behind now, in seconds
+    """
+
+    def __init__(
+        self,
+        devices: Sequence[SpaceMouseDevice],
+        mode: str = "interpolate",
+        delay: float = 0.01,
+        history: int = 64,
+    ) -> None:
+        """Attach to the devices and start recording their reports.
+
+        Args:
+            devices: Devices to fuse (non-blocking, e.g. from open_by_path())
+            mode: "interpolate" or "hold"
+            delay: Default lag of frame() behind the current time. A delay of
+                   about one report period lets every device deliver the
+                   report after the frame time, so values can be
+                   interpolated instead of held.
+            history: Reports kept per device
+
+        Raises:
+            ValueError: If no devices are given or the mode is unknown.
+        """
+        if not devices:
+            raise ValueError("At least one device is required")
+        if mode not in FUSION_MODES:
+            raise ValueError(f"Unknown mode: '{mode}'. Available: {list(FUSION_MODES)}")
+        self.devices = list(devices)
+        self.mode = mode
+        self.delay = delay
+        # Per device: reports in time order, last t_ns seen by poll()
+        self._histories: List[Deque[_Sample]] = [deque(maxlen=history) for _ in self.devices]
+        self._last_t_ns = [-1] * len(self.devices)
+        self._listeners = []
+        for index, device in enumerate(self.devices):
+            listener = self._make_listener(index)
+            device.add_listener(listener)
+            self._listeners.append(listener)
+
+    def _make_listener(self, index: int):
+        samples = self._histories[index]
+
+        def listener(state: SpaceMouseState) -> None:
+            t = state.t_smoothed if state.t_smoothed >= 0 else state.t
+            sample = (
+                t,
+                state.x,
+                state.y,
+                state.z,
+                state.roll,
+                state.pitch,
+                state.yaw,
+                tuple(state.buttons),
+            )
+            if not samples or samples[-1][0] <= t:
+                samples.append(sample)
+                return
+            # Each report ID has its own smoothed clock, so a report can be
+            # stamped slightly before the previous one of another channel:
+            # insert it in time order
+            if len(samples) == samples.maxlen:
+                samples.popleft()
+            position = len(samples)
+            while position and samples[position - 1][0] > t:
+                position -= 1
+            samples.insert(position, sample)
+
+        return listener
+
+    def close(self) -> None:
+        """Detach from the devices (the devices stay open)."""
+        for device, listener in zip(self.devices, self._listeners):
+            device.remove_listener(listener)
+        self._listeners = []
+
+    def __enter__(self) -> DeviceFuser:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def poll(self, max_reports: int = 64) -> int:
+        """Read all queued reports of every device.
+
+        Args:
+            max_reports: Upper bound of reports read per device
+
+        Returns:
+            Number of reports read.
+        """
+        count = 0
+        for index, device in enumerate(self.devices):
+            last_t_ns = self._last_t_ns[index]
+            for _ in range(max_reports):
+                t_ns = device.read().t_ns
+                if t_ns == last_t_ns:
+                    break
+                last_t_ns = t_ns
+                count += 1
+            self._last_t_ns[index] = last_t_ns
+        return count
+
+    def frame(self, t: Optional[float] = None) -> FusedFrame:
+        """Build a frame with every device aligned to time t.
+
+        Args:
+            t: Common time in seconds (default: now - delay)
+
+        Returns:
+            FusedFrame with one state per device.
+        """
+        if t is None:
+            t = time.perf_counter() - self.delay
+        states = []
+        ages = []
+        newest = []
+        for samples in self._histories:
+            sample, buttons, sample_t = self._sample(samples, t)
+            state = SpaceMouseState(
+                t=t, buttons=ButtonState(buttons), t_ns=int(t * 1e9), t_smoothed=t
+            )
+            if sample is not None:
+                for axis, value in zip(AXIS_NAMES, sample):
+                    setattr(state, axis, value)
+                ages.append(t - sample_t)
+                newest.append(sample_t)
+            else:
+                ages.append(float("inf"))
+            states.append(state)
+        skew = max(newest) - min(newest) if len(newest) > 1 else 0.0
+        return FusedFrame(t=t, states=tuple(states), ages=tuple(ages), skew=skew)
+
+    def _sample(
+        self, samples: Deque[_Sample], t: float
+    ) -> Tuple[Optional[Tuple[float, ...]], Tuple[int, ...], float]:
+        """Return the axis values and buttons at t, and the time of the newest report <= t."""
+        after = None
+        for sample in reversed(samples):
+            if sample[0] <= t:
+                if self.mode == "interpolate" and after is not None and after[0] > sample[0]:
+                    w = (t - sample[0]) / (after[0] - sample[0])
+                    values = tuple(a + (b - a) * w for a, b in zip(sample[1:7], after[1:7]))
+                    return values, sample[7], sample[0]
+                return sample[1:7], sample[7], sample[0]
+            after = sample
+        if after is not None:
+            # t is before the recorded history: use the oldest report
+            return after[1:7], after[7], after[0]
+        return None, (), 0.0
@@ -0,0 +1,267 @@
+"""Incremental axis gesture recognition for SpaceMouse devices.
+
+GestureRecognizer attaches to devices as a listener and runs a small state
+machine per axis, so every report costs O(1) regardless of how long a
+gesture lasts. Recognized gestures:
+
+    flick: a quick excursion beyond flick_threshold along an axis that returns
+           to center within flick_max_duration
+    hold:  an axis held beyond hold_threshold for hold_duration (emitted once
+           per excursion, while the axis is still deflected)
+    twist: a flick in yaw - an excursion beyond twist_threshold that returns
+           to center within twist_max_duration
+
+    recognizer = GestureRecognizer(
+        gesture_callbacks=[GestureCallback("flick", on_next, axis="x", direction=1)]
+    )
+    recognizer.attach(device)
+
+Values are compared after the device's axis convention is applied. The
+thresholds of a device are looked up again when its spec is reloaded.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Sequence, Tuple
+
+from .callbacks import GestureCallback
+from .types import AXIS_NAMES, DeviceInfo, SpaceMouseState
+
+if TYPE_CHECKING:
+    from .device import SpaceMouseDevice
+
+# Tracker phases
+_IDLE = 0
+_ACTIVE = 1
+
+
+@dataclass(frozen=True)
+class GestureThresholds:
+    """Gesture thresholds (axis values in [-1.0, 1.0], durations in seconds).
+
+    Attributes:
+        center: An excursion starts above and ends below this absolute value
+        flick_threshold: Peak value a flick must reach
+        flick_max_duration: Longest excursion still counted as a flick
+        hold_threshold: Value an axis must stay beyond for a hold
+        hold_duration: Time beyond hold_threshold before a hold is emitted
+        twist_threshold: Peak yaw value a twist must reach
+        twist_max_duration: Longest yaw excursion still counted as a twist
+    """
+
+    center: float = 0.1
+    flick_threshold: float = 0.6
+    flick_max_duration: float = 0.3
+    hold_threshold: float = 0.5
+    hold_duration: float = 0.6
+    twist_threshold: float = 0.5
+    twist_max_duration: float = 0.6
+
+    def __post_init__(self) -> None:
+        """Validate the thresholds."""
+        for name in ("flick_threshold", "hold_threshold", "twist_threshold"):
+            if getattr(self, name) <= self.center:
+                raise ValueError(f"{name} must be greater than center ({self.center})")
+
+
+@dataclass(frozen=True)
+class GestureEvent:
+    """A recognized gesture.
+
+    Attributes:
+        gesture: 'flick', 'hold' or 'twist'
+        axis: Axis the gesture was made on
+        direction: 1 for positive, -1 for negative axis values
+        t: Time the gesture was recognized (state.t)
+        duration: Time since the excursion started
+        peak: Largest absolute axis value during the excursion so far
+        device: Name of the device
+    """
+
+    gesture: str
+    axis: str
+    direction: int
+    t: float
+    duration: float
+    peak: float
+    device: str
+
+
+class _AxisTracker:
+    """Excursion state machine for one axis of one device."""
+
+    __slots__ = ("phase", "direction", "start", "peak", "hold_start", "held")
+
+    def __init__(self) -> None:
+        self.phase = _IDLE
+        self.direction = 0
+        self.start = 0.0
+        self.peak = 0.0
+        self.hold_start = -1.0
+        self.held = False
+
+
+class GestureRecognizer:
+    """Recognizes flick, hold and twist gestures and dispatches GestureEvents.
+
+    Events go to callback(state, event) and to every matching
+    GestureCallback in gesture_callbacks.
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[SpaceMouseState, GestureEvent], None]] = None,
+        gesture_callbacks: Optional[Sequence[GestureCallback]] = None,
+        thresholds: Optional[GestureThresholds] = None,
+        device_thresholds: Optional[Dict[str, GestureThresholds]] = None,
+        axes: Sequence[str] = AXIS_NAMES,
+    ) -> None:
+        """Initialize the recognizer.
+
+        Args:
+            callback: Called with (state, event) for every gesture
+            gesture_callbacks: Callbacks filtered by gesture, axis and direction
+            thresholds: Default thresholds
+            device_thresholds: Thresholds per DeviceInfo name (e.g.
+                "SpaceMouseCompact"), overriding the defaults
+            axes: Axes to track
+
+        Raises:
+            ValueError: If an axis name is unknown.
+            TypeError: If a gesture callback is not a GestureCallback.
+        """
+        for axis in axes:
+            if axis not in AXIS_NAMES:
+                raise ValueError(f"Unknown axis: '{axis}'. Available: {list(AXIS_NAMES)}")
+        for i, gc in enumerate(gesture_callbacks or ()):
+            if not isinstance(gc, GestureCallback):
+                raise TypeError(f"gesture_callbacks[{i}] must be GestureCallback instance")
+
+        self.callback = callback
+        self.gesture_callbacks = list(gesture_callbacks or ())
+        self.thresholds = thresholds or GestureThresholds()
+        self.device_thresholds = dict(device_thresholds or {})
+        self.axes = tuple(axes)
+        # id(device) -> (device, listener, spec listener)
+        self._listeners: Dict[int, Tuple[SpaceMouseDevice, Callable, Callable]] = {}
+
+    def attach(self, device: SpaceMouseDevice) -> None:
+        """Start recognizing gestures on device.
+
+        Raises:
+            ValueError: If the device is already attached.
+        """
+        if id(device) in self._listeners:
+            raise ValueError(f"{device.name} is already attached")
+
+        trackers = [(axis, _AxisTracker()) for axis in self.axes]
+        # (thresholds, device name), replaced as a whole when the spec is reloaded
+        current = (self.device_thresholds.get(device.info.name, self.thresholds), device.name)
+
+        def listener(state: SpaceMouseState) -> None:
+            thresholds, name = current
+            for axis, tracker in trackers:
+                self._update(state, axis, tracker, thresholds, name)
+
+        def reload(info: DeviceInfo) -> None:
+            nonlocal current
+            current = (self.device_thresholds.get(info.name, self.thresholds), info.name)
+
+        device.add_listener(listener)
+        device.add_spec_listener(reload)
+        self._listeners[id(device)] = (device, listener, reload)
+
+    def detach(self, device: SpaceMouseDevice) -> None:
+        """Stop recognizing gestures on device."""
+        entry = self._listeners.pop(id(device), None)
+        if entry is not None:
+            device.remove_listener(entry[1])
+            device.remove_spec_listener(entry[2])
+
+    def _update(
+        self,
+        state: SpaceMouseState,
+        axis: str,
+        tracker: _AxisTracker,
+        thresholds: GestureThresholds,
+        device: str,
+    ) -> None:
+        value = getattr(state, axis)
+        magnitude = abs(value)
+        t = state.t
+
+        if tracker.phase == _ACTIVE and (value > 0) != (tracker.direction > 0):
+            # Crossed zero: the excursion ended and possibly a new one starts
+            self._end(state, axis, tracker, thresholds, device)
+        if tracker.phase == _IDLE:
+            if magnitude < thresholds.center:
+                return
+            tracker.phase = _ACTIVE
+            tracker.direction = 1 if value > 0 else -1
+            tracker.start = t
+            tracker.peak = magnitude
+            tracker.hold_start = -1.0
+            tracker.held = False
+
+        if magnitude < thresholds.center:
+            self._end(state, axis, tracker, thresholds, device)
+            return
+
+        if magnitude > tracker.peak:
+            tracker.peak = magnitude
+        if magnitude >= thresholds.hold_threshold:
+            if tracker.hold_start < 0:
+                tracker.hold_start = t
+            elif not tracker.held and t - tracker.hold_start >= thresholds.hold_duration:
+                tracker.held = True
+                self._emit(state, "hold", axis, tracker, device)
+        else:
+            tracker.hold_start = -1.0
+
+    def _end(
+        self,
+        state: SpaceMouseState,
+        axis: str,
+        tracker: _AxisTracker,
+        thresholds: GestureThresholds,
+        device: str,
+    ) -> None:
+        tracker.phase = _IDLE
+        if tracker.held:
+            return
+        duration = state.t - tracker.start
+        if axis == "yaw":
+            if tracker.peak >= thresholds.twist_threshold:
+                if duration <= thresholds.twist_max_duration:
+                    self._emit(state, "twist", axis, tracker, device)
+        elif tracker.peak >= thresholds.flick_threshold:
+            if duration <= thresholds.flick_max_duration:
+                self._emit(state, "flick", axis, tracker, device)
+
+    def _emit(
+        self,
+        state: SpaceMouseState,
+        gesture: str,
+        axis: str,
+        tracker: _AxisTracker,
+        device: str,
+    ) -> None:
+        event = GestureEvent(
+            gesture=gesture,
+            axis=axis,
+            direction=tracker.direction,
+            t=state.t,
+            duration=state.t - tracker.start,
+            peak=tracker.peak,
+            device=device,
+        )
+        if self.callback:
+            self.callback(state, event)
+        for gc in self.gesture_callbacks:
+            if (
+                gc.gesture == gesture
+                and (gc.axis is None or gc.axis == axis)
+                and (gc.direction is None or gc.direction == event.direction)
+            ):
+                gc.callback(state, event)
@@ -0,0 +1,157 @@
+"""Direct Linux hidraw transport.
+
+HidrawDevice talks to ``/dev/hidrawN`` with plain file descriptor calls,
+bypassing hidapi/easyhid and cffi. Reports are read into a caller-provided
+buffer, so SpaceMouseDevice can reuse one preallocated bytearray instead of
+allocating a new bytes object for every report.
+
+It implements the subset of the easyhid.HIDDevice interface used by
+SpaceMouseDevice, plus readinto() and fileno():
+
+    with pyspacemouse.open_by_path("/dev/hidraw3", backend="hidraw") as device:
+        poller = select.poll()
+        poller.register(device.fileno(), select.POLLIN)
+        while poller.poll():
+            state = device.read()
+"""
+
+from __future__ import annotations
+
+import os
+import select
+from typing import Optional
+
+from easyhid import HIDException
+
+from .sysfs import SYSFS_HIDRAW, hid_ids, read_uevent
+
+
+class HidrawDevice:
+    """A HID device accessed through a Linux hidraw node.
+
+    Attributes:
+        path: Filesystem path of the hidraw node
+        vendor_id: USB vendor ID
+        product_id: USB product ID
+        product_string: Product name reported by the kernel (HID_NAME)
+        manufacturer_string: Always empty (not exposed by hidraw)
+        serial_number: Serial/unique ID reported by the kernel (HID_UNIQ)
+        release_number: Always 0 (not exposed by hidraw)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        vendor_id: Optional[int] = None,
+        product_id: Optional[int] = None,
+        sysfs_root: str = SYSFS_HIDRAW,
+    ) -> None:
+        """Describe a hidraw node; the device is opened by open().
+
+        Args:
+            path: Path to the hidraw node (e.g. "/dev/hidraw0")
+            vendor_id: USB vendor ID. Read from sysfs if not given.
+            product_id: USB product ID. Read from sysfs if not given.
+            sysfs_root: sysfs directory describing hidraw nodes
+
+        Raises:
+            ValueError: If the IDs are not given and cannot be read from sysfs.
+        """
+        self._fd = -1
+        self.path = path
+        name = os.path.basename(os.path.realpath(path))
+        uevent = read_uevent(name, sysfs_root)
+
+        if vendor_id is None or product_id is None:
+            ids = hid_ids(uevent)
+            if ids is None:
+                raise ValueError(f"Cannot determine VID/PID of '{path}' from sysfs.")
+            vendor_id, product_id = ids
+
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.product_string = uevent.get("HID_NAME", "")
+        self.manufacturer_string = ""
+        self.serial_number = uevent.get("HID_UNIQ", "")
+        self.release_number = 0
+
+    def open(self) -> None:
+        """Open the hidraw node for reading and writing (read-only as fallback)."""
+        if self._fd >= 0:
+            raise HIDException("Failed to open device: HidrawDevice already open")
+        try:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CLOEXEC)
+        except PermissionError:
+            try:
+                self._fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC)
+            except OSError as e:
+                raise HIDException(f"Failed to open device: {e}") from e
+        except OSError as e:
+            raise HIDException(f"Failed to open device: {e}") from e
+
+    def close(self) -> None:
+        """Close the hidraw node."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def is_open(self) -> bool:
+        """Check if the node is open."""
+        return self._fd >= 0
+
+    def fileno(self) -> int:
+        """Return the raw file descriptor, for use with select/poll/epoll."""
+        if self._fd < 0:
+            raise HIDException("HidrawDevice not open")
+        return self._fd
+
+    def set_nonblocking(self, enable_nonblocking: bool) -> None:
+        """Enable or disable non-blocking reads."""
+        os.set_blocking(self.fileno(), not enable_nonblocking)
+
+    def readinto(self, buffer) -> int:
+        """Read one report into a writable buffer.
+
+        Args:
+            buffer: Writable buffer (bytearray, memoryview, ...). A report
+                    longer than the buffer is truncated.
+
+        Returns:
+            Number of bytes read, 0 if no report is available in
+            non-blocking mode.
+
+        Raises:
+            HIDException: If the read fails (e.g. the device was unplugged).
+        """
+        try:
+            return os.readv(self._fd, (buffer,))
+        except BlockingIOError:
+            return 0
+        except OSError as e:
+            raise HIDException(f"Failed to read from HID device: {e}") from e
+
+    def read(self, size: int = 64, timeout: Optional[int] = None) -> bytearray:
+        """Read one report (easyhid-compatible, allocates a new bytearray).
+
+        Args:
+            size: Maximum number of bytes to read
+            timeout: Optional time to wait for a report in milliseconds
+        """
+        if timeout is not None:
+            readable, _, _ = select.select([self.fileno()], [], [], timeout / 1000)
+            if not readable:
+                return bytearray()
+        buffer = bytearray(size)
+        count = self.readinto(buffer)
+        del buffer[count:]
+        return buffer
+
+    def write(self, data, report_id: int = 0) -> int:
+        """Write an output report; report_id is prepended like easyhid does."""
+        try:
+            return os.write(self.fileno(), bytes([report_id]) + bytes(data))
+        except OSError as e:
+            raise HIDException(f"Failed to write to HID device: {e}") from e
+
+    def __del__(self) -> None:
+        self.close()
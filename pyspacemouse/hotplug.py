@@ -0,0 +1,260 @@
+"""Hotplug notifications for SpaceMouse devices on Linux.
+
+This module watches /dev with inotify for hidraw nodes being added or
+removed. Only the affected node is matched against the VID/PID index from
+get_device_index(), so no full HID enumeration is needed per event.
+
+Usage:
+    import pyspacemouse
+
+    def connected(path, info):
+        print(f"{info.name} plugged in at {path}")
+
+    def disconnected(path):
+        print(f"{path} removed")
+
+    watcher = pyspacemouse.watch(on_connected=connected, on_disconnected=disconnected)
+
+    watcher.run()        # blocking loop, or
+    watcher.start()      # background thread, or
+    loop.add_reader(watcher.fileno(), watcher.process_events)  # asyncio
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from typing import Callable, Dict, Optional
+
+from .loader import get_device_index
+from .sysfs import SYSFS_HIDRAW, hid_ids, read_uevent
+from .types import DeviceInfo
+
+# inotify constants (see inotify(7))
+_IN_ATTRIB = 0x00000004
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+ConnectedCallback = Callable[[str, DeviceInfo], None]
+DisconnectedCallback = Callable[[str], None]
+
+
+class HotplugWatcher:
+    """Watches for SpaceMouse hidraw nodes appearing and disappearing.
+
+    Create through pyspacemouse.watch(). Callbacks are invoked from whichever
+    thread calls process_events() (directly, via run(), start() or an event
+    loop reader).
+
+    Attributes:
+        devices: Currently known SpaceMouse nodes, as {path: DeviceInfo}
+    """
+
+    def __init__(
+        self,
+        on_connected: Optional[ConnectedCallback] = None,
+        on_disconnected: Optional[DisconnectedCallback] = None,
+        include_existing: bool = True,
+        dev_dir: str = "/dev",
+        sysfs_root: str = SYSFS_HIDRAW,
+    ) -> None:
+        """Initialize the watcher and start listening for inotify events.
+
+        Args:
+            on_connected: Called with (path, DeviceInfo) for each new SpaceMouse
+            on_disconnected: Called with (path) when a known SpaceMouse node is removed
+            include_existing: If True, report already present devices on the
+                              first call to process_events(); fileno() is
+                              readable until then
+            dev_dir: Directory holding hidraw nodes
+            sysfs_root: sysfs directory describing hidraw nodes
+
+        Raises:
+            RuntimeError: If not running on Linux or inotify is unavailable.
+        """
+        if not sys.platform.startswith("linux"):
+            raise RuntimeError("Hotplug watching is only supported on Linux.")
+
+        self.on_connected = on_connected
+        self.on_disconnected = on_disconnected
+        self.devices: Dict[str, DeviceInfo] = {}
+        self._dev_dir = dev_dir
+        self._sysfs_root = sysfs_root
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise RuntimeError(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+        mask = _IN_CREATE | _IN_DELETE | _IN_ATTRIB | _IN_MOVED_FROM | _IN_MOVED_TO
+        if libc.inotify_add_watch(self._fd, os.fsencode(dev_dir), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise RuntimeError(f"Cannot watch '{dev_dir}': {os.strerror(errno)}")
+
+        # Self-pipe used to wake a blocking run() when stop() is called
+        self._wake_r, self._wake_w = os.pipe()
+
+        # Pipe kept readable while the scan of existing devices is pending.
+        # fileno() is an epoll descriptor over it and the inotify descriptor,
+        # so an event loop reader runs the scan right away instead of at the
+        # next unrelated inotify event.
+        self._scan_r, self._scan_w = os.pipe()
+        self._scan_pending = include_existing
+        if include_existing:
+            os.write(self._scan_w, b"\0")
+        self._epoll = select.epoll()
+        self._epoll.register(self._fd, select.EPOLLIN)
+        self._epoll.register(self._scan_r, select.EPOLLIN)
+
+    # -------------------------------------------------------------------------
+    # Event processing
+    # -------------------------------------------------------------------------
+
+    def fileno(self) -> int:
+        """Return a file descriptor that is readable when process_events() has work."""
+        return self._epoll.fileno()
+
+    def process_events(self) -> int:
+        """Handle all pending events without blocking.
+
+        Returns:
+            Number of connect/disconnect notifications emitted.
+        """
+        emitted = 0
+        if self._scan_pending:
+            self._scan_pending = False
+            os.read(self._scan_r, 1)
+            for entry in sorted(os.listdir(self._dev_dir)):
+                if entry.startswith("hidraw"):
+                    emitted += self._added(entry)
+
+        while True:
+            try:
+                buf = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset : offset + length].rstrip(b"\0").decode()
+                offset += length
+                if not name.startswith("hidraw"):
+                    continue
+                if mask & (_IN_DELETE | _IN_MOVED_FROM):
+                    emitted += self._removed(name)
+                else:
+                    emitted += self._added(name)
+        return emitted
+
+    def _added(self, name: str) -> int:
+        path = os.path.join(self._dev_dir, name)
+        if path in self.devices:
+            return 0
+        ids = hid_ids(read_uevent(name, self._sysfs_root))
+        if ids is None:
+            return 0
+        info = get_device_index().get(ids)
+        if info is None:
+            return 0
+        self.devices[path] = info
+        if self.on_connected is not None:
+            self.on_connected(path, info)
+        return 1
+
+    def _removed(self, name: str) -> int:
+        path = os.path.join(self._dev_dir, name)
+        if self.devices.pop(path, None) is None:
+            return 0
+        if self.on_disconnected is not None:
+            self.on_disconnected(path)
+        return 1
+
+    # -------------------------------------------------------------------------
+    # Loops
+    # -------------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Process events in a blocking loop until stop() is called."""
+        if threading.current_thread() is not self._thread:
+            self._stop.clear()
+        self.process_events()
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._fd, self._wake_r], [], [])
+            if self._wake_r in readable:
+                os.read(self._wake_r, 64)
+            if self._fd in readable:
+                self.process_events()
+
+    def start(self) -> None:
+        """Run the event loop in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="pyspacemouse-hotplug", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop a running loop (from any thread)."""
+        self._stop.set()
+        os.write(self._wake_w, b"\0")
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop the loop and release the inotify descriptor."""
+        if self._fd < 0:
+            return
+        self.stop()
+        self._epoll.close()
+        for fd in (self._fd, self._wake_r, self._wake_w, self._scan_r, self._scan_w):
+            os.close(fd)
+        self._fd = -1
+
+    def __enter__(self) -> HotplugWatcher:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def watch(
+    on_connected: Optional[ConnectedCallback] = None,
+    on_disconnected: Optional[DisconnectedCallback] = None,
+    include_existing: bool = True,
+) -> HotplugWatcher:
+    """Watch for SpaceMouse devices being connected or disconnected (Linux only).
+
+    Args:
+        on_connected: Called with (path, DeviceInfo) when a supported device appears
+        on_disconnected: Called with (path) when a previously reported device is removed
+        include_existing: If True, devices already connected are reported as well
+
+    Returns:
+        HotplugWatcher; drive it with run(), start() or an event loop reader
+        on fileno() calling process_events().
+
+    Raises:
+        RuntimeError: If not running on Linux or inotify is unavailable.
+    """
+    return HotplugWatcher(
+        on_connected=on_connected,
+        on_disconnected=on_disconnected,
+        include_existing=include_existing,
+    )
@@ -9,7 +9,7 @@ from __future__ import annotations
 import sys
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
 from .types import AxisSpec, ButtonSpec, DeviceInfo
 
@@ -100,3 +100,20 @@ def get_device_specs() -> Dict[str, DeviceInfo]:
         Dictionary mapping device names to DeviceInfo instances.
     """
     return load_device_specs()
+
+
+@lru_cache(maxsize=1)
+def get_device_index() -> Dict[Tuple[int, int], DeviceInfo]:
+    """Get device specifications indexed by (vendor_id, product_id).
+
+    Built once from get_device_specs() so that matching an enumerated HID
+    device against the supported devices is a single dictionary lookup.
+    If two specs share the same IDs, the first one in devices.toml wins.
+
+    Returns:
+        Dictionary mapping (vendor_id, product_id) to DeviceInfo instances.
+    """
+    index: Dict[Tuple[int, int], DeviceInfo] = {}
+    for spec in get_device_specs().values():
+        index.setdefault(spec.hid_id, spec)
+    return index
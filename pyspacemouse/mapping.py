@@ -0,0 +1,296 @@
+"""Declarative input-to-action mapping for SpaceMouse devices.
+
+Rules bind button presses and axis thresholds, optionally combined with
+held buttons, to named actions. They can be written in Python or loaded
+from a TOML file in the devices.toml style:
+
+    [[rules]]
+    action = "rotate_view"
+    held = ["BTN_1"]
+    axis = "yaw"
+    above = 0.3
+
+    [[rules]]
+    action = "open_menu"
+    pressed = "MENU"
+    device = "SpaceMouseEnterprise"   # optional: only for this device type
+
+Button names are resolved through DeviceInfo.button_names when a
+MappingEngine attaches to a device, and the rules are compiled into
+tables indexed by button, by held-button mask and by axis:
+
+- a press rule is only looked at when its button goes down, and
+- axis rules are grouped by the buttons they require and by the report
+  (channel) carrying their axis, so each report only evaluates the rules
+  of the axes it updated whose held buttons are all down. Button-only
+  reports evaluate no axis rules.
+
+Press rules fire once per press with value 1.0; axis rules fire on every
+report while the axis is beyond the threshold, with the axis value. When
+the device spec is reloaded (SpaceMouseDevice.reload_spec() or
+watch_spec()), the rules are compiled again against the new spec.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .loader import tomllib
+from .types import AXIS_NAMES, DeviceInfo, SpaceMouseState
+
+if TYPE_CHECKING:
+    from .device import SpaceMouseDevice
+
+logger = logging.getLogger("pyspacemouse")
+
+ActionCallback = Callable[[SpaceMouseState, float], None]
+
+# ((axis, ((above, below, action), ...)), ...)
+_AxisGroups = Tuple[Tuple[str, Tuple[Tuple[float, float, str], ...]], ...]
+
+
+@dataclass(frozen=True)
+class MappingRule:
+    """One input-to-action binding.
+
+    Exactly one of pressed or axis must be given; axis rules need above
+    and/or below.
+
+    Attributes:
+        action: Name of the action to trigger
+        pressed: Button name whose press triggers the action
+        axis: Axis name for a threshold rule
+        above: Trigger while the axis value is greater than this
+        below: Trigger while the axis value is less than this
+        held: Button names that must be held down as well
+        device: Only apply to this device type (DeviceInfo.name), or None
+    """
+
+    action: str
+    pressed: Optional[str] = None
+    axis: Optional[str] = None
+    above: Optional[float] = None
+    below: Optional[float] = None
+    held: Tuple[str, ...] = ()
+    device: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate the rule."""
+        if (self.pressed is None) == (self.axis is None):
+            raise ValueError(f"Rule '{self.action}': set exactly one of 'pressed' or 'axis'")
+        if self.axis is not None:
+            if self.axis not in AXIS_NAMES:
+                raise ValueError(
+                    f"Rule '{self.action}': axis must be one of {AXIS_NAMES}, got '{self.axis}'"
+                )
+            if self.above is None and self.below is None:
+                raise ValueError(f"Rule '{self.action}': axis rules need 'above' or 'below'")
+        object.__setattr__(self, "held", tuple(self.held))
+
+
+def load_mapping_rules(toml_path: Path | str) -> List[MappingRule]:
+    """Load mapping rules from the [[rules]] array of a TOML file.
+
+    Args:
+        toml_path: Path to the TOML file
+
+    Returns:
+        List of MappingRule in file order.
+
+    Raises:
+        ValueError: If a rule is invalid or has unknown keys.
+    """
+    with open(toml_path, "rb") as f:
+        data = tomllib.load(f)
+
+    rules = []
+    for i, entry in enumerate(data.get("rules", [])):
+        try:
+            rules.append(MappingRule(**entry))
+        except TypeError as e:
+            raise ValueError(f"rules[{i}] in {toml_path}: {e}") from None
+    return rules
+
+
+class _CompiledRules:
+    """Rules resolved against one DeviceInfo and indexed for evaluation.
+
+    Button bits follow ButtonState.__int__: button i is bit (n - 1 - i).
+    """
+
+    __slots__ = ("press_rules", "axis_rules", "track_buttons", "_axis_cache")
+
+    def __init__(self, rules: Sequence[MappingRule], info: DeviceInfo) -> None:
+        bits = {
+            name: 1 << (len(info.button_names) - 1 - i) for i, name in enumerate(info.button_names)
+        }
+
+        # Press rules keyed by the bit of the pressed button
+        self.press_rules: Dict[int, List[Tuple[int, str]]] = {}
+        # Axis rules keyed by held-button mask, report ID of their axis, and axis
+        self.axis_rules: Dict[int, Dict[int, Dict[str, List[Tuple[float, float, str]]]]] = {}
+        # Held mask -> report ID -> ((axis, ((above, below, action), ...)), ...)
+        # for the axis rules whose held buttons are all down
+        self._axis_cache: Dict[int, Dict[int, _AxisGroups]] = {}
+
+        for rule in rules:
+            if rule.device is not None and rule.device != info.name:
+                continue
+            names = rule.held + ((rule.pressed,) if rule.pressed is not None else ())
+            missing = [name for name in names if name not in bits]
+            if missing:
+                if rule.device is not None:
+                    raise ValueError(
+                        f"Rule '{rule.action}': unknown button(s) {missing} for {info.name}"
+                    )
+                continue  # Device-independent rule using buttons this device lacks
+            held_mask = 0
+            for name in rule.held:
+                held_mask |= bits[name]
+
+            if rule.pressed is not None:
+                self.press_rules.setdefault(bits[rule.pressed], []).append((held_mask, rule.action))
+            elif rule.axis in info.mappings:
+                above = rule.above if rule.above is not None else float("inf")
+                below = rule.below if rule.below is not None else float("-inf")
+                channel = info.mappings[rule.axis].channel
+                by_axis = self.axis_rules.setdefault(held_mask, {}).setdefault(channel, {})
+                by_axis.setdefault(rule.axis, []).append((above, below, rule.action))
+
+        # Skip building the button mask when no rule depends on buttons
+        self.track_buttons = bool(self.press_rules) or any(self.axis_rules)
+
+    def axis_rules_for(self, mask: int) -> Dict[int, _AxisGroups]:
+        """Return the axis rules applicable with the given buttons held, by report ID."""
+        rules = self._axis_cache.get(mask)
+        if rules is None:
+            merged: Dict[int, Dict[str, List[Tuple[float, float, str]]]] = {}
+            for held_mask, by_channel in self.axis_rules.items():
+                if held_mask & mask != held_mask:
+                    continue
+                for channel, by_axis in by_channel.items():
+                    for axis, group in by_axis.items():
+                        merged.setdefault(channel, {}).setdefault(axis, []).extend(group)
+            rules = {
+                channel: tuple((axis, tuple(group)) for axis, group in by_axis.items())
+                for channel, by_axis in merged.items()
+            }
+            self._axis_cache[mask] = rules
+        return rules
+
+
+class MappingEngine:
+    """Evaluates compiled mapping rules and dispatches actions.
+
+    Actions go to the callable bound with bind() (or passed in actions),
+    and to callback(action, state, value) for every action.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[MappingRule],
+        actions: Optional[Dict[str, ActionCallback]] = None,
+        callback: Optional[Callable[[str, SpaceMouseState, float], None]] = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            rules: Mapping rules (e.g. from load_mapping_rules())
+            actions: Action name to callable(state, value)
+            callback: Called with (action, state, value) for every action
+        """
+        self.rules = list(rules)
+        self.actions: Dict[str, ActionCallback] = dict(actions or {})
+        self.callback = callback
+        # id(device) -> (device, listener, spec listener)
+        self._listeners: Dict[int, Tuple[SpaceMouseDevice, Callable, Callable]] = {}
+
+    @classmethod
+    def from_toml(cls, toml_path: Path | str, **kwargs) -> MappingEngine:
+        """Create an engine from the rules in a TOML file."""
+        return cls(load_mapping_rules(toml_path), **kwargs)
+
+    def bind(self, action: str, fn: ActionCallback) -> None:
+        """Call fn(state, value) when action is triggered."""
+        self.actions[action] = fn
+
+    def compile(self, info: DeviceInfo) -> _CompiledRules:
+        """Resolve the rules against a device type.
+
+        Raises:
+            ValueError: If a rule for this device type names an unknown button.
+        """
+        return _CompiledRules(self.rules, info)
+
+    def attach(self, device: SpaceMouseDevice) -> None:
+        """Start evaluating the rules for every report of device.
+
+        Raises:
+            ValueError: If the device is already attached, or a rule for
+                        this device type names an unknown button.
+        """
+        if id(device) in self._listeners:
+            raise ValueError(f"{device.name} is already attached")
+
+        compiled = self.compile(device.info)
+        # Rules used by the listener, and the rules its button state is for
+        active = compiled
+        last_mask = 0
+        axis_rules = compiled.axis_rules_for(0)
+
+        def listener(state: SpaceMouseState) -> None:
+            nonlocal active, last_mask, axis_rules
+            rules = compiled
+            mask = int(state.buttons) if rules.track_buttons else 0
+            if rules is not active:
+                # Recompiled after a spec reload: button bits may have moved,
+                # so start from the buttons held now without firing presses
+                active = rules
+                last_mask = mask
+                axis_rules = rules.axis_rules_for(mask)
+            if mask != last_mask:
+                rising = mask & ~last_mask
+                last_mask = mask
+                axis_rules = rules.axis_rules_for(mask)
+                while rising:
+                    bit = rising & -rising
+                    rising ^= bit
+                    for held_mask, action in rules.press_rules.get(bit, ()):
+                        if held_mask & mask == held_mask:
+                            self._dispatch(action, state, 1.0)
+            groups = axis_rules.get(device.report_id)
+            if groups:
+                for axis, group in groups:
+                    value = getattr(state, axis)
+                    for above, below, action in group:
+                        if value > above or value < below:
+                            self._dispatch(action, state, value)
+
+        def recompile(info: DeviceInfo) -> None:
+            nonlocal compiled
+            try:
+                compiled = self.compile(info)
+            except ValueError as e:
+                logger.warning("Mapping rules disabled for %s after spec reload: %s", info.name, e)
+                compiled = _CompiledRules((), info)
+
+        device.add_listener(listener)
+        device.add_spec_listener(recompile)
+        self._listeners[id(device)] = (device, listener, recompile)
+
+    def detach(self, device: SpaceMouseDevice) -> None:
+        """Stop evaluating the rules for device."""
+        entry = self._listeners.pop(id(device), None)
+        if entry is not None:
+            device.remove_listener(entry[1])
+            device.remove_spec_listener(entry[2])
+
+    def _dispatch(self, action: str, state: SpaceMouseState, value: float) -> None:
+        fn = self.actions.get(action)
+        if fn is not None:
+            fn(state, value)
+        if self.callback:
+            self.callback(action, state, value)
@@ -0,0 +1,598 @@
+"""Process-per-device reader pool.
+
+DevicePool opens every device in its own worker process, where reports are
+read, decoded and passed through optional filters. The workers stream
+compact state frames back over pipes, and the parent gets one PooledDevice
+per path with the SpaceMouseDevice API (read(), configure(), listeners,
+snapshot(), ...):
+
+    with DevicePool(paths, axis_convention=AxisConvention.HID_Z_UP) as pool:
+        for device in pool:
+            device.configure(callback=on_state)
+        while True:
+            pool.poll(timeout=0.01)   # dispatch frames of all workers
+
+Spreading devices over processes lets decoding and heavy filtering use
+several cores, and isolates the devices from each other: a worker whose HID
+handle fails is restarted without affecting the rest. Idle workers send a
+heartbeat every heartbeat_interval seconds; a worker that sends nothing for
+heartbeat_timeout seconds (e.g. stuck in a blocking read) is terminated and
+restarted as well.
+
+Filters run in the workers. Each is a picklable callable (e.g. a module
+level function) that receives a copy of the decoded state and returns the
+state to send, or None to drop it.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import multiprocessing
+import pickle
+import struct
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from .api import open_by_path
+from .device import ConnectionCallback, SpaceMouseDevice
+from .realtime import RealtimeOptions, realtime_scope
+from .types import AXIS_NAMES, AxisConvention, DeviceInfo, SpaceMouseState
+
+logger = logging.getLogger("pyspacemouse")
+
+StateFilter = Callable[[SpaceMouseState], Optional[SpaceMouseState]]
+
+# t_ns, t_smoothed, x, y, z, roll, pitch, yaw, button mask, flags, report ID
+_FRAME = struct.Struct("<qd6dQBB")
+_DOF_CHANGED = 1
+_BUTTON_CHANGED = 2
+
+# Message tags, worker -> parent
+_READY = b"R"
+_FRAMES = b"F"
+_ERROR = b"E"
+_HEARTBEAT = b"H"
+# Message tags, parent -> worker
+_STOP = b"S"
+_LED = b"L"
+
+# Seconds a lost worker may take to exit before it is killed
+_KILL_GRACE = 1.0
+
+# Decode entries for AxisPredictor.update(): every axis of a frame
+_ALL_AXES = tuple((axis,) for axis in AXIS_NAMES)
+
+
+def _worker_main(
+    conn: Connection,
+    opener: Callable[..., SpaceMouseDevice],
+    path: str,
+    open_kwargs: dict,
+    filters: Sequence[StateFilter],
+    poll_interval: float,
+    heartbeat_interval: float,
+    max_batch: int,
+    realtime: Optional[RealtimeOptions],
+) -> None:
+    """Read one device and send its frames to the parent until told to stop."""
+    with realtime_scope(realtime) as realtime_report:
+        _worker_loop(
+            conn,
+            opener,
+            path,
+            open_kwargs,
+            filters,
+            poll_interval,
+            heartbeat_interval,
+            max_batch,
+            realtime_report,
+        )
+
+
+def _worker_loop(
+    conn: Connection,
+    opener: Callable[..., SpaceMouseDevice],
+    path: str,
+    open_kwargs: dict,
+    filters: Sequence[StateFilter],
+    poll_interval: float,
+    heartbeat_interval: float,
+    max_batch: int,
+    realtime_report,
+) -> None:
+    try:
+        device = opener(path, **open_kwargs)
+    except Exception as e:
+        conn.send_bytes(_ERROR + f"{type(e).__name__}: {e}".encode())
+        return
+
+    pending = bytearray()
+    max_bytes = max_batch * _FRAME.size
+    pack = _FRAME.pack
+    # Reports received
+    report = [0]
+
+    def on_report(data, t_ns: int) -> None:
+        report[0] += 1
+
+    def on_state(state: SpaceMouseState) -> None:
+        report_id = device.report_id
+        layout = device._layout
+        flags = (_DOF_CHANGED if report_id in layout.axes else 0) | (
+            _BUTTON_CHANGED if report_id in layout.buttons else 0
+        )
+        if filters:
+            state = device.snapshot()
+            for state_filter in filters:
+                state = state_filter(state)
+                if state is None:
+                    return
+        pending.extend(
+            pack(
+                state.t_ns,
+                state.t_smoothed,
+                state.x,
+                state.y,
+                state.z,
+                state.roll,
+                state.pitch,
+                state.yaw,
+                int(state.buttons),
+                flags,
+                report_id,
+            )
+        )
+
+    with device:
+        device.set_nonblocking(True)
+        device.add_raw_listener(on_report)
+        device.add_listener(on_state)
+        try:
+            fd = device.fileno()
+        except io.UnsupportedOperation:
+            fd = None
+        waitables = [conn, fd] if fd is not None else [conn]
+        timeout = heartbeat_interval if fd is not None else poll_interval
+
+        try:
+            conn.send_bytes(
+                _READY
+                + pickle.dumps(
+                    (device.info, device.serial_number, device.product_name, realtime_report)
+                )
+            )
+            # Time of the last message to the parent, for heartbeats
+            last_sent = time.monotonic()
+            while True:
+                received = report[0]
+                device.read()
+                got_report = report[0] != received
+                if pending and (not got_report or len(pending) >= max_bytes):
+                    conn.send_bytes(_FRAMES + pending)
+                    del pending[:]
+                    last_sent = time.monotonic()
+                if got_report:
+                    continue
+                now = time.monotonic()
+                if now - last_sent >= heartbeat_interval:
+                    conn.send_bytes(_HEARTBEAT)
+                    last_sent = now
+                if conn in wait(waitables, timeout):
+                    message = conn.recv_bytes()
+                    if message[:1] == _LED:
+                        device.set_led(message[1:] == b"1")
+                    else:
+                        return
+        except (EOFError, BrokenPipeError, ConnectionResetError):
+            return  # Parent went away
+
+
+class PooledDevice(SpaceMouseDevice):
+    """Parent-side view of a device read by a DevicePool worker.
+
+    Behaves like a SpaceMouseDevice: read() dispatches the frames received
+    from the worker (updating state and running callbacks and listeners),
+    and configure(), add_listener(), snapshot(), enable_prediction() and
+    the other decoded-state methods work as usual. set_led() is forwarded to
+    the worker. Methods that need the HID handle itself, such as
+    reload_spec() or enable_reconnect(), have no effect; restarts are
+    handled by the pool.
+
+    Attributes:
+        restarts: Number of times the worker was restarted
+        realtime_report: Real-time settings in effect in the worker
+            (None if none were requested)
+    """
+
+    __slots__ = ("_pool", "_index", "restarts", "realtime_report")
+
+    def __init__(
+        self,
+        pool: DevicePool,
+        index: int,
+        info: DeviceInfo,
+        path: str,
+        axis_convention: Optional[AxisConvention] = None,
+    ) -> None:
+        super().__init__(info, axis_convention=axis_convention)
+        self._pool = pool
+        self._index = index
+        self._path = path
+        self.restarts = 0
+        self.realtime_report = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the worker is running and has opened the device."""
+        return self._pool._workers[self._index].ready
+
+    def read(self) -> SpaceMouseState:
+        """Dispatch the frames received from the worker.
+
+        Returns:
+            The current state after processing all received frames.
+        """
+        self._pool._service(self._index)
+        return self._state
+
+    def fileno(self) -> int:
+        """Return the file descriptor of the worker pipe for select/poll/epoll."""
+        return self._pool._workers[self._index].conn.fileno()
+
+    def set_led(self, state: bool) -> None:
+        """Ask the worker to set the LED state."""
+        worker = self._pool._workers[self._index]
+        if worker.ready:
+            try:
+                worker.conn.send_bytes(_LED + (b"1" if state else b"0"))
+            except OSError:
+                pass  # Worker is gone; the pool restarts it
+
+    def close(self) -> None:
+        """Stop the worker of this device (it is not restarted)."""
+        self._pool._stop_worker(self._index)
+
+    def _apply_frames(self, data: bytes | memoryview) -> int:
+        """Update the state from received frames and run the callbacks."""
+        state = self._state
+        buttons = state.buttons
+        n_buttons = len(buttons)
+        predictor = self._predictor
+        count = 0
+        for (
+            t_ns,
+            t_smoothed,
+            x,
+            y,
+            z,
+            roll,
+            pitch,
+            yaw,
+            mask,
+            flags,
+            report_id,
+        ) in _FRAME.iter_unpack(data):
+            self._report_id = report_id
+            state.x = x
+            state.y = y
+            state.z = z
+            state.roll = roll
+            state.pitch = pitch
+            state.yaw = yaw
+            state.t_ns = t_ns
+            state.t = t_ns * 1e-9
+            state.t_smoothed = t_smoothed
+            dof_changed = bool(flags & _DOF_CHANGED)
+            button_changed = bool(flags & _BUTTON_CHANGED)
+            if button_changed:
+                for i in range(n_buttons):
+                    buttons[i] = (mask >> (n_buttons - 1 - i)) & 1
+            if dof_changed and predictor is not None:
+                predictor.update(_ALL_AXES, state)
+            self._publish()
+            self._invoke_callbacks(dof_changed, button_changed)
+            count += 1
+        return count
+
+
+class _Worker:
+    """Process and pipe of one device."""
+
+    __slots__ = ("path", "process", "conn", "ready", "stopped", "restart_at", "last_seen")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.conn: Optional[Connection] = None
+        self.ready = False
+        self.stopped = False
+        self.restart_at = 0.0
+        # Time the last message was received (or the worker was started)
+        self.last_seen = 0.0
+
+
+class DevicePool:
+    """Reads several devices in one worker process each.
+
+    Attributes:
+        devices: One PooledDevice per path, in the given order
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        axis_convention: Optional[AxisConvention] = None,
+        backend: str = "hidapi",
+        filters: Sequence[StateFilter] = (),
+        restart: bool = True,
+        restart_delay: float = 1.0,
+        on_disconnect: Optional[ConnectionCallback] = None,
+        on_reconnect: Optional[ConnectionCallback] = None,
+        start_timeout: float = 10.0,
+        poll_interval: float = 0.001,
+        heartbeat_interval: float = 0.5,
+        heartbeat_timeout: float = 5.0,
+        max_batch: int = 64,
+        context: Optional[multiprocessing.context.BaseContext] = None,
+        opener: Callable[..., SpaceMouseDevice] = open_by_path,
+        realtime: Optional[RealtimeOptions] = None,
+    ) -> None:
+        """Start one worker per path and wait until all devices are open.
+
+        Args:
+            paths: Device paths (e.g. from get_connected_devices_by_path())
+            axis_convention: Coordinate convention passed to open_by_path()
+            backend: HID transport passed to open_by_path()
+            filters: Picklable callables run in the workers on every decoded
+                     state, in order; each returns the state to send or None
+                     to drop it
+            restart: Restart workers that exit unexpectedly
+            restart_delay: Seconds to wait before restarting a worker
+            on_disconnect: Called with the PooledDevice when its worker is lost
+            on_reconnect: Called with the PooledDevice when a restarted
+                          worker has opened the device again
+            start_timeout: Seconds to wait for all workers to open their device
+            poll_interval: Worker sleep between reads when the transport has
+                           no file descriptor to wait on
+            heartbeat_interval: Seconds between heartbeats of an idle worker
+            heartbeat_timeout: Seconds without any message after which a
+                               worker is considered hung, terminated and
+                               restarted (also bounds how long a restarted
+                               worker may take to open its device)
+            max_batch: Maximum frames a worker sends in one message
+            context: multiprocessing context (default: the platform default)
+            opener: Called in the worker as opener(path, axis_convention=...,
+                    backend=...) to open the device
+            realtime: CPU affinity, scheduling policy, memory locking and GC
+                      settings applied in every worker (best effort, see
+                      RealtimeOptions)
+
+        Raises:
+            ValueError: If heartbeat_timeout is not greater than heartbeat_interval.
+            RuntimeError: If a worker fails to open its device or does not
+                          start within start_timeout.
+        """
+        if heartbeat_timeout <= heartbeat_interval:
+            raise ValueError("heartbeat_timeout must be greater than heartbeat_interval")
+        self._context = context or multiprocessing.get_context()
+        self._opener = opener
+        self._open_kwargs = {"axis_convention": axis_convention, "backend": backend}
+        self._filters = tuple(filters)
+        self._poll_interval = poll_interval
+        self._heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self._max_batch = max_batch
+        self._realtime = realtime
+        self.restart = restart
+        self.restart_delay = restart_delay
+        self.on_disconnect = on_disconnect
+        self.on_reconnect = on_reconnect
+        self._workers = [_Worker(str(path)) for path in paths]
+        self.devices: List[PooledDevice] = []
+
+        for worker in self._workers:
+            self._spawn(worker)
+        deadline = time.monotonic() + start_timeout
+        try:
+            for index, worker in enumerate(self._workers):
+                remaining = deadline - time.monotonic()
+                if not worker.conn.poll(max(remaining, 0.0)):
+                    raise RuntimeError(
+                        f"Worker for '{worker.path}' did not start within {start_timeout} s"
+                    )
+                message = worker.conn.recv_bytes()
+                if message[:1] != _READY:
+                    raise RuntimeError(
+                        f"Worker for '{worker.path}' failed: {message[1:].decode(errors='replace')}"
+                    )
+                info, serial_number, product_name, report = pickle.loads(message[1:])
+                device = PooledDevice(self, index, info, worker.path, axis_convention)
+                device._serial_number = serial_number
+                device._product_name = product_name
+                device.realtime_report = report
+                worker.ready = True
+                worker.last_seen = time.monotonic()
+                self.devices.append(device)
+        except (RuntimeError, EOFError) as e:
+            self.close()
+            if isinstance(e, EOFError):
+                raise RuntimeError("A worker exited during startup") from None
+            raise
+
+    def _spawn(self, worker: _Worker) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                self._opener,
+                worker.path,
+                self._open_kwargs,
+                self._filters,
+                self._poll_interval,
+                self._heartbeat_interval,
+                self._max_batch,
+                self._realtime,
+            ),
+            name=f"DevicePool[{worker.path}]",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker.process = process
+        worker.conn = parent_conn
+        worker.ready = False
+        worker.last_seen = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+    def __iter__(self) -> Iterator[PooledDevice]:
+        return iter(self.devices)
+
+    def __getitem__(self, index: int) -> PooledDevice:
+        return self.devices[index]
+
+    def __enter__(self) -> DevicePool:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Dispatch
+    # -------------------------------------------------------------------------
+
+    def poll(self, timeout: float = 0.0) -> int:
+        """Dispatch the frames of all workers and restart lost or hung ones.
+
+        Args:
+            timeout: Seconds to wait for the first frame if none is pending
+
+        Returns:
+            Number of frames dispatched.
+        """
+        conns = {
+            worker.conn: index
+            for index, worker in enumerate(self._workers)
+            if worker.conn is not None
+        }
+        ready = wait(list(conns), timeout) if conns else []
+        count = 0
+        for conn in ready:
+            count += self._service(conns[conn])
+        self._check_heartbeats()
+        self._restart_due()
+        return count
+
+    def _service(self, index: int) -> int:
+        """Dispatch all frames received from one worker."""
+        worker = self._workers[index]
+        conn = worker.conn
+        count = 0
+        if conn is None:
+            self._restart_due()
+            return 0
+        try:
+            while conn.poll():
+                message = conn.recv_bytes()
+                worker.last_seen = time.monotonic()
+                tag = message[:1]
+                if tag == _FRAMES:
+                    count += self.devices[index]._apply_frames(memoryview(message)[1:])
+                elif tag == _READY:
+                    self.devices[index].realtime_report = pickle.loads(message[1:])[3]
+                    worker.ready = True
+                    if self.on_reconnect is not None:
+                        self.on_reconnect(self.devices[index])
+                elif tag == _ERROR:
+                    logger.warning(
+                        "Worker for '%s' failed: %s",
+                        worker.path,
+                        message[1:].decode(errors="replace"),
+                    )
+        except (EOFError, OSError):
+            self._worker_lost(index)
+        else:
+            if time.monotonic() - worker.last_seen > self.heartbeat_timeout:
+                self._worker_lost(index, hung=True)
+        return count
+
+    # -------------------------------------------------------------------------
+    # Worker lifecycle
+    # -------------------------------------------------------------------------
+
+    def _worker_lost(self, index: int, hung: bool = False) -> None:
+        """Reset a device whose worker exited or hung; reaping does not block."""
+        worker = self._workers[index]
+        worker.conn.close()
+        worker.conn = None
+        process = worker.process
+        if hung:
+            process.terminate()
+        process.join(0)
+        was_ready = worker.ready
+        worker.ready = False
+        worker.restart_at = time.monotonic() + self.restart_delay
+        device = self.devices[index]
+        device._reset_to_rest()
+        if hung:
+            reason = f"sent nothing for {self.heartbeat_timeout} s and was terminated"
+        elif process.exitcode is not None:
+            reason = f"exited (exit code {process.exitcode})"
+        else:
+            reason = "closed its pipe"
+        logger.warning(
+            "Worker for '%s' %s%s", worker.path, reason, "; restarting" if self.restart else ""
+        )
+        if was_ready and self.on_disconnect is not None:
+            self.on_disconnect(device)
+
+    def _check_heartbeats(self) -> None:
+        """Treat workers that sent nothing for heartbeat_timeout as lost."""
+        now = time.monotonic()
+        for index, worker in enumerate(self._workers):
+            if worker.conn is not None and now - worker.last_seen > self.heartbeat_timeout:
+                self._worker_lost(index, hung=True)
+
+    def _restart_due(self) -> None:
+        if not self.restart:
+            return
+        now = time.monotonic()
+        for index, worker in enumerate(self._workers):
+            if worker.conn is None and not worker.stopped and now >= worker.restart_at:
+                process = worker.process
+                if process.exitcode is None:
+                    process.join(0)
+                if process.exitcode is None:
+                    # Not exited yet: escalate once the grace period is over,
+                    # and respawn only after it is gone
+                    if now >= worker.restart_at + _KILL_GRACE:
+                        process.kill()
+                    continue
+                self._spawn(worker)
+                self.devices[index].restarts += 1
+
+    def _stop_worker(self, index: int) -> None:
+        worker = self._workers[index]
+        worker.stopped = True
+        worker.ready = False
+        if worker.conn is not None:
+            try:
+                worker.conn.send_bytes(_STOP)
+            except OSError:
+                pass
+            worker.conn.close()
+            worker.conn = None
+        if worker.process is not None:
+            worker.process.join(timeout=1.0)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+
+    def close(self) -> None:
+        """Stop all workers."""
+        for index in range(len(self._workers)):
+            self._stop_worker(index)
@@ -0,0 +1,126 @@
+"""Per-axis prediction of SpaceMouse values at arbitrary timestamps.
+
+A render loop samples the device at its own frame times, which drift
+against the device's report cadence. AxisPredictor keeps the last three
+samples of every axis (stamped with the jitter-smoothed report time) and
+evaluates a linear or quadratic model at the requested time:
+
+- between stored samples the value is interpolated linearly,
+- after the last sample it is extrapolated, at most horizon seconds ahead,
+  never across zero (a release does not overshoot to the other side), and
+  clamped to [-clamp, clamp].
+
+SpaceMouseDevice.enable_prediction() feeds a predictor from the read path,
+and SpaceMouseDevice.sample_at(t) queries it.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from .types import SpaceMouseState
+
+PREDICTION_MODELS = ("linear", "quadratic")
+
+# (t, value) samples of one axis, oldest first, at most three
+_History = Tuple[Tuple[float, float], ...]
+
+
+class AxisPredictor:
+    """Short per-axis history with linear/quadratic extrapolation.
+
+    Each update replaces an axis' history tuple in one assignment, so a
+    render thread calling predict() never sees a half-updated history.
+
+    Attributes:
+        model: "linear" or "quadratic"
+        horizon: Maximum extrapolation beyond the last sample, in seconds
+        clamp: Absolute limit of predicted values, or None
+    """
+
+    __slots__ = ("model", "horizon", "clamp", "_history")
+
+    def __init__(
+        self, model: str = "linear", horizon: float = 0.05, clamp: Optional[float] = 1.0
+    ) -> None:
+        """Initialize the predictor.
+
+        Args:
+            model: "linear" (last two samples) or "quadratic" (last three)
+            horizon: Maximum extrapolation beyond the last sample, in seconds
+            clamp: Absolute limit of predicted values (None to disable)
+
+        Raises:
+            ValueError: If the model is unknown or horizon is negative.
+        """
+        if model not in PREDICTION_MODELS:
+            raise ValueError(f"Unknown model: '{model}'. Available: {list(PREDICTION_MODELS)}")
+        if horizon < 0:
+            raise ValueError("horizon must be >= 0")
+        self.model = model
+        self.horizon = horizon
+        self.clamp = clamp
+        self._history: Dict[str, _History] = {}
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._history = {}
+
+    def update(self, axes: Iterable[tuple], state: SpaceMouseState) -> None:
+        """Record new samples for the axes decoded from one report.
+
+        Args:
+            axes: Decode entries of the report, each starting with the axis name
+            state: State after decoding the report
+        """
+        t = state.t_smoothed if state.t_smoothed >= 0 else state.t
+        history = self._history
+        for entry in axes:
+            name = entry[0]
+            history[name] = history.get(name, ())[-2:] + ((t, getattr(state, name)),)
+
+    def predict(self, axis: str, t: float, default: float = 0.0) -> float:
+        """Return the value of axis at time t (default if it has no samples)."""
+        h = self._history.get(axis)
+        if not h:
+            return default
+        t_last, v_last = h[-1]
+
+        if t <= t_last:
+            # Interpolate between the stored samples
+            if t <= h[0][0]:
+                return h[0][1]
+            for (t0, v0), (t1, v1) in zip(h, h[1:]):
+                if t <= t1:
+                    return v0 + (v1 - v0) * (t - t0) / (t1 - t0) if t1 > t0 else v1
+            return v_last
+
+        if len(h) < 2:
+            return v_last
+        target = t_last + min(t - t_last, self.horizon)
+        if self.model == "quadratic" and len(h) == 3:
+            (t0, v0), (t1, v1), (t2, v2) = h
+            if t0 < t1 < t2:
+                # Lagrange polynomial through the three samples
+                value = (
+                    v0 * (target - t1) * (target - t2) / ((t0 - t1) * (t0 - t2))
+                    + v1 * (target - t0) * (target - t2) / ((t1 - t0) * (t1 - t2))
+                    + v2 * (target - t0) * (target - t1) / ((t2 - t0) * (t2 - t1))
+                )
+            else:
+                value = v_last
+        else:
+            t0, v0 = h[-2]
+            value = (
+                v_last + (v_last - v0) * (target - t_last) / (t_last - t0)
+                if t_last > t0
+                else v_last
+            )
+
+        if v_last == 0 or value * v_last < 0:
+            # Do not extrapolate out of the center or across it
+            value = 0.0
+        clamp = self.clamp
+        if clamp is not None:
+            value = max(-clamp, min(clamp, value))
+        return value
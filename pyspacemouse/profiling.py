@@ -0,0 +1,154 @@
+"""Per-callback profiling for PySpaceMouse.
+
+When profiling is enabled on a SpaceMouseDevice, every registered callback
+is wrapped in a timing wrapper when the callbacks are applied. With
+profiling disabled the raw callbacks are stored instead, so the read path
+is exactly the same as without this module.
+
+    device.enable_profiling(budget=0.002)
+    ...
+    for profile in device.callback_profiles():
+        print(profile.name, profile.calls, profile.p99)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from .stats import _NUM_BUCKETS, _bucket, _percentile
+
+logger = logging.getLogger("pyspacemouse")
+
+
+@dataclass(frozen=True)
+class CallbackProfile:
+    """Timing summary of one registered callback (durations in seconds).
+
+    Attributes:
+        name: Where the callback is registered and its qualified name,
+            e.g. "dof_callbacks[0] (x): on_x"
+        calls: Number of invocations
+        total: Total time spent in the callback
+        mean: Mean duration per call
+        p99: 99th percentile duration (histogram upper bound)
+        max: Longest single call
+        over_budget: Number of calls that exceeded the time budget
+    """
+
+    name: str
+    calls: int
+    total: float
+    mean: float
+    p99: float
+    max: float
+    over_budget: int
+
+
+class _TimedCallback:
+    """Callable wrapper that times each call of the wrapped callback."""
+
+    __slots__ = ("fn", "name", "profiler", "calls", "total_ns", "max_ns", "over_budget", "hist")
+
+    def __init__(self, fn: Callable, name: str, profiler: CallbackProfiler) -> None:
+        self.fn = fn
+        self.name = name
+        self.profiler = profiler
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.over_budget = 0
+        self.hist = [0] * _NUM_BUCKETS
+
+    def __call__(self, *args):
+        start = time.perf_counter_ns()
+        try:
+            return self.fn(*args)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            self.calls += 1
+            self.total_ns += elapsed
+            if elapsed > self.max_ns:
+                self.max_ns = elapsed
+            self.hist[min(_bucket(elapsed), _NUM_BUCKETS - 1)] += 1
+            if elapsed > self.profiler.budget_ns:
+                self.over_budget += 1
+                self.profiler._over_budget(self, elapsed)
+
+    def profile(self) -> CallbackProfile:
+        """Return a snapshot of this callback's timings."""
+        return CallbackProfile(
+            name=self.name,
+            calls=self.calls,
+            total=self.total_ns * 1e-9,
+            mean=self.total_ns / self.calls * 1e-9 if self.calls else 0.0,
+            p99=_percentile(self.hist, 0.99),
+            max=self.max_ns * 1e-9,
+            over_budget=self.over_budget,
+        )
+
+
+class CallbackProfiler:
+    """Creates timing wrappers and reports callbacks that exceed a time budget.
+
+    Attributes:
+        budget_ns: Per-call time budget in nanoseconds
+        warn_interval: Minimum seconds between warnings for the same callback
+    """
+
+    __slots__ = ("budget_ns", "warn_interval", "_wrappers", "_last_warning")
+
+    def __init__(self, budget: float = 0.001, warn_interval: float = 1.0) -> None:
+        """Initialize the profiler.
+
+        Args:
+            budget: Per-call time budget in seconds
+            warn_interval: Minimum seconds between warnings for the same callback
+        """
+        self.budget_ns = int(budget * 1e9)
+        self.warn_interval = warn_interval
+        # Wrappers by (id of the wrapped callback, name); a wrapper keeps its
+        # callback alive, so the id is not reused while the entry exists
+        self._wrappers: Dict[Tuple[int, str], _TimedCallback] = {}
+        self._last_warning: dict = {}
+
+    def wrap(self, fn: Callable, name: str) -> _TimedCallback:
+        """Wrap a callback, reusing the existing wrapper for the same slot."""
+        key = (id(fn), name)
+        wrapper = self._wrappers.get(key)
+        if wrapper is None:
+            wrapper = _TimedCallback(fn, name, self)
+            self._wrappers[key] = wrapper
+        return wrapper
+
+    def retain(self, wrappers: List[_TimedCallback]) -> None:
+        """Forget wrappers of callbacks that are no longer registered."""
+        keep = {id(wrapper) for wrapper in wrappers}
+        self._wrappers = {
+            key: wrapper for key, wrapper in self._wrappers.items() if id(wrapper) in keep
+        }
+
+    def profiles(self) -> List[CallbackProfile]:
+        """Return snapshots for all registered callbacks."""
+        return [wrapper.profile() for wrapper in self._wrappers.values()]
+
+    def _over_budget(self, wrapper: _TimedCallback, elapsed_ns: int) -> None:
+        now = time.monotonic()
+        if now - self._last_warning.get(wrapper.name, -self.warn_interval) < self.warn_interval:
+            return
+        self._last_warning[wrapper.name] = now
+        logger.warning(
+            "Slow SpaceMouse callback %s took %.3f ms (budget %.3f ms, %d of %d calls over)",
+            wrapper.name,
+            elapsed_ns * 1e-6,
+            self.budget_ns * 1e-6,
+            wrapper.over_budget,
+            wrapper.calls,
+        )
+
+
+def callback_name(slot: str, fn: Callable) -> str:
+    """Build a readable profile name from a registration slot and a callable."""
+    return f"{slot}: {getattr(fn, '__qualname__', None) or repr(fn)}"
@@ -1,9 +1,15 @@
 """PySpaceMouse command-line interface."""
 
 import argparse
-import time
+import contextlib
+import json
+import os
+import sys
 
 import pyspacemouse
+from pyspacemouse.bench import run_benchmark
+from pyspacemouse.dump import DUMP_FORMATS, StateDumper
+from pyspacemouse.synthetic import SyntheticHIDDevice
 
 
 def print_version_cli():
@@ -55,22 +61,111 @@ def test_connect_cli():
             print(f"Connected to: {device.name}")
             print("Reading x, y, z values (Ctrl+C to exit)...")
             print("Move the SpaceMouse to see values")
-            time.sleep(0.5)
 
-            while True:
-                state = device.read()
+            def show(state):
                 if state.has_motion():
                     print(
                         f"x={state.x:+.2f} y={state.y:+.2f} z={state.z:+.2f} "
                         f"roll={state.roll:+.2f} pitch={state.pitch:+.2f} yaw={state.yaw:+.2f}"
                     )
 
+            # Polls quickly while the device is moved and backs off at rest
+            device.run(show)
+
     except RuntimeError as e:
         print(f"Failed to open SpaceMouse: {e}")
     except KeyboardInterrupt:
         print("\nExiting...")
 
 
+def open_bench_device(synthetic=False, axis_convention="hid", log=None, fallback=True):
+    """Open the first connected device, or a synthetic stand-in if none is found.
+
+    Status messages go to log (default: stdout). With fallback=False a
+    missing device raises RuntimeError instead, unless synthetic is set.
+    """
+    log = log or sys.stdout
+    if not synthetic:
+        try:
+            with contextlib.redirect_stdout(log):
+                return pyspacemouse.open(axis_convention=axis_convention), False
+        except RuntimeError as e:
+            if not fallback:
+                raise
+            print(f"No SpaceMouse available ({e}); using a synthetic device.", file=log)
+
+    info = pyspacemouse.get_device_specs()["SpaceMousePro"]
+    device = pyspacemouse.SpaceMouseDevice(
+        info=pyspacemouse.apply_axis_convention(info, pyspacemouse.AxisConvention(axis_convention)),
+        device=SyntheticHIDDevice(info),
+    )
+    device.open()
+    return device, True
+
+
+def bench_cli(duration=5.0, synthetic=False, as_json=False):
+    """Benchmark report rate and latency of the first available device."""
+    device, is_synthetic = open_bench_device(synthetic)
+    with device:
+        if not is_synthetic:
+            print(f"Benchmarking {device.name} for {duration:.1f} s - keep moving the SpaceMouse")
+        result = run_benchmark(device, duration=duration, synthetic=is_synthetic)
+
+    if as_json:
+        print(json.dumps(result.as_dict(), indent=2))
+    else:
+        print(result.summary())
+
+
+def dump_cli(fmt="ndjson", rate=None, axes=None, convention="hid", duration=None, synthetic=False):
+    """Stream every decoded state of the first available device to stdout.
+
+    Status messages go to stderr so stdout carries only the dump. Output is
+    block-buffered; it is flushed on exit. Unlike --bench, a missing device
+    is an error: the synthetic device is only used when synthetic is set,
+    so its made-up motion never reaches a pipe in place of real input.
+
+    Raises:
+        RuntimeError: If synthetic is not set and no SpaceMouse can be opened.
+    """
+    sys.stdout.flush()
+    try:
+        out = open(sys.stdout.fileno(), "wb", buffering=1 << 16, closefd=False)
+        own_out = True
+    except (AttributeError, OSError, ValueError):
+        # stdout is not backed by a file descriptor (e.g. captured)
+        out = sys.stdout.buffer
+        own_out = False
+    axes = [a.strip() for a in axes.split(",")] if axes else pyspacemouse.AXIS_NAMES
+    dumper = StateDumper(out, fmt=fmt, axes=axes, rate=rate)
+
+    try:
+        device, _ = open_bench_device(
+            synthetic, axis_convention=convention, log=sys.stderr, fallback=False
+        )
+        try:
+            with device:
+                device.configure(callback=dumper)
+                dumper.write_header()
+                # Non-blocking reads with adaptive sleeps: a device at rest
+                # sends no reports, which must not hold the loop past the
+                # duration or keep Ctrl+C from being handled
+                device.run(duration=duration)
+        except KeyboardInterrupt:
+            pass
+        out.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head): send what is still
+        # buffered in out and sys.stdout to /dev/null instead of failing
+        # again when they are flushed
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+    finally:
+        if own_out:
+            out.close()
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -92,6 +187,43 @@ def main():
     parser.add_argument(
         "--test", action="store_true", help="Test connection to first available device"
     )
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="Measure report rate, latency and CPU usage of the first available device",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        help="Benchmark/dump duration in seconds (default: 5 for --bench, unlimited for --dump)",
+    )
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="Use a synthetic device instead of hardware for --bench/--dump",
+    )
+    parser.add_argument("--json", action="store_true", help="Print benchmark results as JSON")
+    parser.add_argument(
+        "--dump",
+        choices=DUMP_FORMATS,
+        help="Stream every decoded state to stdout as ndjson, csv or packed binary "
+        "(little-endian float64 t, float32 per axis, uint32 buttons)",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=None, help="Limit --dump output to this many states/s"
+    )
+    parser.add_argument(
+        "--axes",
+        default=None,
+        help="Comma-separated axes for --dump (default: x,y,z,roll,pitch,yaw)",
+    )
+    parser.add_argument(
+        "--convention",
+        choices=[c.value for c in pyspacemouse.AxisConvention],
+        default="hid",
+        help="Axis convention for --dump (default: hid)",
+    )
 
     args = parser.parse_args()
 
@@ -105,6 +237,23 @@ def main():
         list_all_hid_devices_cli()
     elif args.test:
         test_connect_cli()
+    elif args.bench:
+        duration = 5.0 if args.duration is None else args.duration
+        bench_cli(duration=duration, synthetic=args.synthetic, as_json=args.json)
+    elif args.dump:
+        try:
+            dump_cli(
+                fmt=args.dump,
+                rate=args.rate,
+                axes=args.axes,
+                convention=args.convention,
+                duration=args.duration,
+                synthetic=args.synthetic,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        except RuntimeError as e:
+            sys.exit(f"Error: no SpaceMouse to dump ({e}); use --synthetic for a synthetic device")
     else:
         parser.print_help()
 
@@ -0,0 +1,200 @@
+"""Real-time scheduling options for reader threads.
+
+Report-to-callback latency on a loaded machine is often dominated by the
+scheduler rather than by decoding. RealtimeOptions describes what a reader
+thread may request: a CPU set, a real-time scheduling policy, locked memory
+and a paused garbage collector. Every setting is best effort. Settings
+that are not permitted (e.g. SCHED_FIFO without CAP_SYS_NICE) or not
+supported on the platform are skipped with a warning, and the returned
+RealtimeReport says what took effect:
+
+    options = RealtimeOptions(cpus=[3], policy="fifo", priority=50, disable_gc=True)
+    stats = device.run(callback, stop=stop, realtime=options)
+    print(stats.realtime)
+
+The same options are accepted by Resampler and DevicePool (applied in each
+worker process). They can also be applied to any thread with
+realtime_scope():
+
+    with realtime_scope(options) as report:
+        reader_loop()
+
+Affinity and scheduling policy apply to the calling thread (Linux); memory
+locking and the garbage collector affect the whole process.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import gc
+import logging
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Tuple
+
+logger = logging.getLogger("pyspacemouse")
+
+REALTIME_POLICIES = ("fifo", "rr")
+
+# mlockall() flags (Linux)
+_MCL_CURRENT = 1
+_MCL_FUTURE = 2
+
+
+@dataclass(frozen=True)
+class RealtimeOptions:
+    """Scheduling settings requested for a reader thread.
+
+    Attributes:
+        cpus: CPUs the thread may run on (None: unchanged)
+        policy: "fifo" (SCHED_FIFO) or "rr" (SCHED_RR), or None for unchanged
+        priority: Real-time priority for the policy (1-99 on Linux)
+        lock_memory: Lock current and future pages in RAM (mlockall), so the
+            loop never waits for page faults
+        disable_gc: Pause the cyclic garbage collector while the loop runs
+    """
+
+    cpus: Optional[Tuple[int, ...]] = None
+    policy: Optional[str] = None
+    priority: int = 10
+    lock_memory: bool = False
+    disable_gc: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the options."""
+        if self.policy is not None and self.policy not in REALTIME_POLICIES:
+            raise ValueError(
+                f"Unknown policy: '{self.policy}'. Available: {list(REALTIME_POLICIES)}"
+            )
+        if self.cpus is not None:
+            object.__setattr__(self, "cpus", tuple(self.cpus))
+            if not self.cpus:
+                raise ValueError("cpus must not be empty")
+
+
+@dataclass(frozen=True)
+class RealtimeReport:
+    """Settings that took effect for a reader thread.
+
+    Attributes:
+        cpus: CPU set now in effect, or None if unchanged
+        policy: Policy now in effect ("fifo"/"rr"), or None if unchanged
+        priority: Real-time priority in effect, or None
+        memory_locked: Whether mlockall() succeeded
+        gc_disabled: Whether the garbage collector was paused
+        errors: One message per requested setting that could not be applied
+    """
+
+    cpus: Optional[Tuple[int, ...]] = None
+    policy: Optional[str] = None
+    priority: Optional[int] = None
+    memory_locked: bool = False
+    gc_disabled: bool = False
+    errors: Tuple[str, ...] = field(default=())
+
+    @property
+    def complete(self) -> bool:
+        """Whether every requested setting was applied."""
+        return not self.errors
+
+
+def _mlockall() -> None:
+    """Lock all current and future pages of the process in memory."""
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    if not hasattr(libc, "mlockall"):
+        raise OSError("mlockall() is not available on this platform")
+    if libc.mlockall(_MCL_CURRENT | _MCL_FUTURE) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+
+def _munlockall() -> None:
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    libc.munlockall()
+
+
+@contextmanager
+def realtime_scope(options: Optional[RealtimeOptions]) -> Iterator[Optional[RealtimeReport]]:
+    """Apply options to the calling thread and restore the previous settings on exit.
+
+    Args:
+        options: Settings to request (None: do nothing and yield None)
+
+    Yields:
+        RealtimeReport describing what took effect.
+    """
+    if options is None:
+        yield None
+        return
+
+    errors = []
+    restore = []
+
+    cpus = None
+    if options.cpus is not None:
+        try:
+            previous_cpus = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, options.cpus)
+            cpus = tuple(sorted(os.sched_getaffinity(0)))
+            restore.append(lambda: os.sched_setaffinity(0, previous_cpus))
+        except AttributeError:
+            errors.append("CPU affinity is not supported on this platform")
+        except OSError as e:
+            errors.append(f"CPU affinity {list(options.cpus)}: {e.strerror or e}")
+
+    policy = priority = None
+    if options.policy is not None:
+        try:
+            sched = os.SCHED_FIFO if options.policy == "fifo" else os.SCHED_RR
+            previous_policy = os.sched_getscheduler(0)
+            previous_param = os.sched_getparam(0)
+            os.sched_setscheduler(0, sched, os.sched_param(options.priority))
+            policy, priority = options.policy, options.priority
+            restore.append(lambda: os.sched_setscheduler(0, previous_policy, previous_param))
+        except AttributeError:
+            errors.append("Real-time scheduling is not supported on this platform")
+        except OSError as e:
+            errors.append(
+                f"Scheduling policy '{options.policy}' priority {options.priority}: "
+                f"{e.strerror or e} (needs CAP_SYS_NICE or an rtprio limit)"
+            )
+
+    memory_locked = False
+    if options.lock_memory:
+        try:
+            _mlockall()
+            memory_locked = True
+            restore.append(_munlockall)
+        except OSError as e:
+            errors.append(
+                f"Memory locking: {e.strerror or e} (needs CAP_IPC_LOCK or a memlock limit)"
+            )
+
+    gc_disabled = False
+    if options.disable_gc:
+        if gc.isenabled():
+            gc.disable()
+            restore.append(gc.enable)
+        gc_disabled = True
+
+    for error in errors:
+        logger.warning("Real-time option not applied: %s", error)
+
+    report = RealtimeReport(
+        cpus=cpus,
+        policy=policy,
+        priority=priority,
+        memory_locked=memory_locked,
+        gc_disabled=gc_disabled,
+        errors=tuple(errors),
+    )
+    try:
+        yield report
+    finally:
+        for undo in reversed(restore):
+            try:
+                undo()
+            except OSError:
+                pass  # E.g. the previous CPU set went offline
@@ -0,0 +1,207 @@
+"""Fixed-rate resampling of SpaceMouse reports.
+
+A SpaceMouse only reports while it is moved, and translation and rotation
+may arrive as separate reports. Resampler turns that event stream into a
+strictly periodic one: on every tick of an absolute schedule (no
+accumulated drift) it evaluates the device at the tick time and calls the
+callback with a new state.
+
+    def on_sample(state):
+        controller.command(state.x, state.y, state.z)
+
+    resampler = Resampler(device, rate=500.0, callback=on_sample, mode="interpolate")
+    resampler.start()      # timer thread
+    ...
+    resampler.stop()
+
+    # or, in an asyncio application:
+    task = asyncio.create_task(resampler.run_async())
+
+Modes:
+    hold: zero-order hold of the last report
+    interpolate: linear interpolation between reports, evaluated `delay`
+                 seconds in the past so the report after the tick is known
+
+With a timeout, axes decay linearly to zero over `decay` seconds once no
+report arrived for `timeout` seconds (e.g. when a device stops reporting
+without sending a final zero report).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .fusion import DeviceFuser
+from .realtime import RealtimeOptions, RealtimeReport, realtime_scope
+from .types import AXIS_NAMES, SpaceMouseState
+
+if TYPE_CHECKING:
+    from .device import SpaceMouseDevice
+
+
+class Resampler:
+    """Calls a callback with the device state at a fixed rate.
+
+    Attributes:
+        rate: Samples per second
+        ticks: Samples produced
+        missed: Ticks skipped because the loop fell more than one period behind
+        realtime_report: Real-time settings in effect for the last run()
+            (None if none were requested)
+    """
+
+    def __init__(
+        self,
+        device: SpaceMouseDevice,
+        rate: float,
+        callback: Callable[[SpaceMouseState], None],
+        mode: str = "hold",
+        delay: Optional[float] = None,
+        timeout: Optional[float] = None,
+        decay: float = 0.0,
+        poll: bool = True,
+        spin: float = 0.0002,
+        realtime: Optional[RealtimeOptions] = None,
+    ) -> None:
+        """Initialize the resampler.
+
+        Args:
+            device: Device to resample (non-blocking)
+            rate: Samples per second
+            callback: Called with a new SpaceMouseState on every tick
+            mode: "hold" (zero-order hold) or "interpolate" (linear)
+            delay: How far in the past samples are evaluated (default: 0 for
+                   hold, two sample periods for interpolate)
+            timeout: Seconds without a report after which axes decay to zero
+                     (None to hold forever)
+            decay: Seconds over which axes ramp to zero after the timeout
+            poll: If True, read the device on every tick. Set to False when
+                  another thread reads the device.
+            spin: Busy-wait this many seconds before each tick instead of
+                  sleeping, for tick precision below the OS sleep granularity
+            realtime: CPU affinity, scheduling policy, memory locking and GC
+                      settings applied by run() and the timer thread (best
+                      effort, see RealtimeOptions)
+
+        Raises:
+            ValueError: If rate is not positive or the mode is unknown.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.callback = callback
+        self.delay = delay if delay is not None else (2.0 / rate if mode == "interpolate" else 0.0)
+        self.timeout = timeout
+        self.decay = decay
+        self.poll = poll
+        self.spin = spin
+        self.ticks = 0
+        self.missed = 0
+        self.realtime = realtime
+        self.realtime_report: Optional[RealtimeReport] = None
+
+        self._fuser = DeviceFuser([device], mode=mode, delay=self.delay)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._next = 0.0
+
+    @property
+    def period(self) -> float:
+        """Sample period in seconds."""
+        return 1.0 / self.rate
+
+    def close(self) -> None:
+        """Stop the timer and detach from the device."""
+        self.stop()
+        self._fuser.close()
+
+    def __enter__(self) -> Resampler:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Sampling
+    # -------------------------------------------------------------------------
+
+    def sample(self, t: float) -> SpaceMouseState:
+        """Return the resampled state for tick time t."""
+        if self.poll:
+            self._fuser.poll()
+        frame = self._fuser.frame(t - self.delay)
+        state = frame.states[0]
+        age = frame.ages[0]
+        if self.timeout is not None and age > self.timeout:
+            remaining = 1.0 - (age - self.timeout) / self.decay if self.decay > 0 else 0.0
+            factor = max(remaining, 0.0)
+            for axis in AXIS_NAMES:
+                setattr(state, axis, getattr(state, axis) * factor)
+        state.t = t
+        state.t_ns = int(t * 1e9)
+        state.t_smoothed = t
+        return state
+
+    def _tick(self) -> float:
+        """Produce one sample and return how long to wait for the next tick."""
+        now = time.perf_counter()
+        period = 1.0 / self.rate
+        if now - self._next > period:
+            # More than one period behind: skip the missed ticks
+            skipped = int((now - self._next) / period)
+            self.missed += skipped
+            self._next += skipped * period
+        self.callback(self.sample(self._next))
+        self.ticks += 1
+        self._next += period
+        return self._next - time.perf_counter()
+
+    # -------------------------------------------------------------------------
+    # Drivers
+    # -------------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Produce samples in the calling thread until stop() is called."""
+        if threading.current_thread() is not self._thread:
+            self._stop.clear()
+        with realtime_scope(self.realtime) as report:
+            self.realtime_report = report
+            self._next = time.perf_counter()
+            while not self._stop.is_set():
+                wait = self._tick()
+                if wait > self.spin:
+                    self._stop.wait(wait - self.spin)
+                target = self._next
+                while time.perf_counter() < target and not self._stop.is_set():
+                    pass
+
+    async def run_async(self) -> None:
+        """Produce samples from an asyncio task until stop() is called or it is cancelled."""
+        self._stop.clear()
+        self._next = time.perf_counter()
+        while not self._stop.is_set():
+            wait = self._tick()
+            await asyncio.sleep(max(wait, 0.0))
+
+    def start(self) -> None:
+        """Produce samples on a background timer thread.
+
+        Raises:
+            RuntimeError: If the resampler is already running.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("Resampler is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="Resampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop producing samples and wait for the timer thread to exit."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
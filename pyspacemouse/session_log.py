@@ -0,0 +1,300 @@
+"""Chunked columnar session logging for SpaceMouse devices.
+
+SessionLogger attaches to one or more SpaceMouseDevice objects as a
+listener and copies every decoded state into preallocated column arrays.
+Full chunks are handed to a background thread that writes them as a
+Parquet row group (when pyarrow is installed) or as a directory of .npy
+segments otherwise:
+
+    with SessionLogger("session.parquet") as logger:
+        logger.attach(device)
+        while running:
+            device.read()
+
+The read path only stores nine numbers per state and never waits for the
+writer: memory is bounded by max_chunks, and states arriving while every
+chunk is queued for writing are dropped and counted in `dropped`. Devices
+attached to one logger may be read from different threads; appending a
+state and rolling over to the next chunk are serialized by a short lock.
+
+Columns: t (float64, seconds), x, y, z, roll, pitch, yaw (float64),
+buttons (uint64 bitmask, see ButtonState.__int__), name and serial of the
+device. In the .npy layout name and serial are stored once in
+devices.json and referenced by the uint8 `device` column.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+from array import array
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .types import AXIS_NAMES, SpaceMouseState
+
+if TYPE_CHECKING:
+    from .device import SpaceMouseDevice
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    pq = None
+
+LOG_FORMATS = ("parquet", "npy")
+
+# Float columns, in order
+COLUMNS = ("t", *AXIS_NAMES)
+
+_MAX_DEVICES = 256
+_ENDIAN = "<" if sys.byteorder == "little" else ">"
+
+
+class _Chunk:
+    """Preallocated column storage for chunk_size states."""
+
+    __slots__ = ("columns", "buttons", "device", "count")
+
+    def __init__(self, size: int) -> None:
+        self.columns = [array("d", bytes(8 * size)) for _ in COLUMNS]
+        self.buttons = array("Q", bytes(8 * size))
+        self.device = array("B", bytes(size))
+        self.count = 0
+
+
+def _write_npy(path: str, descr: str, data: memoryview) -> None:
+    """Write a 1-D array to an .npy file (format version 1.0)."""
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (descr, len(data))
+    # Magic (6) + version (2) + header length (2) + header + newline, 64-byte aligned
+    padding = -(10 + len(header) + 1) % 64
+    header = header + " " * padding + "\n"
+    with open(path, "wb") as f:
+        f.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1"))
+        f.write(data)
+
+
+class SessionLogger:
+    """Buffers decoded states in columnar chunks and writes them in the background.
+
+    Attributes:
+        path: Output file (parquet) or directory (npy)
+        format: "parquet" or "npy"
+        chunk_size: States per chunk (one Parquet row group or .npy segment)
+        max_chunks: Number of chunks allocated; bounds memory use
+        rows_written: States written to disk so far
+        dropped: States dropped because the writer was behind
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = 4096,
+        max_chunks: int = 4,
+        format: Optional[str] = None,
+    ) -> None:
+        """Create the logger and start its writer thread.
+
+        Args:
+            path: Output .parquet file, or directory for .npy segments
+            chunk_size: States per chunk
+            max_chunks: Number of chunks to allocate (at least 2, so one can
+                        be filled while another is written)
+            format: "parquet", "npy", or None to use parquet when pyarrow
+                    is installed and npy otherwise
+
+        Raises:
+            ValueError: If an argument is out of range or the format is unknown.
+            ImportError: If format is "parquet" and pyarrow is not installed.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if max_chunks < 2:
+            raise ValueError("max_chunks must be >= 2")
+        if format is None:
+            format = "parquet" if pa is not None else "npy"
+        if format not in LOG_FORMATS:
+            raise ValueError(f"Unknown format: '{format}'. Available: {list(LOG_FORMATS)}")
+        if format == "parquet" and pa is None:
+            raise ImportError("Parquet logging requires pyarrow: pip install pyarrow")
+
+        self.path = os.fspath(path)
+        self.format = format
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.rows_written = 0
+        self.dropped = 0
+
+        self._devices: List[Tuple[str, str]] = []
+        self._listeners: Dict[int, Tuple[SpaceMouseDevice, Callable]] = {}
+        self._free: queue.SimpleQueue = queue.SimpleQueue()
+        for _ in range(max_chunks - 1):
+            self._free.put(_Chunk(chunk_size))
+        self._current: Optional[_Chunk] = _Chunk(chunk_size)
+        # Serializes appends and rollovers of the current chunk (and dropped)
+        # when attached devices are read from several threads
+        self._append_lock = threading.Lock()
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+        self._segments = 0
+        self._parquet_writer = None
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        if format == "npy":
+            os.makedirs(self.path, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="SessionLogger", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> SessionLogger:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Read path
+    # -------------------------------------------------------------------------
+
+    def attach(self, device: SpaceMouseDevice) -> None:
+        """Start logging every state processed by device.
+
+        Raises:
+            RuntimeError: If the logger is closed.
+            ValueError: If the device is already attached or too many
+                        devices were attached.
+        """
+        if self._closed:
+            raise RuntimeError("SessionLogger is closed")
+        if id(device) in self._listeners:
+            raise ValueError(f"{device.name} is already attached")
+        if len(self._devices) >= _MAX_DEVICES:
+            raise ValueError(f"At most {_MAX_DEVICES} devices can be logged per session")
+
+        index = len(self._devices)
+        self._devices.append((device.name, device.serial_number))
+
+        def listener(state: SpaceMouseState) -> None:
+            self._append(state, index)
+
+        device.add_listener(listener)
+        self._listeners[id(device)] = (device, listener)
+
+    def detach(self, device: SpaceMouseDevice) -> None:
+        """Stop logging device (already buffered states are kept)."""
+        entry = self._listeners.pop(id(device), None)
+        if entry is not None:
+            device.remove_listener(entry[1])
+
+    def _append(self, state: SpaceMouseState, device_index: int) -> None:
+        buttons = int(state.buttons)
+        with self._append_lock:
+            chunk = self._current
+            if chunk is None:
+                try:
+                    chunk = self._current = self._free.get_nowait()
+                except queue.Empty:
+                    self.dropped += 1
+                    return
+
+            i = chunk.count
+            t, x, y, z, roll, pitch, yaw = chunk.columns
+            t[i] = state.t
+            x[i] = state.x
+            y[i] = state.y
+            z[i] = state.z
+            roll[i] = state.roll
+            pitch[i] = state.pitch
+            yaw[i] = state.yaw
+            chunk.buttons[i] = buttons
+            chunk.device[i] = device_index
+            chunk.count = i + 1
+
+            if chunk.count == self.chunk_size:
+                self._pending.put(chunk)
+                self._current = None
+
+    def flush(self) -> None:
+        """Queue the partially filled chunk for writing (from any thread)."""
+        with self._append_lock:
+            chunk = self._current
+            if chunk is not None and chunk.count:
+                self._pending.put(chunk)
+                self._current = None
+
+    def close(self) -> None:
+        """Detach all devices, write the remaining states and stop the writer.
+
+        Raises:
+            Exception: The first error raised by the writer thread, if any.
+        """
+        if not self._closed:
+            self._closed = True
+            for device, _ in list(self._listeners.values()):
+                self.detach(device)
+            self.flush()
+            self._pending.put(None)
+            self._thread.join()
+            if self._parquet_writer is not None:
+                self._parquet_writer.close()
+                self._parquet_writer = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            chunk = self._pending.get()
+            if chunk is None:
+                return
+            try:
+                if self._error is None:
+                    if self.format == "parquet":
+                        self._write_parquet(chunk)
+                    else:
+                        self._write_npy_segment(chunk)
+                    self.rows_written += chunk.count
+            except Exception as e:  # surfaced by close()
+                self._error = e
+            chunk.count = 0
+            self._free.put(chunk)
+
+    def _write_parquet(self, chunk: _Chunk) -> None:
+        n = chunk.count
+        names = pa.array([name for name, _ in self._devices], pa.string())
+        serials = pa.array([serial for _, serial in self._devices], pa.string())
+        indices = pa.Array.from_buffers(pa.uint8(), n, [None, pa.py_buffer(chunk.device)])
+        arrays = [
+            pa.Array.from_buffers(pa.float64(), n, [None, pa.py_buffer(column)])
+            for column in chunk.columns
+        ]
+        arrays.append(pa.Array.from_buffers(pa.uint64(), n, [None, pa.py_buffer(chunk.buttons)]))
+        arrays.append(pa.DictionaryArray.from_arrays(indices, names))
+        arrays.append(pa.DictionaryArray.from_arrays(indices, serials))
+        table = pa.Table.from_arrays(arrays, names=[*COLUMNS, "buttons", "name", "serial"])
+
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+        self._parquet_writer.write_table(table, row_group_size=n)
+
+    def _write_npy_segment(self, chunk: _Chunk) -> None:
+        n = chunk.count
+        segment = os.path.join(self.path, f"segment-{self._segments:06d}")
+        os.makedirs(segment, exist_ok=True)
+        for name, column in zip(COLUMNS, chunk.columns):
+            _write_npy(os.path.join(segment, f"{name}.npy"), _ENDIAN + "f8", memoryview(column)[:n])
+        _write_npy(
+            os.path.join(segment, "buttons.npy"), _ENDIAN + "u8", memoryview(chunk.buttons)[:n]
+        )
+        _write_npy(os.path.join(segment, "device.npy"), "|u1", memoryview(chunk.device)[:n])
+        devices = [{"name": name, "serial": serial} for name, serial in self._devices]
+        with open(os.path.join(self.path, "devices.json"), "w") as f:
+            json.dump(devices, f, indent=2)
+        self._segments += 1
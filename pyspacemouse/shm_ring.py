@@ -0,0 +1,288 @@
+"""Shared-memory ring of raw HID reports for consumer processes.
+
+The reading process attaches a ReportRing to its device. Every raw report
+is copied, with its receive timestamp, into the next slot of a ring in
+multiprocessing.shared_memory; the producer never waits for consumers.
+Consumer processes open the ring by name with ReportRingReader, keep their
+own cursor and decode the reports with the same DeviceInfo, so they see
+every sample without pickling:
+
+    # Reading process
+    ring = ReportRing(device, slots=4096)
+    print(ring.name)
+    while True:
+        device.read()
+
+    # Consumer process
+    reader = ReportRingReader(name)
+    reader.device.configure(callback=analyze)
+    while True:
+        reader.process()   # decode new reports, running the callbacks
+        ...
+        if reader.lapped:
+            print(f"fell behind, lost {reader.lapped} reports")
+
+Layout: a 192-byte header (magic, geometry, vendor/product ID, device name
+and axis convention, then the total number of reports written) followed by
+`slots` fixed-size slots of (sequence, t_ns, length, data). A slot's
+sequence number is cleared while it is rewritten and set last, which lets a
+consumer detect a slot that was overwritten while it was copying it.
+"""
+
+from __future__ import annotations
+
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, Optional, Tuple
+
+from .config_helpers import apply_axis_convention
+from .device import SpaceMouseDevice
+from .loader import get_device_specs
+from .types import AxisConvention, DeviceInfo
+
+_MAGIC = b"SMRG"
+_VERSION = 1
+
+# magic, version, slot_count, slot_size, vendor_id, product_id, name, convention
+_HEADER = struct.Struct("<4sHIIHH64s16s")
+_WRITE_SEQ = struct.Struct("<Q")
+_WRITE_SEQ_OFFSET = 128
+_SLOTS_OFFSET = 192
+
+# sequence (index + 1, 0 while being written), t_ns, length
+_SLOT = struct.Struct("<QqH")
+_SLOT_DATA_OFFSET = 24
+
+
+def _slot_stride(slot_size: int) -> int:
+    return (_SLOT_DATA_OFFSET + slot_size + 7) & ~7
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without handing it to the resource tracker."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        # Otherwise the consumer's tracker would unlink the segment on exit
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class ReportRing:
+    """Single-producer ring of raw reports in shared memory.
+
+    Attributes:
+        name: Shared memory name to pass to ReportRingReader
+        slots: Number of slots
+        slot_size: Maximum report length in bytes (longer reports are truncated)
+        written: Total number of reports written
+    """
+
+    def __init__(
+        self,
+        device: SpaceMouseDevice,
+        slots: int = 4096,
+        slot_size: int = 64,
+        name: Optional[str] = None,
+        axis_convention: Optional[AxisConvention] = None,
+    ) -> None:
+        """Create the shared memory ring and attach it to device.
+
+        Args:
+            device: Device whose raw reports are published
+            slots: Number of reports kept before the oldest is overwritten
+            slot_size: Maximum report length in bytes
+            name: Shared memory name (default: generated)
+            axis_convention: Convention consumers apply to the device's
+                             TOML spec (default: the device's own convention)
+
+        Raises:
+            ValueError: If slots or slot_size is out of range.
+        """
+        if slots < 1:
+            raise ValueError("slots must be >= 1")
+        if not 1 <= slot_size <= 0xFFFF:
+            raise ValueError("slot_size must be between 1 and 65535")
+
+        info = device.info
+        convention = axis_convention or device.axis_convention
+        self.slots = slots
+        self.slot_size = slot_size
+        self.written = 0
+        self._stride = _slot_stride(slot_size)
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=_SLOTS_OFFSET + slots * self._stride
+        )
+        self.name = self._shm.name
+        self._buf = self._shm.buf
+        _HEADER.pack_into(
+            self._buf,
+            0,
+            _MAGIC,
+            _VERSION,
+            slots,
+            slot_size,
+            info.vendor_id,
+            info.product_id,
+            info.name.encode()[:64],
+            (AxisConvention(convention).value if convention else "").encode(),
+        )
+        _WRITE_SEQ.pack_into(self._buf, _WRITE_SEQ_OFFSET, 0)
+
+        self._device: Optional[SpaceMouseDevice] = device
+        device.add_raw_listener(self._append)
+
+    def _append(self, data, t_ns: int) -> None:
+        seq = self.written
+        offset = _SLOTS_OFFSET + (seq % self.slots) * self._stride
+        length = min(len(data), self.slot_size)
+        buf = self._buf
+        _SLOT.pack_into(buf, offset, 0, t_ns, length)
+        start = offset + _SLOT_DATA_OFFSET
+        buf[start : start + length] = data[:length]
+        _SLOT.pack_into(buf, offset, seq + 1, t_ns, length)
+        self.written = seq + 1
+        _WRITE_SEQ.pack_into(buf, _WRITE_SEQ_OFFSET, seq + 1)
+
+    def close(self, unlink: bool = True) -> None:
+        """Detach from the device and release the shared memory.
+
+        Args:
+            unlink: Also remove the segment (consumers that are still
+                    attached keep their mapping)
+        """
+        if self._device is not None:
+            self._device.remove_raw_listener(self._append)
+            self._device = None
+        if self._buf is not None:
+            self._buf = None
+            self._shm.close()
+            if unlink:
+                self._shm.unlink()
+
+    def __enter__(self) -> ReportRing:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class ReportRingReader:
+    """Consumer of a ReportRing with its own cursor.
+
+    Attributes:
+        name: Shared memory name
+        info: DeviceInfo used for decoding
+        device: SpaceMouseDevice (without HID handle) that decodes the
+            reports; configure its callbacks to receive states
+        cursor: Sequence number of the next report to read
+        lapped: Reports lost because the producer overwrote them first
+    """
+
+    def __init__(
+        self, name: str, info: Optional[DeviceInfo] = None, from_start: bool = False
+    ) -> None:
+        """Open a ring by name.
+
+        Args:
+            name: ReportRing.name of the producer
+            info: Spec to decode with (default: the producer device's TOML
+                  spec with its axis convention applied)
+            from_start: Start with the oldest report still in the ring
+                        instead of the next new one
+
+        Raises:
+            FileNotFoundError: If no ring with this name exists.
+            ValueError: If the segment is not a report ring.
+        """
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        magic, version, slots, slot_size, vid, pid, dev_name, convention = _HEADER.unpack_from(
+            self._buf, 0
+        )
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"Shared memory '{name}' is not a pyspacemouse report ring")
+        self.name = name
+        self.slots = slots
+        self.slot_size = slot_size
+        self._stride = _slot_stride(slot_size)
+
+        if info is None:
+            device_name = dev_name.rstrip(b"\0").decode()
+            info = get_device_specs().get(device_name)
+            if info is None:
+                self.close()
+                raise ValueError(f"Unknown device '{device_name}'; pass info explicitly")
+            convention = convention.rstrip(b"\0").decode()
+            if convention:
+                info = apply_axis_convention(info, AxisConvention(convention))
+        self.info = info
+        self.device = SpaceMouseDevice(info=info)
+
+        write_seq = self._write_seq()
+        self.cursor = max(write_seq - slots, 0) if from_start else write_seq
+        self.lapped = 0
+
+    def _write_seq(self) -> int:
+        return _WRITE_SEQ.unpack_from(self._buf, _WRITE_SEQ_OFFSET)[0]
+
+    def available(self) -> int:
+        """Number of reports written but not yet read (including lapped ones)."""
+        return self._write_seq() - self.cursor
+
+    def reports(self, max_reports: Optional[int] = None) -> Iterator[Tuple[int, int, bytes]]:
+        """Yield new raw reports as (sequence, t_ns, data) and advance the cursor.
+
+        Reports overwritten before they could be read are skipped and
+        counted in lapped.
+        """
+        buf = self._buf
+        count = 0
+        while max_reports is None or count < max_reports:
+            write_seq = self._write_seq()
+            if self.cursor >= write_seq:
+                return
+            if write_seq - self.cursor > self.slots:
+                lost = write_seq - self.slots - self.cursor
+                self.lapped += lost
+                self.cursor += lost
+            seq = self.cursor
+            offset = _SLOTS_OFFSET + (seq % self.slots) * self._stride
+            slot_seq, t_ns, length = _SLOT.unpack_from(buf, offset)
+            start = offset + _SLOT_DATA_OFFSET
+            data = bytes(buf[start : start + length])
+            if slot_seq != seq + 1 or _SLOT.unpack_from(buf, offset)[0] != slot_seq:
+                # Overwritten before or while copying
+                self.lapped += 1
+                self.cursor += 1
+                continue
+            self.cursor += 1
+            count += 1
+            yield seq, t_ns, data
+
+    def process(self, max_reports: Optional[int] = None) -> int:
+        """Decode new reports with self.device, running its callbacks.
+
+        Returns:
+            Number of reports decoded.
+        """
+        count = 0
+        process = self.device._process
+        for _, t_ns, data in self.reports(max_reports):
+            process(data, t_ns)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """Detach from the shared memory (the producer owns the segment)."""
+        if self._buf is not None:
+            self._buf = None
+            self._shm.close()
+
+    def __enter__(self) -> ReportRingReader:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
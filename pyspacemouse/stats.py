@@ -0,0 +1,217 @@
+"""Runtime statistics for SpaceMouse devices.
+
+StatsCollector is kept cheap enough to stay enabled in production: report
+counts reuse the per-report-ID ReportClock bookkeeping, and decode/callback
+durations are only measured on every Nth report.
+SpaceMouseDevice.stats() returns an immutable DeviceStats snapshot.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .timing import ReportClock
+
+if TYPE_CHECKING:
+    from .realtime import RealtimeReport
+
+# Duration histogram: 4 sub-buckets per power of two of nanoseconds
+_SUB_BUCKETS = 4
+_NUM_BUCKETS = 64 * _SUB_BUCKETS
+
+
+def _bucket(ns: int) -> int:
+    """Map a duration in ns to its histogram bucket."""
+    if ns < _SUB_BUCKETS:
+        return max(ns, 0)
+    bits = ns.bit_length()
+    return bits * _SUB_BUCKETS + ((ns >> (bits - 3)) & (_SUB_BUCKETS - 1))
+
+
+def _bucket_upper_ns(index: int) -> float:
+    """Return the upper bound in ns of a histogram bucket."""
+    if index < _SUB_BUCKETS:
+        return float(index)
+    bits, sub = divmod(index, _SUB_BUCKETS)
+    return float((_SUB_BUCKETS + sub + 1) << (bits - 3))
+
+
+def _percentile(histogram: List[int], fraction: float) -> float:
+    """Return an upper bound of the given percentile in seconds."""
+    total = sum(histogram)
+    if total == 0:
+        return 0.0
+    target = fraction * total
+    running = 0
+    for index, count in enumerate(histogram):
+        running += count
+        if running >= target:
+            return _bucket_upper_ns(index) * 1e-9
+    return 0.0
+
+
+@dataclass(frozen=True)
+class DeviceStats:
+    """Snapshot of a device's runtime statistics.
+
+    Durations are in seconds. Decode and callback timings are measured on a
+    sample of reports (every sample_interval-th report).
+
+    Attributes:
+        elapsed: Time covered by these statistics
+        reports: Total number of reports processed
+        reports_by_id: Report count per report ID (HID channel)
+        reports_per_second: Report rate per report ID
+        unknown_report_ids: Reports whose ID matched no axis or button, per ID
+        empty_reads: read() calls that returned no data
+        decode_mean: Mean time to decode a report in _process
+        decode_p99: 99th percentile decode time (histogram upper bound)
+        callback_mean: Mean time spent in callbacks per report
+        callback_p99: 99th percentile callback time per report
+        callback_total: Estimated total time spent in callbacks
+        backlog_reports: Reports that arrived much faster than the report
+            period, i.e. were queued in the kernel before being read
+        dropped_reports: Estimated reports missing from gaps between
+            consecutive reports of the same ID
+    """
+
+    elapsed: float
+    reports: int
+    reports_by_id: Dict[int, int]
+    reports_per_second: Dict[int, float]
+    unknown_report_ids: Dict[int, int]
+    empty_reads: int
+    decode_mean: float
+    decode_p99: float
+    callback_mean: float
+    callback_p99: float
+    callback_total: float
+    backlog_reports: int
+    dropped_reports: int
+
+
+@dataclass(frozen=True)
+class RunStats:
+    """Summary of a SpaceMouseDevice.run() polling loop.
+
+    Attributes:
+        elapsed: Wall time of the loop in seconds
+        cpu_time: CPU time used by the polling thread in seconds
+        reads: read() calls
+        reports: Reports received
+        wakeups: Sleeps between empty reads (each ends in a wakeup)
+        idle_time: Time slept with a backed-off interval while the device
+            was at rest
+        realtime: Real-time settings that took effect, if any were requested
+    """
+
+    elapsed: float
+    cpu_time: float
+    reads: int
+    reports: int
+    wakeups: int
+    idle_time: float
+    realtime: Optional[RealtimeReport] = None
+
+    @property
+    def cpu_usage(self) -> float:
+        """CPU time as a fraction of the elapsed time."""
+        return self.cpu_time / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def wakeups_per_second(self) -> float:
+        """Average wakeup rate."""
+        return self.wakeups / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class StatsCollector:
+    """Mutable counters updated from the device's read path.
+
+    Per-report-ID counts, backlog and drop estimates come from the device's
+    ReportClock objects, which are updated on every report anyway; this
+    class only adds unknown report IDs, empty reads and sampled timings.
+
+    Attributes:
+        countdown: Reports left until the next timing sample (decremented
+            by the device)
+    """
+
+    __slots__ = (
+        "sample_interval",
+        "empty_reads",
+        "countdown",
+        "_clocks",
+        "_started_ns",
+        "_unknown_ids",
+        "_samples",
+        "_decode_sum",
+        "_callback_sum",
+        "_decode_hist",
+        "_callback_hist",
+    )
+
+    def __init__(self, clocks: Dict[int, ReportClock], sample_interval: int = 16) -> None:
+        """Initialize empty counters.
+
+        Args:
+            clocks: The device's report clocks, keyed by report ID
+            sample_interval: Measure decode/callback time on every Nth report
+        """
+        if sample_interval < 1:
+            raise ValueError("sample_interval must be >= 1")
+        self.sample_interval = sample_interval
+        self._clocks = clocks
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self.empty_reads = 0
+        self.countdown = self.sample_interval
+        self._started_ns = time.perf_counter_ns()
+        self._unknown_ids: Dict[int, int] = {}
+        self._samples = 0
+        self._decode_sum = 0
+        self._callback_sum = 0
+        self._decode_hist = [0] * _NUM_BUCKETS
+        self._callback_hist = [0] * _NUM_BUCKETS
+        for clock in self._clocks.values():
+            clock.reset_counters()
+
+    def on_unknown(self, report_id: int) -> None:
+        """Count a report whose ID matched no axis or button."""
+        self._unknown_ids[report_id] = self._unknown_ids.get(report_id, 0) + 1
+
+    def on_timing(self, decode_ns: int, callback_ns: int) -> None:
+        """Record the measured decode and callback durations of one report."""
+        self.countdown = self.sample_interval
+        self._samples += 1
+        self._decode_sum += decode_ns
+        self._callback_sum += callback_ns
+        self._decode_hist[min(_bucket(decode_ns), _NUM_BUCKETS - 1)] += 1
+        self._callback_hist[min(_bucket(callback_ns), _NUM_BUCKETS - 1)] += 1
+
+    def snapshot(self) -> DeviceStats:
+        """Return an immutable snapshot of the current counters."""
+        elapsed = max(time.perf_counter_ns() - self._started_ns, 1) * 1e-9
+        reports_by_id = {rid: clock.count for rid, clock in self._clocks.items() if clock.count}
+        reports = sum(reports_by_id.values())
+        samples = self._samples
+        decode_mean = self._decode_sum / samples * 1e-9 if samples else 0.0
+        callback_mean = self._callback_sum / samples * 1e-9 if samples else 0.0
+        return DeviceStats(
+            elapsed=elapsed,
+            reports=reports,
+            reports_by_id=reports_by_id,
+            reports_per_second={rid: n / elapsed for rid, n in reports_by_id.items()},
+            unknown_report_ids=dict(self._unknown_ids),
+            empty_reads=self.empty_reads,
+            decode_mean=decode_mean,
+            decode_p99=_percentile(self._decode_hist, 0.99),
+            callback_mean=callback_mean,
+            callback_p99=_percentile(self._callback_hist, 0.99),
+            callback_total=callback_mean * reports,
+            backlog_reports=sum(clock.backlog for clock in self._clocks.values()),
+            dropped_reports=sum(clock.dropped for clock in self._clocks.values()),
+        )
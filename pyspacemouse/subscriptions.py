@@ -0,0 +1,414 @@
+"""Axis-threshold subscriptions evaluated through a shared per-axis index.
+
+DofCallback checks every callback's filter on every report. Applications
+with many subscribers ("notify me when |z| > 0.2", "when roll crosses 0")
+can use a SubscriptionIndex instead. The predicates of all subscriptions
+are compiled into sorted arrays per axis, so each report costs one bisect
+per axis, a step per interval bound the value moved past and the
+subscribers that enter, leave or fire, however many are registered:
+
+    index = SubscriptionIndex()
+    index.subscribe(outside("z", 0.2), on_push_pull)
+    index.subscribe(crosses("roll", 0.0), on_roll_flip)
+    index.subscribe(between("x", 0.1, 0.5), on_nudge, repeat=True)
+    index.attach(device)
+
+Level predicates (above, below, between, outside) call fn(state, value)
+when the axis enters the region, or on every report while it is inside
+with repeat=True. Crossing predicates call fn(state, value) when the axis
+moves from one side of the level to the other; a value equal to the level
+is on neither side, so touching the level and returning is not a crossing.
+Subscriptions can be added and removed at any time,
+including from inside a subscriber; the index is rebuilt at the next
+report.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .types import AXIS_NAMES, SpaceMouseState
+
+if TYPE_CHECKING:
+    from .device import SpaceMouseDevice
+
+SubscriptionCallback = Callable[[SpaceMouseState, float], None]
+
+_INF = float("inf")
+_NAN = float("nan")
+
+
+@dataclass(frozen=True)
+class AxisPredicate:
+    """Condition on one axis, built with above(), below(), between(),
+    outside() or crosses().
+
+    Level predicates hold while low < value < high (low <= value <= high
+    if inclusive), or outside that interval if outside is set. Crossing
+    predicates (level set) trigger when the value reaches the opposite side
+    of level from the last value that was not equal to level.
+
+    Attributes:
+        axis: Axis name
+        low: Lower bound of the interval
+        high: Upper bound of the interval
+        inclusive: Whether the bounds belong to the interval
+        outside: Hold outside the interval instead of inside
+        level: Crossing level, or None for level predicates
+        direction: For crossings, +1 (upward only), -1 (downward only) or 0 (both)
+    """
+
+    axis: str
+    low: float = -_INF
+    high: float = _INF
+    inclusive: bool = False
+    outside: bool = False
+    level: Optional[float] = None
+    direction: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the predicate."""
+        if self.axis not in AXIS_NAMES:
+            raise ValueError(f"axis must be one of {AXIS_NAMES}, got '{self.axis}'")
+        if self.low > self.high:
+            raise ValueError(f"low ({self.low}) must not exceed high ({self.high})")
+        if self.direction not in (-1, 0, 1):
+            raise ValueError("direction must be -1, 0 or 1")
+
+    def holds(self, value: float) -> bool:
+        """Whether a level predicate holds for value."""
+        if self.inclusive:
+            inside = self.low <= value <= self.high
+        else:
+            inside = self.low < value < self.high
+        return inside != self.outside
+
+
+def above(axis: str, threshold: float) -> AxisPredicate:
+    """Axis value greater than threshold."""
+    return AxisPredicate(axis, low=threshold)
+
+
+def below(axis: str, threshold: float) -> AxisPredicate:
+    """Axis value less than threshold."""
+    return AxisPredicate(axis, high=threshold)
+
+
+def between(axis: str, low: float, high: float) -> AxisPredicate:
+    """Axis value in [low, high]."""
+    return AxisPredicate(axis, low=low, high=high, inclusive=True)
+
+
+def outside(axis: str, threshold: float) -> AxisPredicate:
+    """Absolute axis value greater than threshold."""
+    return AxisPredicate(axis, low=-threshold, high=threshold, inclusive=True, outside=True)
+
+
+def crosses(axis: str, level: float = 0.0, direction: int = 0) -> AxisPredicate:
+    """Axis value moving from one side of level to the other.
+
+    Upward means from below level to above it, possibly via reports equal
+    to level. Touching level and returning to the same side is no crossing.
+    """
+    return AxisPredicate(axis, level=level, direction=direction)
+
+
+class Subscription:
+    """Registration returned by SubscriptionIndex.subscribe().
+
+    Attributes:
+        predicate: The subscribed condition
+        fn: Called with (state, value)
+        repeat: For level predicates, call on every report while the
+            predicate holds instead of only on entering
+    """
+
+    __slots__ = ("_index", "predicate", "fn", "repeat")
+
+    def __init__(
+        self,
+        index: SubscriptionIndex,
+        predicate: AxisPredicate,
+        fn: SubscriptionCallback,
+        repeat: bool,
+    ) -> None:
+        self._index: Optional[SubscriptionIndex] = index
+        self.predicate = predicate
+        self.fn = fn
+        self.repeat = repeat
+
+    @property
+    def active(self) -> bool:
+        """Whether the subscription is still registered."""
+        return self._index is not None
+
+    def remove(self) -> None:
+        """Unsubscribe. Calling it again has no effect."""
+        index = self._index
+        if index is not None:
+            self._index = None
+            index._remove(self)
+
+
+class _AxisCursor:
+    """Position of one device on one axis, for dispatching its next report."""
+
+    __slots__ = ("index", "previous", "origin", "region", "repeating")
+
+    def __init__(self) -> None:
+        # _AxisIndex that region and repeating refer to
+        self.index: Optional[_AxisIndex] = None
+        # Value of the previous report (the device starts at rest)
+        self.previous = 0.0
+        # Last value different from previous (NaN: none yet)
+        self.origin = _NAN
+        self.region = 0
+        # Subscriptions with repeat=True that hold at previous, in registration order
+        self.repeating: Tuple[Subscription, ...] = ()
+
+
+class _AxisIndex:
+    """Compiled subscriptions of one axis.
+
+    The finite interval bounds e_0 < ... < e_m-1 split the axis into the
+    regions (-inf, e_0), [e_0], (e_0, e_1), [e_1], ..., (e_m-1, inf), numbered
+    0 .. 2m. Every level predicate is constant on each region, so only the
+    boundaries between regions where it starts or stops holding are stored:
+    rising[k] and falling[k] list the subscriptions that start and stop
+    holding when the value moves up from region k to k + 1.
+    """
+
+    __slots__ = (
+        "ends",
+        "rising",
+        "falling",
+        "rank",
+        "repeat_subs",
+        "has_repeat",
+        "levels",
+        "crossings",
+    )
+
+    def __init__(self, subscriptions: List[Subscription]) -> None:
+        level_subs = [s for s in subscriptions if s.predicate.level is None]
+        ends = sorted(
+            {
+                bound
+                for s in level_subs
+                for bound in (s.predicate.low, s.predicate.high)
+                if -_INF < bound < _INF
+            }
+        )
+        self.ends = ends
+
+        last_region = 2 * len(ends)
+        self.rising: List[List[Subscription]] = [[] for _ in range(last_region)]
+        self.falling: List[List[Subscription]] = [[] for _ in range(last_region)]
+        for s in level_subs:
+            first, last = self._interval_regions(s.predicate)
+            if first > last:
+                continue  # Empty interval: never or always holds
+            if s.predicate.outside:
+                if first > 0:
+                    self.falling[first - 1].append(s)
+                if last < last_region:
+                    self.rising[last].append(s)
+            else:
+                if first > 0:
+                    self.rising[first - 1].append(s)
+                if last < last_region:
+                    self.falling[last].append(s)
+        self.rank = {s: i for i, s in enumerate(level_subs)}
+        self.repeat_subs = tuple(s for s in level_subs if s.repeat)
+        self.has_repeat = bool(self.repeat_subs)
+
+        crossing_subs = sorted(
+            (s for s in subscriptions if s.predicate.level is not None),
+            key=lambda s: s.predicate.level,
+        )
+        self.levels = [s.predicate.level for s in crossing_subs]
+        self.crossings = crossing_subs
+
+    def _interval_regions(self, predicate: AxisPredicate) -> Tuple[int, int]:
+        """Return the first and last region inside the interval of predicate."""
+        ends = self.ends
+        if predicate.low == -_INF:
+            first = 0
+        else:
+            first = 2 * bisect_left(ends, predicate.low) + (1 if predicate.inclusive else 2)
+        if predicate.high == _INF:
+            last = 2 * len(ends)
+        else:
+            last = 2 * bisect_left(ends, predicate.high) + (1 if predicate.inclusive else 0)
+        return first, last
+
+    def region(self, value: float) -> int:
+        """Return the region number of value."""
+        ends = self.ends
+        i = bisect_left(ends, value)
+        if i < len(ends) and ends[i] == value:
+            return 2 * i + 1
+        return 2 * i
+
+    def place(self, cursor: _AxisCursor) -> None:
+        """Point cursor at this index, at the region of its previous value."""
+        previous = cursor.previous
+        cursor.index = self
+        cursor.region = self.region(previous)
+        cursor.repeating = tuple(s for s in self.repeat_subs if s.predicate.holds(previous))
+
+    def dispatch(self, state: SpaceMouseState, cursor: _AxisCursor, value: float) -> None:
+        """Call the subscriptions triggered by the change from cursor.previous to value."""
+        previous = cursor.previous
+        if self.ends:
+            fire: Sequence[Subscription] = cursor.repeating
+            region = self.region(value)
+            start = cursor.region
+            if region != start:
+                # Net change of every subscription between the two regions:
+                # +1 started holding, -1 stopped holding, 0 unchanged
+                changes: Dict[Subscription, int] = {}
+                step = 1 if region > start else -1
+                for k in range(min(start, region), max(start, region)):
+                    for s in self.rising[k]:
+                        changes[s] = changes.get(s, 0) + step
+                    for s in self.falling[k]:
+                        changes[s] = changes.get(s, 0) - step
+                cursor.region = region
+                entered = []
+                repeat_changed = False
+                for s, change in changes.items():
+                    if change:
+                        if s.repeat:
+                            repeat_changed = True
+                        elif change > 0:
+                            entered.append(s)
+                if repeat_changed:
+                    repeating = [s for s in cursor.repeating if changes.get(s, 0) == 0]
+                    repeating += [s for s, change in changes.items() if change > 0 and s.repeat]
+                    cursor.repeating = tuple(sorted(repeating, key=self.rank.__getitem__))
+                fire = cursor.repeating
+                if entered:
+                    fire = sorted(entered + list(fire), key=self.rank.__getitem__)
+            for subscription in fire:
+                subscription.fn(state, value)
+
+        if value == previous:
+            return
+        levels = self.levels
+        if levels:
+            # Levels strictly between previous and value are crossed. A level
+            # equal to previous is crossed if the value came from its other
+            # side (origin); a level equal to value is only touched so far.
+            origin = cursor.origin
+            if value > previous:
+                start = (
+                    bisect_left(levels, previous)
+                    if origin < previous
+                    else bisect_right(levels, previous)
+                )
+                stop, direction = bisect_left(levels, value), 1
+            else:
+                start = bisect_right(levels, value)
+                stop = (
+                    bisect_right(levels, previous)
+                    if origin > previous
+                    else bisect_left(levels, previous)
+                )
+                direction = -1
+            for subscription in self.crossings[start:stop]:
+                if subscription.predicate.direction in (0, direction):
+                    subscription.fn(state, value)
+        cursor.origin = previous
+        cursor.previous = value
+
+
+class SubscriptionIndex:
+    """Axis predicate subscriptions shared by one or more devices."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Insertion-ordered set of subscriptions; the compiled index is
+        # rebuilt from it at the next report after a change (None when stale)
+        self._subscriptions: Dict[Subscription, None] = {}
+        self._compiled: Optional[Tuple[Tuple[str, _AxisIndex], ...]] = ()
+        self._lock = threading.Lock()
+        self._listeners: Dict[int, Tuple[SpaceMouseDevice, Callable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(
+        self, predicate: AxisPredicate, fn: SubscriptionCallback, repeat: bool = False
+    ) -> Subscription:
+        """Call fn(state, value) when predicate triggers.
+
+        Args:
+            predicate: Condition from above(), below(), between(), outside()
+                       or crosses()
+            fn: Subscriber
+            repeat: For level predicates, call fn on every report while the
+                    predicate holds, not only when the axis enters the region
+
+        Returns:
+            Subscription; call subscription.remove() to unsubscribe.
+        """
+        subscription = Subscription(self, predicate, fn, repeat)
+        with self._lock:
+            self._subscriptions[subscription] = None
+            self._compiled = None
+        return subscription
+
+    def _remove(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                del self._subscriptions[subscription]
+                self._compiled = None
+
+    def _compile(self) -> Tuple[Tuple[str, _AxisIndex], ...]:
+        with self._lock:
+            compiled = self._compiled
+            if compiled is None:
+                by_axis: Dict[str, List[Subscription]] = {}
+                for subscription in self._subscriptions:
+                    by_axis.setdefault(subscription.predicate.axis, []).append(subscription)
+                compiled = tuple(
+                    (axis, _AxisIndex(by_axis[axis])) for axis in AXIS_NAMES if axis in by_axis
+                )
+                self._compiled = compiled
+            return compiled
+
+    def attach(self, device: SpaceMouseDevice) -> None:
+        """Start evaluating the subscriptions for every report of device.
+
+        Raises:
+            ValueError: If the device is already attached.
+        """
+        if id(device) in self._listeners:
+            raise ValueError(f"{device.name} is already attached")
+
+        cursors = {axis: _AxisCursor() for axis in AXIS_NAMES}
+
+        def listener(state: SpaceMouseState) -> None:
+            compiled = self._compiled
+            if compiled is None:
+                compiled = self._compile()
+            for axis, axis_index in compiled:
+                cursor = cursors[axis]
+                if cursor.index is not axis_index:
+                    axis_index.place(cursor)
+                value = getattr(state, axis)
+                if value != cursor.previous or axis_index.has_repeat:
+                    axis_index.dispatch(state, cursor, value)
+
+        device.add_listener(listener)
+        self._listeners[id(device)] = (device, listener)
+
+    def detach(self, device: SpaceMouseDevice) -> None:
+        """Stop evaluating the subscriptions for device."""
+        entry = self._listeners.pop(id(device), None)
+        if entry is not None:
+            device.remove_listener(entry[1])
@@ -0,0 +1,143 @@
+"""Synthetic SpaceMouse for benchmarks, demos and tests.
+
+SyntheticHIDDevice implements the part of the easyhid.HIDDevice interface
+used by SpaceMouseDevice and produces reports at a fixed rate, encoded with
+the byte layout of a DeviceInfo. Axes follow slow sine waves, so every
+report carries changing values:
+
+    info = pyspacemouse.get_device_specs()["SpaceMousePro"]
+    device = pyspacemouse.SpaceMouseDevice(info, SyntheticHIDDevice(info, rate=250.0))
+    device.open()
+    state = device.read()
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import List
+
+from .types import AXIS_NAMES, DeviceInfo
+
+
+def encode_report(info: DeviceInfo, channel: int, values: dict, buttons: List[int]) -> bytearray:
+    """Encode axis values and button states into a raw report for one channel.
+
+    This is the inverse of SpaceMouseDevice._process for the given spec.
+
+    Args:
+        info: Device specification describing the byte layout
+        channel: Report ID to encode
+        values: Axis name to value in [-1.0, 1.0] (missing axes are 0)
+        buttons: Button states, in the order of info.button_specs
+
+    Returns:
+        Report bytes, starting with the report ID.
+    """
+    size = max(info.bytes_to_read, 1)
+    for spec in info.button_specs:
+        size = max(size, spec.byte + 1)
+    report = bytearray(size)
+    report[0] = channel
+
+    for axis_name, spec in info.mappings.items():
+        if spec.channel != channel:
+            continue
+        raw = round(values.get(axis_name, 0.0) * info.axis_scale / (spec.scale or 1))
+        raw = max(-32768, min(32767, raw)) & 0xFFFF
+        report[spec.byte1] = raw & 0xFF
+        report[spec.byte2] = raw >> 8
+
+    for btn_idx, spec in enumerate(info.button_specs):
+        if spec.channel == channel and btn_idx < len(buttons) and buttons[btn_idx]:
+            report[spec.byte] |= 1 << spec.bit
+    return report
+
+
+class SyntheticHIDDevice:
+    """Stand-in HID device that generates reports at a fixed rate.
+
+    Reports cycle through the device's axis channels (and the button
+    channel once per button_period). In non-blocking mode read() returns an
+    empty bytearray until the next report is due; in blocking mode it
+    sleeps until then.
+
+    Attributes:
+        rate: Reports per second
+        reports_sent: Number of reports returned so far
+    """
+
+    def __init__(self, info: DeviceInfo, rate: float = 250.0, button_period: float = 1.0) -> None:
+        """Initialize the synthetic device.
+
+        Args:
+            info: Device specification used to encode reports
+            rate: Reports per second
+            button_period: Seconds between button state toggles
+        """
+        self.info = info
+        self.rate = rate
+        self.button_period = button_period
+        self.path = "synthetic"
+        self.vendor_id = info.vendor_id
+        self.product_id = info.product_id
+        self.product_string = f"Synthetic {info.name}"
+        self.manufacturer_string = "pyspacemouse"
+        self.serial_number = ""
+        self.release_number = 0
+        self.reports_sent = 0
+
+        self._channels = sorted({spec.channel for spec in info.mappings.values()})
+        button_channels = {spec.channel for spec in info.button_specs}
+        self._button_channel = min(button_channels) if button_channels else None
+        self._is_open = False
+        self._nonblocking = False
+        self._start = 0.0
+        self._next_due = 0.0
+        self._next_button = 0.0
+        self._buttons = [0] * len(info.button_specs)
+
+    def open(self) -> None:
+        self._is_open = True
+        self._start = time.perf_counter()
+        self._next_due = self._start
+        self._next_button = self._start + self.button_period
+
+    def close(self) -> None:
+        self._is_open = False
+
+    def is_open(self) -> bool:
+        return self._is_open
+
+    def set_nonblocking(self, enable_nonblocking: bool) -> None:
+        self._nonblocking = enable_nonblocking
+
+    def write(self, data, report_id: int = 0) -> int:
+        return len(data) + 1
+
+    def read(self, size: int = 64, timeout=None) -> bytearray:
+        """Return the next report if it is due (or wait for it when blocking)."""
+        now = time.perf_counter()
+        if now < self._next_due:
+            if self._nonblocking:
+                return bytearray()
+            time.sleep(self._next_due - now)
+            now = self._next_due
+        self._next_due += 1.0 / self.rate
+        if self._next_due < now:
+            # Reader fell behind; don't accumulate an unbounded backlog
+            self._next_due = now
+        self.reports_sent += 1
+        return self._next_report(now - self._start)[:size]
+
+    def _next_report(self, t: float) -> bytearray:
+        if self._button_channel is not None and t + self._start >= self._next_button:
+            self._next_button += self.button_period
+            self._buttons = [1 - b for b in self._buttons[:1]] + self._buttons[1:]
+            return encode_report(self.info, self._button_channel, {}, self._buttons)
+
+        channel = self._channels[self.reports_sent % len(self._channels)] if self._channels else 0
+        values = {
+            axis: 0.8 * math.sin(2 * math.pi * 0.5 * t + i) for i, axis in enumerate(AXIS_NAMES)
+        }
+        return encode_report(self.info, channel, values, self._buttons)
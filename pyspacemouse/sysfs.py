@@ -0,0 +1,43 @@
+"""Helpers for reading hidraw device attributes from sysfs (Linux).
+
+The kernel describes every hidraw node in
+``/sys/class/hidraw/<name>/device/uevent`` with lines such as
+``HID_ID=0003:0000046D:0000C626``, ``HID_NAME=...`` and ``HID_UNIQ=...``.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, Optional, Tuple
+
+SYSFS_HIDRAW = "/sys/class/hidraw"
+
+
+def read_uevent(name: str, sysfs_root: str = SYSFS_HIDRAW) -> Dict[str, str]:
+    """Return the key/value pairs of a hidraw node's uevent file.
+
+    Args:
+        name: hidraw node name (e.g. "hidraw3")
+        sysfs_root: sysfs directory describing hidraw nodes
+
+    Returns:
+        Dict of uevent keys and values; empty if the file cannot be read.
+    """
+    values = {}
+    try:
+        with open(os.path.join(sysfs_root, name, "device", "uevent")) as f:
+            for line in f:
+                key, _, value = line.rstrip("\n").partition("=")
+                values[key] = value
+    except OSError:
+        pass
+    return values
+
+
+def hid_ids(uevent: Dict[str, str]) -> Optional[Tuple[int, int]]:
+    """Return (vendor_id, product_id) from the HID_ID entry of a uevent, or None."""
+    try:
+        _, vendor, product = uevent["HID_ID"].split(":")
+        return int(vendor, 16), int(product, 16)
+    except (KeyError, ValueError):
+        return None
@@ -0,0 +1,150 @@
+"""Report timing model for PySpaceMouse.
+
+SpaceMouse devices send reports at a fixed cadence while they are moved
+(per report ID: translation and rotation arrive as separate reports). The
+host sees those reports with scheduling jitter added. ReportClock tracks the
+device's report period online and produces smoothed timestamps that follow
+the device cadence instead of the host's wake-up times.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+class ReportClock:
+    """Online estimate of a report stream's period, jitter and smoothed time.
+
+    Uses an alpha-beta tracker: each new receive timestamp is compared with
+    the prediction (previous smoothed time + period). The prediction error
+    corrects the smoothed time (alpha) and the period estimate (beta), which
+    also follows slow drift between the device and host clocks. Gaps longer
+    than gap_factor periods (the device only reports while moved) and bursts
+    of queued reports resync the smoothed time to the raw timestamp. Only
+    repeated gaps of similar length re-estimate the period, never bursts.
+
+    All times are in integer nanoseconds of time.perf_counter_ns().
+
+    Attributes:
+        period_ns: Estimated report period, or None before two reports
+        jitter_ns: Running mean of the absolute prediction error
+        count: Number of reports seen
+        backlog: Reports that arrived much faster than the period, i.e. were
+            queued in the kernel before being read
+        dropped: Estimated reports missing from gaps of a few periods
+            (longer gaps are treated as the device idling)
+    """
+
+    __slots__ = (
+        "alpha",
+        "beta",
+        "gap_factor",
+        "period_ns",
+        "jitter_ns",
+        "count",
+        "backlog",
+        "dropped",
+        "_smoothed",
+        "_misses",
+        "_last_gap",
+    )
+
+    def __init__(self, alpha: float = 0.1, beta: float = 0.01, gap_factor: float = 3.0) -> None:
+        """Initialize the tracker.
+
+        Args:
+            alpha: Weight of the prediction error on the smoothed time
+            beta: Weight of the prediction error on the period estimate
+            gap_factor: Gaps larger than this many periods resync the clock
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.gap_factor = gap_factor
+        self.period_ns: Optional[float] = None
+        self.jitter_ns = 0.0
+        self.count = 0
+        self.backlog = 0
+        self.dropped = 0
+        self._smoothed: Optional[float] = None
+        # Consecutive idle gaps of about the same length, and the last one
+        self._misses = 0
+        self._last_gap = 0.0
+
+    @property
+    def period(self) -> Optional[float]:
+        """Estimated report period in seconds."""
+        return None if self.period_ns is None else self.period_ns * 1e-9
+
+    @property
+    def jitter(self) -> float:
+        """Mean absolute deviation from the predicted arrival time, in seconds."""
+        return self.jitter_ns * 1e-9
+
+    def reset_counters(self) -> None:
+        """Reset count, backlog and dropped without losing the timing model."""
+        self.count = 0
+        self.backlog = 0
+        self.dropped = 0
+
+    def resync(self) -> None:
+        """Forget the last report time, e.g. after the device reconnected.
+
+        The next report starts a new stream: the time since the last report
+        is not counted as jitter or dropped reports. The period estimate and
+        the counters are kept.
+        """
+        self._smoothed = None
+        self._misses = 0
+        self._last_gap = 0.0
+
+    def update(self, t_ns: int) -> float:
+        """Feed a receive timestamp and return the smoothed timestamp in ns."""
+        self.count += 1
+        smoothed = self._smoothed
+        if smoothed is None:
+            self._smoothed = float(t_ns)
+            return self._smoothed
+
+        delta = t_ns - smoothed
+        period = self.period_ns
+        if period is None:
+            if delta > 0:
+                self.period_ns = float(delta)
+            self._smoothed = float(t_ns)
+            return self._smoothed
+
+        if delta < 0.5 * period:
+            # Burst of queued reports: resync to the raw time. The spacing of
+            # a burst is the read loop's, not the device's, so it is never
+            # used to re-estimate the period.
+            if delta < 0.25 * period:
+                self.backlog += 1
+            if t_ns > smoothed:
+                self._smoothed = float(t_ns)
+            return self._smoothed
+
+        error = delta - period
+        if error > self.gap_factor * period:
+            # Idle gap: resync to the raw time. Several gaps of about the same
+            # length in a row mean the period estimate itself is too short.
+            last_gap = self._last_gap
+            if last_gap and abs(delta - last_gap) <= 0.25 * last_gap:
+                self._misses += 1
+            else:
+                self._misses = 1
+            self._last_gap = delta
+            if self._misses >= 3:
+                self.period_ns = float(delta)
+                self._misses = 0
+                self._last_gap = 0.0
+            self._smoothed = float(t_ns)
+            return self._smoothed
+
+        self._misses = 0
+        self._last_gap = 0.0
+        if error > 0.5 * period:
+            self.dropped += round(delta / period) - 1
+        self.period_ns = period + self.beta * error
+        self.jitter_ns += (abs(error) - self.jitter_ns) * 0.0625
+        self._smoothed = smoothed + period + self.alpha * error
+        return self._smoothed
@@ -6,9 +6,11 @@ All types are immutable (frozen dataclasses) for thread safety and clarity.
 
 from __future__ import annotations
 
+import struct
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Literal
+from typing import Dict, Literal, Tuple
 
 # Axis names as a literal type for type safety
 Axis = Literal["x", "y", "z", "roll", "pitch", "yaw"]
@@ -77,6 +79,12 @@ class ButtonSpec:
     bit: int
 
 
+# Packers for SpaceMouseState.write_into(), keyed by (element format, value count)
+_PACKERS: Dict[Tuple[str, int], struct.Struct] = {
+    (fmt, count): struct.Struct(f"{count}{fmt}") for fmt in ("d", "f") for count in (6, 7, 8)
+}
+
+
 class ButtonState(list):
     """List of button states that can be converted to a bitmask integer.
 
@@ -93,7 +101,7 @@ class SpaceMouseState:
     """Current state of the SpaceMouse device.
 
     Attributes:
-        t: Timestamp (seconds since program start)
+        t: Timestamp in seconds (time.perf_counter() clock) when the report was received
         x: X-axis translation [-1.0, 1.0]
         y: Y-axis translation [-1.0, 1.0]
         z: Z-axis translation [-1.0, 1.0]
@@ -101,6 +109,9 @@ class SpaceMouseState:
         pitch: Pitch rotation [-1.0, 1.0]
         yaw: Yaw rotation [-1.0, 1.0]
         buttons: List of button states (0 or 1)
+        t_ns: Receive timestamp in integer nanoseconds (time.perf_counter_ns())
+        t_smoothed: Receive time in seconds with scheduling jitter removed,
+            following the device's estimated report cadence
     """
 
     t: float = -1.0
@@ -111,6 +122,8 @@ class SpaceMouseState:
     pitch: float = 0.0
     yaw: float = 0.0
     buttons: ButtonState = field(default_factory=lambda: ButtonState([]))
+    t_ns: int = -1
+    t_smoothed: float = -1.0
 
     def __getitem__(self, key: str) -> float:
         """Allow dict-like access for backward compatibility."""
@@ -123,6 +136,68 @@ class SpaceMouseState:
         """
         return any(abs(getattr(self, axis)) > threshold for axis in AXIS_NAMES)
 
+    def as_array(self, t: bool = False, buttons: bool = False) -> array:
+        """Return the axis values as a flat array of doubles.
+
+        The result supports the buffer protocol, so it can be wrapped without
+        copying, e.g. numpy.frombuffer(state.as_array()).
+
+        Args:
+            t: If True, prepend the timestamp
+            buttons: If True, append the button bitmask (see ButtonState.__int__)
+
+        Returns:
+            array('d') laid out as [t?, x, y, z, roll, pitch, yaw, buttons?]
+        """
+        values = array("d", (self.x, self.y, self.z, self.roll, self.pitch, self.yaw))
+        if t:
+            values.insert(0, self.t)
+        if buttons:
+            values.append(int(self.buttons))
+        return values
+
+    def write_into(self, buffer, offset: int = 0, t: bool = False, buttons: bool = False) -> int:
+        """Write the axis values into a caller-provided buffer without allocating.
+
+        Works with any writable, contiguous buffer of float64 or float32
+        elements, such as a row of a preallocated NumPy array, an
+        array('d') or a memoryview:
+
+            log = numpy.empty((1000, 7))
+            state.write_into(log[i], t=True)
+
+        Args:
+            buffer: Writable buffer with 'd' or 'f' elements
+            offset: Index of the first element to write
+            t: If True, write the timestamp before the axes
+            buttons: If True, write the button bitmask after the axes
+
+        Returns:
+            Number of elements written (6 to 8).
+
+        Raises:
+            TypeError: If the buffer is read-only or not float32/float64
+            ValueError: If the buffer is too small
+        """
+        view = memoryview(buffer)
+        if view.readonly:
+            raise TypeError("buffer must be writable")
+        fmt = view.format.lstrip("@=")
+        count = 6 + t + buttons
+        packer = _PACKERS.get((fmt, count))
+        if packer is None:
+            raise TypeError(f"buffer must hold float64 or float32 values, got '{view.format}'")
+        if view.nbytes < (offset + count) * view.itemsize:
+            raise ValueError(f"buffer too small: need {offset + count} elements")
+
+        axes = (self.x, self.y, self.z, self.roll, self.pitch, self.yaw)
+        if t:
+            axes = (self.t, *axes)
+        if buttons:
+            axes = (*axes, int(self.buttons))
+        packer.pack_into(view, offset * view.itemsize, *axes)
+        return count
+
 
 @dataclass(frozen=True, slots=True)
 class DeviceInfo:
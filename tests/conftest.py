@@ -0,0 +1,70 @@
+"""Shared test fixtures: a fake HID layer so tests run without hardware."""
+
+from __future__ import annotations
+
+from collections import deque
+
+import pytest
+from easyhid import HIDException
+
+from pyspacemouse import api
+
+
+class FakeHIDDevice:
+    """Minimal stand-in for easyhid.HIDDevice fed from a queue of reports."""
+
+    def __init__(self, vendor_id, product_id, path="/dev/hidraw0", serial_number="SN"):
+        self.path = path
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.product_string = "Fake SpaceMouse"
+        self.manufacturer_string = "3Dconnexion"
+        self.release_number = 1
+        self.serial_number = serial_number
+        self.reports = deque()
+        self.written = []
+        self.is_open = False
+        self.nonblocking = None
+        self.fail_reads = False
+
+    def open(self):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+    def set_nonblocking(self, enable):
+        self.nonblocking = enable
+
+    def read(self, size=64, timeout=None):
+        if self.fail_reads:
+            raise HIDException("Failed to read from HID device: -1")
+        if self.reports:
+            return bytearray(self.reports.popleft())
+        return bytearray()
+
+    def write(self, data, report_id=0):
+        self.written.append(bytes(data))
+        return len(data)
+
+
+class FakeEnumeration:
+    """Replacement for easyhid.Enumeration returning a fixed device list."""
+
+    devices: list = []
+    calls = 0
+
+    def __init__(self, vid=0, pid=0):
+        type(self).calls += 1
+        self.device_list = list(type(self).devices)
+
+
+@pytest.fixture
+def fake_hid(monkeypatch):
+    """Patch HID enumeration; returns the FakeEnumeration class to populate."""
+    FakeEnumeration.devices = []
+    FakeEnumeration.calls = 0
+    monkeypatch.setattr(api, "Enumeration", FakeEnumeration)
+    api.set_enumeration_cache_ttl(0)
+    yield FakeEnumeration
+    api.set_enumeration_cache_ttl(0)
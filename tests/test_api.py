@@ -0,0 +1,102 @@
+"""Tests for device discovery and opening with a fake HID layer."""
+
+import pytest
+from conftest import FakeHIDDevice
+
+import pyspacemouse
+from pyspacemouse import AxisConvention
+
+
+def _spec(name):
+    return pyspacemouse.get_device_specs()[name]
+
+
+def test_device_index_matches_specs():
+    index = pyspacemouse.get_device_index()
+    for spec in pyspacemouse.get_device_specs().values():
+        assert spec.hid_id in index
+
+
+def test_connected_devices_single_enumeration(fake_hid):
+    nav = _spec("SpaceNavigator")
+    fake_hid.devices = [
+        FakeHIDDevice(0x1234, 0x5678, path="/dev/hidraw0"),
+        FakeHIDDevice(nav.vendor_id, nav.product_id, path="/dev/hidraw1"),
+    ]
+    assert pyspacemouse.get_connected_devices() == ["SpaceNavigator"]
+    assert pyspacemouse.get_connected_devices_by_path() == {"/dev/hidraw1": "SpaceNavigator"}
+    assert fake_hid.calls == 2
+
+
+def test_open_auto_detect_enumerates_once(fake_hid):
+    nav = _spec("SpaceNavigator")
+    fake_hid.devices = [FakeHIDDevice(nav.vendor_id, nav.product_id)]
+    with pyspacemouse.open(axis_convention=AxisConvention.HID_Z_UP) as device:
+        assert device.name == "SpaceNavigator"
+    assert fake_hid.calls == 1
+
+
+def test_open_all(fake_hid):
+    nav = _spec("SpaceNavigator")
+    pro = _spec("SpaceMousePro")
+    fake_hid.devices = [
+        FakeHIDDevice(nav.vendor_id, nav.product_id, path="/dev/hidraw0"),
+        FakeHIDDevice(0x1234, 0x5678, path="/dev/hidraw1"),
+        FakeHIDDevice(pro.vendor_id, pro.product_id, path="/dev/hidraw2"),
+    ]
+    devices = pyspacemouse.open_all(axis_convention=AxisConvention.HID)
+    assert [d.name for d in devices] == ["SpaceNavigator", "SpaceMousePro"]
+    assert all(d.connected for d in devices)
+    assert fake_hid.calls == 1
+
+
+def test_enumeration_cache_ttl(fake_hid):
+    nav = _spec("SpaceNavigator")
+    fake_hid.devices = [FakeHIDDevice(nav.vendor_id, nav.product_id)]
+    pyspacemouse.set_enumeration_cache_ttl(60.0)
+    pyspacemouse.get_connected_devices()
+    pyspacemouse.get_connected_devices_by_path()
+    assert fake_hid.calls == 1
+    with pytest.raises(ValueError):
+        pyspacemouse.set_enumeration_cache_ttl(-1)
+
+
+def test_cached_enumeration_opens_separate_handles(fake_hid):
+    nav = _spec("SpaceNavigator")
+    enumerated = FakeHIDDevice(nav.vendor_id, nav.product_id)
+    fake_hid.devices = [enumerated]
+    pyspacemouse.set_enumeration_cache_ttl(60.0)
+    first = pyspacemouse.open(axis_convention=AxisConvention.HID)
+    second = pyspacemouse.open(axis_convention=AxisConvention.HID)
+    assert fake_hid.calls == 1
+    assert first._device is not second._device
+    assert first.connected and second.connected
+    assert not enumerated.is_open
+    first.close()
+    assert second._device.is_open
+    second.close()
+
+
+def test_open_by_path_alias_and_device_number(fake_hid, tmp_path):
+    nav = _spec("SpaceNavigator")
+    node = tmp_path / "hidraw1"
+    node.write_bytes(b"")
+    alias = tmp_path / "usb-3Dconnexion_SpaceNavigator"
+    alias.symlink_to(node)
+    null_link = tmp_path / "hidraw-null"
+    null_link.symlink_to("/dev/null")
+    fake_hid.devices = [
+        FakeHIDDevice(0x1234, 0x5678, path=str(tmp_path / "hidraw0")),
+        FakeHIDDevice(nav.vendor_id, nav.product_id, path=str(node)),
+        FakeHIDDevice(nav.vendor_id, nav.product_id, path=str(null_link).encode()),
+    ]
+
+    with pyspacemouse.open_by_path(alias, axis_convention=AxisConvention.HID) as device:
+        assert device.path == str(node)
+
+    # Enumerated under another name for the same device node: matched by st_rdev
+    with pyspacemouse.open_by_path("/dev/null", axis_convention=AxisConvention.HID) as device:
+        assert device.path == str(null_link).encode()
+
+    with pytest.raises(FileNotFoundError):
+        pyspacemouse.open_by_path(tmp_path / "missing")
@@ -0,0 +1,98 @@
+"""Tests for the command-line interface using the synthetic device."""
+
+import json
+import os
+import struct
+import time
+
+import pytest
+from conftest import FakeHIDDevice
+
+import pyspacemouse
+from pyspacemouse import pyspacemouse_cli
+
+
+def test_bench_json_with_synthetic_device(capsys, monkeypatch):
+    monkeypatch.setattr(
+        "sys.argv", ["pyspacemouse", "--bench", "--synthetic", "--json", "--duration", "0.3"]
+    )
+    pyspacemouse_cli.main()
+    result = json.loads(capsys.readouterr().out)
+    assert result["synthetic"] is True
+    assert result["reports"] > 0
+    assert result["decode_throughput"] > 0
+
+
+def test_dump_formats_with_synthetic_device(capsysbinary, monkeypatch):
+    base = ["pyspacemouse", "--synthetic", "--duration", "0.1", "--axes", "x,yaw"]
+
+    monkeypatch.setattr("sys.argv", base + ["--dump", "ndjson"])
+    pyspacemouse_cli.main()
+    lines = capsysbinary.readouterr().out.splitlines()
+    assert lines
+    assert set(json.loads(lines[0])) == {"t", "x", "yaw", "buttons"}
+
+    monkeypatch.setattr("sys.argv", base + ["--dump", "csv", "--rate", "20"])
+    pyspacemouse_cli.main()
+    lines = capsysbinary.readouterr().out.splitlines()
+    assert lines[0] == b"t,x,yaw,buttons"
+    assert 1 <= len(lines) - 1 <= 3
+
+    monkeypatch.setattr("sys.argv", base + ["--dump", "binary"])
+    pyspacemouse_cli.main()
+    out = capsysbinary.readouterr().out
+    record = struct.calcsize("<d2fI")
+    assert out and len(out) % record == 0
+
+
+def test_dump_without_device_fails_unless_synthetic(capsysbinary, monkeypatch):
+    def no_device(**kwargs):
+        raise RuntimeError("No connected SpaceMouse found")
+
+    monkeypatch.setattr(pyspacemouse, "open", no_device)
+    monkeypatch.setattr("sys.argv", ["pyspacemouse", "--dump", "ndjson", "--duration", "0.1"])
+    with pytest.raises(SystemExit) as exc_info:
+        pyspacemouse_cli.main()
+    assert exc_info.value.code != 0
+    assert "--synthetic" in str(exc_info.value.code)
+    assert capsysbinary.readouterr().out == b""
+
+    # --bench still falls back to the synthetic device
+    monkeypatch.setattr("sys.argv", ["pyspacemouse", "--bench", "--json", "--duration", "0.1"])
+    pyspacemouse_cli.main()
+    assert b'"synthetic": true' in capsysbinary.readouterr().out
+
+
+class _IdleHIDDevice(FakeHIDDevice):
+    """A device at rest: blocking reads wait for a report that never comes."""
+
+    def read(self, size=64, timeout=None):
+        if not self.nonblocking:
+            time.sleep(5.0)
+        return bytearray()
+
+
+def test_dump_duration_ends_with_idle_device(capsysbinary, monkeypatch):
+    info = pyspacemouse.get_device_specs()["SpaceNavigator"]
+    device = pyspacemouse.SpaceMouseDevice(info, _IdleHIDDevice(info.vendor_id, info.product_id))
+    device.open()
+    monkeypatch.setattr(pyspacemouse_cli, "open_bench_device", lambda *a, **k: (device, True))
+
+    start = time.monotonic()
+    pyspacemouse_cli.dump_cli(duration=0.2)
+    assert time.monotonic() - start < 2.0
+    assert capsysbinary.readouterr().out == b""
+
+
+def test_dump_into_closed_pipe_exits_quietly(monkeypatch):
+    read_end, write_end = os.pipe()
+    os.close(read_end)
+    stdout = open(write_end, "w")
+    monkeypatch.setattr("sys.stdout", stdout)
+    try:
+        pyspacemouse_cli.dump_cli(duration=0.1, synthetic=True)
+        # Whatever is still buffered is dropped instead of raising at exit
+        print("late output", file=stdout)
+        stdout.flush()
+    finally:
+        stdout.close()
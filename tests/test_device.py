@@ -0,0 +1,438 @@
+"""Tests for SpaceMouseDevice report processing with a fake HID device."""
+
+import dataclasses
+import os
+import sys
+import threading
+import time
+
+import pytest
+from conftest import FakeEnumeration, FakeHIDDevice
+from easyhid import HIDException
+
+import pyspacemouse
+from pyspacemouse import AxisConvention, HidrawDevice, SpaceMouseDevice, apply_axis_convention
+from pyspacemouse import device as device_module
+from pyspacemouse.bench import run_thread_scaling
+from pyspacemouse.synthetic import encode_report
+
+
+def _open_device(name="SpaceNavigator", **hid_kwargs):
+    info = apply_axis_convention(pyspacemouse.get_device_specs()[name], AxisConvention.HID)
+    hid = FakeHIDDevice(info.vendor_id, info.product_id, **hid_kwargs)
+    device = SpaceMouseDevice(info=info, device=hid, axis_convention=AxisConvention.HID)
+    device.open()
+    return device, hid
+
+
+def test_read_decodes_translation():
+    device, hid = _open_device()
+    hid.reports.append(bytes([1, 0x5E, 0x01, 0, 0, 0xA2, 0xFE]))
+    state = device.read()
+    assert state.x == pytest.approx(350 / 350.0)
+    assert state.z == pytest.approx(-350 / 350.0)
+
+
+def test_read_error_propagates_without_reconnect():
+    device, hid = _open_device()
+    hid.fail_reads = True
+    with pytest.raises(HIDException):
+        device.read()
+
+
+def test_reconnect_after_drop(monkeypatch):
+    monkeypatch.setattr(device_module, "Enumeration", FakeEnumeration)
+    FakeEnumeration.devices = []
+    events = []
+    device, hid = _open_device(serial_number="ABC")
+    device.set_nonblocking(True)
+    device.enable_reconnect(
+        on_disconnect=lambda d: events.append("lost"),
+        on_reconnect=lambda d: events.append("back"),
+        initial_delay=0.0,
+    )
+    hid.reports.append(bytes([1, 0x5E, 0x01, 0, 0, 0, 0]))
+    assert device.read().x > 0
+
+    hid.fail_reads = True
+    state = device.read()
+    assert events == ["lost"]
+    assert not device.connected
+    assert state.x == 0.0
+
+    # Device comes back on a different path with the same serial number
+    replacement = FakeHIDDevice(
+        hid.vendor_id, hid.product_id, path="/dev/hidraw7", serial_number="ABC"
+    )
+    FakeEnumeration.devices = [replacement]
+    enumeration_threads = []
+    monkeypatch.setattr(
+        device_module,
+        "Enumeration",
+        lambda **ids: enumeration_threads.append(threading.current_thread()) or FakeEnumeration(),
+    )
+    deadline = time.monotonic() + 2.0
+    while not device.connected and time.monotonic() < deadline:
+        device.read()
+        time.sleep(0.001)
+    assert enumeration_threads and threading.current_thread() not in enumeration_threads
+    assert events == ["lost", "back"]
+    assert device.connected
+    assert device.path == "/dev/hidraw7"
+    assert replacement.nonblocking is True
+
+
+def test_hidraw_backend_reads_from_fifo(tmp_path):
+    info = apply_axis_convention(
+        pyspacemouse.get_device_specs()["SpaceNavigator"], AxisConvention.HID
+    )
+    fifo = tmp_path / "hidraw0"
+    os.mkfifo(fifo)
+    hid = HidrawDevice(str(fifo), vendor_id=info.vendor_id, product_id=info.product_id)
+    device = SpaceMouseDevice(info=info, device=hid)
+    device.open()
+    device.set_nonblocking(True)
+    writer = os.open(fifo, os.O_WRONLY)
+    try:
+        assert device.fileno() == hid.fileno()
+        assert device.read().x == 0.0  # nothing queued yet
+        os.write(writer, bytes([1, 0x5E, 0x01, 0, 0, 0, 0]))
+        assert device.read().x == pytest.approx(1.0)
+        os.write(writer, bytes([1, 0xA2, 0xFE, 0, 0, 0, 0]))
+        assert device.read().x == pytest.approx(-1.0)
+    finally:
+        os.close(writer)
+        device.close()
+
+
+def test_receive_timestamps():
+    device, hid = _open_device()
+    hid.reports.append(bytes([1, 0x5E, 0x01, 0, 0, 0, 0]))
+    state = device.read()
+    assert state.t_ns > 0
+    assert state.t == pytest.approx(state.t_ns * 1e-9)
+    assert state.t_smoothed == pytest.approx(state.t)
+    assert 1 in device.report_clocks
+
+
+def test_stats_counts_reports():
+    device, hid = _open_device()
+    device.enable_stats(sample_interval=1)
+    hid.reports.extend(
+        [
+            bytes([1, 0x5E, 0x01, 0, 0, 0, 0]),
+            bytes([2, 0, 0, 0, 0, 0, 0]),
+            bytes([9, 0, 0, 0, 0, 0, 0]),
+        ]
+    )
+    for _ in range(4):
+        device.read()
+    stats = device.stats()
+    assert stats.reports == 3
+    assert stats.reports_by_id == {1: 1, 2: 1, 9: 1}
+    assert stats.unknown_report_ids == {9: 1}
+    assert stats.empty_reads == 1
+    assert stats.decode_p99 >= stats.decode_mean > 0
+
+    device.enable_stats(False)
+    with pytest.raises(RuntimeError):
+        device.stats()
+
+
+def test_callback_profiling(caplog):
+    device, hid = _open_device()
+    seen = []
+
+    def on_x(state, value):
+        seen.append(value)
+
+    device.configure(
+        callback=lambda state: None,
+        dof_callbacks=[pyspacemouse.DofCallback("x", on_x)],
+    )
+    raw_callback = device._callbacks.callback
+    device.enable_profiling(budget=0.0)
+    hid.reports.append(bytes([1, 0x5E, 0x01, 0, 0, 0, 0]))
+    with caplog.at_level("WARNING", logger="pyspacemouse"):
+        device.read()
+
+    assert seen == [pytest.approx(1.0)]
+    profiles = {p.name: p for p in device.callback_profiles()}
+    assert profiles["dof_callbacks[0] (x): test_callback_profiling.<locals>.on_x"].calls == 1
+    assert all(p.over_budget == 1 for p in profiles.values())
+    assert "Slow SpaceMouse callback" in caplog.text
+
+    device.disable_profiling()
+    assert device._callbacks.callback is raw_callback
+    assert device.callback_profiles() == []
+
+
+def test_reload_spec_keeps_handle_and_state(tmp_path):
+    device, hid = _open_device()
+    hid.reports.append(bytes([1, 0x5E, 0x01, 0, 0, 0, 0]))
+    device.read()
+    device.state.buttons[0] = 1
+
+    inverted = pyspacemouse.modify_device_info(device.info, invert_axes=["x"])
+    device.reload_spec(inverted)
+    assert device.state.buttons[0] == 1  # state kept
+    hid.reports.append(bytes([1, 0x5E, 0x01, 0, 0, 0, 0]))
+    assert device.read().x == pytest.approx(-1.0)
+    assert device.connected
+
+    toml = (
+        (pyspacemouse.loader.Path(pyspacemouse.loader.__file__).parent / "devices.toml")
+        .read_text()
+        .replace("axis_scale = 350.0", "axis_scale = 700.0")
+    )
+    path = tmp_path / "override.toml"
+    path.write_text(toml)
+    device.watch_spec(str(path), interval=0.0)
+    os.utime(path, ns=(1, 1))
+    hid.reports.append(bytes([1, 0x5E, 0x01, 0, 0, 0xA2, 0xFE]))
+    state = device.read()
+    assert state.x == pytest.approx(0.5)
+    assert state.z == pytest.approx(-0.5)  # HID convention re-applied
+    assert device.info.axis_scale == 700.0
+
+    with pytest.raises(ValueError):
+        device.reload_spec(pyspacemouse.get_device_specs()["SpaceMouseEnterprise"])
+
+
+def test_reload_spec_from_another_thread():
+    device, hid = _open_device("SpaceMousePro")
+    full = device.info
+    fewer = dataclasses.replace(
+        full, button_specs=full.button_specs[:2], button_names=full.button_names[:2]
+    )
+    channel = full.button_specs[-1].channel
+    report = bytes(encode_report(full, channel, {}, [1] * len(full.button_specs)))
+    stop = threading.Event()
+
+    def reload_loop():
+        while not stop.is_set():
+            device.reload_spec(fewer)
+            device.reload_spec(full)
+
+    reloader = threading.Thread(target=reload_loop)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+    reloader.start()
+    try:
+        for _ in range(100000):
+            device._process(report)
+    finally:
+        stop.set()
+        reloader.join()
+        sys.setswitchinterval(interval)
+    device._process(report)  # Installs the buttons of the last reload
+    assert len(device.state.buttons) == len(full.button_specs)
+    assert device.state.buttons == [1] * len(full.button_specs)
+
+
+def test_reload_spec_while_reader_thread_runs():
+    # Reloads resize the buttons while another thread decodes reports; every
+    # snapshot still comes from one report
+    device, _ = _open_device("SpaceMousePro")
+    full = device.info
+    fewer = dataclasses.replace(
+        full, button_specs=full.button_specs[:2], button_names=full.button_names[:2]
+    )
+    channel = full.button_specs[-1].channel
+    reports = [bytes(encode_report(full, 1, {"x": v, "z": v}, [])) for v in (0.25, -0.5, 0.75)] + [
+        bytes(encode_report(full, channel, {}, [1] * len(full.button_specs)))
+    ]
+    stop = threading.Event()
+
+    def reader():
+        i = 0
+        while not stop.is_set():
+            device._process(reports[i % len(reports)])
+            i += 1
+
+    thread = threading.Thread(target=reader)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    thread.start()
+    try:
+        for i in range(20000):
+            device.reload_spec(fewer if i % 2 else full)
+            snapshot = device.snapshot()
+            assert snapshot.x == snapshot.z
+            assert len(snapshot.buttons) in (2, len(full.button_specs))
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(interval)
+
+
+def test_sample_at_interpolates_and_extrapolates():
+    device, _ = _open_device()
+    with pytest.raises(RuntimeError):
+        device.sample_at()
+    device.enable_prediction(model="linear", horizon=0.02)
+
+    start = 1_000_000_000
+    for i, x in enumerate((0.1, 0.2, 0.3)):
+        device._process(bytes(encode_report(device.info, 1, {"x": x}, [])), start + i * 8_000_000)
+
+    assert device.sample_at(1.004).x == pytest.approx(0.15, abs=2e-3)
+    assert device.sample_at(1.020).x == pytest.approx(0.35, abs=2e-3)
+    assert device.sample_at(5.0).x == pytest.approx(0.55, abs=2e-3)  # horizon limit
+    assert device.sample_at(5.0).y == 0.0
+
+    device.enable_prediction(model="quadratic", horizon=1.0, clamp=0.5)
+    start = 10_000_000_000
+    for i, x in enumerate((0.1, 0.2, 0.4)):
+        device._process(bytes(encode_report(device.info, 1, {"x": x}, [])), start + i * 8_000_000)
+    assert device.sample_at(10.018).x == pytest.approx(0.4656, abs=5e-3)
+    assert device.sample_at(11.0).x == 0.5
+
+
+def test_parallel_readers_with_concurrent_reconfiguration():
+    # One reader thread per device (free-threaded builds decode them in
+    # parallel) while the main thread swaps callbacks and takes snapshots.
+    n_devices, n_reports = 4, 5000
+    devices = [_open_device()[0] for _ in range(n_devices)]
+    reports = [
+        bytes(encode_report(devices[0].info, 1, {"x": v, "z": v}, [])) for v in (0.25, -0.5, 0.75)
+    ]
+    counts = [0] * n_devices
+    errors = []
+
+    def reader(index):
+        device = devices[index]
+
+        def count(state):
+            counts[index] += 1
+
+        device.add_listener(count)
+        try:
+            for i in range(n_reports):
+                device._process(reports[i % len(reports)])
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(n_devices)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        for device in devices:
+            device.configure(callback=lambda state: None)
+            device.clear_callbacks()
+            snapshot = device.snapshot()
+            # All fields of a snapshot come from the same report
+            assert snapshot.x == snapshot.z
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert counts == [n_reports] * n_devices
+    assert devices[0].snapshot().x == pytest.approx(devices[0].state.x)
+
+
+def test_reader_thread_scaling():
+    # 1 vs 4 reader threads; only free-threaded builds must scale
+    result = run_thread_scaling(_open_device()[0].info, threads=4, duration=0.2)
+    assert result.threads == 4
+    assert result.single > 0 and result.parallel > 0
+    assert result.as_dict()["speedup"] == result.speedup
+    assert "4 threads" in result.summary()
+    if not result.gil_enabled and (os.cpu_count() or 1) >= 4:
+        assert result.speedup > 1.5
+
+
+def test_on_registers_and_removes_handlers():
+    device, _ = _open_device()
+    calls = []
+    state_handle = device.on("state", lambda state: calls.append("state"))
+    device.on("axis", lambda state, value: calls.append(("x", value)), axis="x", filter=0.5)
+    device.on("button", lambda state, buttons: calls.append(("b", buttons)), buttons=1)
+
+    def remove_self(state):
+        calls.append("once")
+        once.remove()
+
+    once = device.on("dof", remove_self)
+    device.configure(callback=lambda state: calls.append("configured"))
+
+    device._process(bytes(encode_report(device.info, 1, {"x": 0.75}, [])))
+    device._process(bytes(encode_report(device.info, 3, {}, [1, 0])))
+    device._process(bytes(encode_report(device.info, 3, {}, [0, 1])))
+    assert calls == [
+        "configured",
+        "state",
+        "once",
+        ("x", pytest.approx(0.75, abs=1e-2)),
+        "configured",
+        "state",
+        "configured",
+        "state",
+        ("b", [0, 1]),
+    ]
+    assert not once.active
+
+    calls.clear()
+    state_handle.remove()
+    state_handle.remove()
+    device.clear_callbacks()
+    device._process(bytes(encode_report(device.info, 1, {"x": 0.25}, [])))
+    assert calls == []
+
+    with pytest.raises(ValueError):
+        device.on("motion", print)
+    with pytest.raises(TypeError):
+        device.on("state", print, axis="x")
+    with pytest.raises(ValueError):
+        device.on("axis", print)
+
+
+def test_on_updates_handler_table_in_place():
+    device, _ = _open_device()
+    calls = []
+
+    def first(state):
+        calls.append("first")
+
+    def second(state):
+        calls.append("second")
+
+    handles = [device.on("state", fn) for fn in (first, second, first)]
+    table = device._handler_table
+    assert table.state == (first, second, first)
+
+    # Removing one handle swaps in a copy without that entry; the old table is untouched
+    handles[0].remove()
+    assert device._handler_table.state == (second, first)
+    assert table.state == (first, second, first)
+
+    device.enable_profiling(budget=1.0)
+    profiled = device.on("button", lambda state, buttons: None)
+    assert len(device.callback_profiles()) == 3
+    profiled.remove()
+    assert len(device.callback_profiles()) == 2
+    device._process(bytes(encode_report(device.info, 1, {"x": 0.5}, [])))
+    assert calls == ["second", "first"]
+    assert [p.calls for p in device.callback_profiles()] == [1, 1]
+
+
+def test_run_backs_off_at_rest():
+    device, hid = _open_device()
+    for report in ([1, 0x5E, 0x01, 0, 0, 0, 0], [1, 0, 0, 0, 0, 0, 0]):
+        hid.reports.append(bytes(report))
+    seen = []
+    at_rest = device.run(lambda state: seen.append(state.x), duration=0.3)
+    assert seen == [pytest.approx(1.0), 0.0]
+    assert at_rest.reports == 2
+    assert at_rest.wakeups < 40
+    assert at_rest.idle_time > 0.2
+
+    # A deflected axis keeps the fast interval
+    hid.reports.append(bytes([1, 0x5E, 0x01, 0, 0, 0, 0]))
+    moving = device.run(duration=0.3)
+    assert moving.wakeups > 3 * at_rest.wakeups
+    assert moving.idle_time == 0.0
+
+    stop = threading.Event()
+    stop.set()
+    assert device.run(stop=stop).reads == 0
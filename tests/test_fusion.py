@@ -0,0 +1,69 @@
+"""Tests for time-aligned multi-device fusion."""
+
+import time
+
+import pytest
+from conftest import FakeHIDDevice
+
+import pyspacemouse
+from pyspacemouse import AxisConvention, DeviceFuser, SpaceMouseDevice, apply_axis_convention
+from pyspacemouse.synthetic import encode_report
+
+
+def _device(path):
+    info = apply_axis_convention(
+        pyspacemouse.get_device_specs()["SpaceNavigator"], AxisConvention.HID
+    )
+    hid = FakeHIDDevice(info.vendor_id, info.product_id, path=path)
+    device = SpaceMouseDevice(info=info, device=hid)
+    device.open()
+    return device
+
+
+def test_frames_are_aligned_to_common_time():
+    left, right = _device("/dev/hidraw0"), _device("/dev/hidraw1")
+    with DeviceFuser([left, right]) as fuser:
+        # Left reports at 0 and 10 ms, right at 4 ms
+        left._process(bytes(encode_report(left.info, 1, {"x": 0.0}, [])), 1_000_000_000)
+        right._process(bytes(encode_report(right.info, 1, {"x": 0.5}, [])), 1_004_000_000)
+        left._process(bytes(encode_report(left.info, 1, {"x": 1.0}, [])), 1_010_000_000)
+
+        frame = fuser.frame(1.005)
+        assert frame.states[0].x == pytest.approx(0.5, abs=1e-2)
+        assert frame.states[1].x == pytest.approx(0.5, abs=1e-2)
+        assert frame.ages[0] == pytest.approx(0.005, abs=1e-4)
+        assert frame.skew == pytest.approx(0.004, abs=1e-4)
+
+        fuser.mode = "hold"
+        assert fuser.frame(1.005).states[0].x == 0.0
+
+    assert left._listeners == ()
+
+
+def test_poll_drains_queued_reports():
+    left, right = _device("/dev/hidraw0"), _device("/dev/hidraw1")
+    for value in (0.1, 0.2, 0.3):
+        left._device.reports.append(bytes(encode_report(left.info, 1, {"x": value}, [])))
+    fuser = DeviceFuser([left, right])
+    assert fuser.poll() == 3
+    frame = fuser.frame(time.perf_counter() + 1.0)
+    assert frame.states[0].x == pytest.approx(0.3, abs=1e-2)
+    assert frame.ages[1] == float("inf")
+
+
+def test_reports_are_kept_in_time_order_with_their_buttons():
+    device = _device("/dev/hidraw0")
+    info = device.info
+    button_channel = info.button_specs[0].channel
+    with DeviceFuser([device]) as fuser:
+        for t_ms in (1000, 1008, 1016):
+            device._process(bytes(encode_report(info, 1, {"x": 0.5}, [])), t_ms * 1_000_000)
+        device._process(bytes(encode_report(info, button_channel, {}, [1, 0])), 1_027_000_000)
+        # Late translation report: its own clock smooths it to ~1.0246 s,
+        # before the button report stamped on the other report ID's clock
+        device._process(bytes(encode_report(info, 1, {"x": 0.5}, [])), 1_030_000_000)
+
+        times = [sample[0] for sample in fuser._histories[0]]
+        assert times == sorted(times)
+        assert fuser.frame(1.020).states[0].buttons == [0, 0]
+        assert fuser.frame(1.028).states[0].buttons == [1, 0]
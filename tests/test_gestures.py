@@ -0,0 +1,88 @@
+"""Tests for the incremental gesture recognizer."""
+
+import dataclasses
+
+import pytest
+
+import pyspacemouse
+from pyspacemouse import (
+    GestureCallback,
+    GestureRecognizer,
+    GestureThresholds,
+    SpaceMouseDevice,
+)
+
+
+def _feed(device, samples):
+    """Feed (t, axis values) samples through the device's listeners."""
+    state = device.state
+    for t, values in samples:
+        state.t = t
+        for axis in pyspacemouse.AXIS_NAMES:
+            setattr(state, axis, values.get(axis, 0.0))
+        device._invoke_callbacks(True, False)
+
+
+@pytest.fixture
+def device():
+    return SpaceMouseDevice(info=pyspacemouse.get_device_specs()["SpaceNavigator"])
+
+
+def test_flick_hold_and_twist(device):
+    events = []
+    recognizer = GestureRecognizer(callback=lambda state, event: events.append(event))
+    recognizer.attach(device)
+
+    # Quick flick to -x
+    _feed(device, [(0.0, {"x": -0.3}), (0.05, {"x": -0.9}), (0.1, {"x": 0.0})])
+    # Slow push on z is neither a flick nor (too short) a hold
+    _feed(device, [(1.0, {"z": 0.7}), (1.4, {"z": 0.7}), (1.5, {})])
+    # Push-and-hold on y, emitted once while still held
+    _feed(device, [(2.0, {"y": 0.8}), (2.3, {"y": 0.8}), (2.7, {"y": 0.8}), (2.9, {"y": 0.8})])
+    _feed(device, [(3.0, {})])
+    # Twist in yaw and back
+    _feed(device, [(4.0, {"yaw": 0.6}), (4.4, {"yaw": 0.05})])
+
+    assert [(e.gesture, e.axis, e.direction) for e in events] == [
+        ("flick", "x", -1),
+        ("hold", "y", 1),
+        ("twist", "yaw", 1),
+    ]
+    assert events[0].peak == pytest.approx(0.9)
+    assert events[1].duration == pytest.approx(0.7)
+
+    recognizer.detach(device)
+    _feed(device, [(5.0, {"x": 0.9}), (5.05, {})])
+    assert len(events) == 3
+
+
+def test_gesture_callbacks_and_device_thresholds(device):
+    hits = []
+    recognizer = GestureRecognizer(
+        gesture_callbacks=[
+            GestureCallback("flick", lambda s, e: hits.append(e.axis), axis="x", direction=1)
+        ],
+        device_thresholds={"SpaceNavigator": GestureThresholds(flick_threshold=0.95)},
+    )
+    recognizer.attach(device)
+    _feed(device, [(0.0, {"x": 0.9}), (0.1, {})])
+    _feed(device, [(1.0, {"x": 1.0}), (1.1, {})])
+    _feed(device, [(2.0, {"x": -1.0}), (2.1, {})])
+    assert hits == ["x"]
+
+    with pytest.raises(ValueError):
+        GestureCallback("swipe", print)
+
+
+def test_thresholds_follow_spec_reload(device):
+    events = []
+    recognizer = GestureRecognizer(
+        callback=lambda state, event: events.append(event.device),
+        device_thresholds={"Tuned": GestureThresholds(flick_threshold=0.95)},
+    )
+    recognizer.attach(device)
+    _feed(device, [(0.0, {"x": 0.9}), (0.1, {})])
+    device.reload_spec(dataclasses.replace(device.info, name="Tuned"))
+    _feed(device, [(1.0, {"x": 0.9}), (1.1, {})])
+    _feed(device, [(2.0, {"x": 1.0}), (2.1, {})])
+    assert events == ["SpaceNavigator", "Tuned"]
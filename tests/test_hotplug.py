@@ -0,0 +1,86 @@
+"""Tests for the inotify hotplug watcher using a temporary /dev and sysfs tree."""
+
+import os
+import select
+import sys
+import time
+
+import pytest
+
+import pyspacemouse
+from pyspacemouse.hotplug import HotplugWatcher
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+
+
+def _make_node(dev_dir, sysfs_root, name, vendor_id, product_id):
+    device_dir = sysfs_root / name / "device"
+    device_dir.mkdir(parents=True)
+    (device_dir / "uevent").write_text(f"HID_ID=0003:{vendor_id:08X}:{product_id:08X}\n")
+    (dev_dir / name).write_text("")
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_watch_reports_arrival_and_removal(tmp_path):
+    dev_dir = tmp_path / "dev"
+    sysfs_root = tmp_path / "sys"
+    dev_dir.mkdir()
+    sysfs_root.mkdir()
+    nav = pyspacemouse.get_device_specs()["SpaceNavigator"]
+    _make_node(dev_dir, sysfs_root, "hidraw0", nav.vendor_id, nav.product_id)
+
+    events = []
+    watcher = HotplugWatcher(
+        on_connected=lambda path, info: events.append(("+", path, info.name)),
+        on_disconnected=lambda path: events.append(("-", path)),
+        dev_dir=str(dev_dir),
+        sysfs_root=str(sysfs_root),
+    )
+    with watcher:
+        watcher.start()
+        assert _wait_for(lambda: len(events) == 1)
+
+        # Unsupported devices are ignored
+        _make_node(dev_dir, sysfs_root, "hidraw1", 0x1234, 0x5678)
+        _make_node(dev_dir, sysfs_root, "hidraw2", nav.vendor_id, nav.product_id)
+        assert _wait_for(lambda: len(events) == 2)
+
+        os.remove(dev_dir / "hidraw0")
+        assert _wait_for(lambda: len(events) == 3)
+
+    assert events == [
+        ("+", str(dev_dir / "hidraw0"), "SpaceNavigator"),
+        ("+", str(dev_dir / "hidraw2"), "SpaceNavigator"),
+        ("-", str(dev_dir / "hidraw0")),
+    ]
+
+
+def test_existing_devices_make_fileno_readable(tmp_path):
+    dev_dir = tmp_path / "dev"
+    sysfs_root = tmp_path / "sys"
+    dev_dir.mkdir()
+    sysfs_root.mkdir()
+    nav = pyspacemouse.get_device_specs()["SpaceNavigator"]
+    _make_node(dev_dir, sysfs_root, "hidraw0", nav.vendor_id, nav.product_id)
+
+    events = []
+    with HotplugWatcher(
+        on_connected=lambda path, info: events.append(path),
+        dev_dir=str(dev_dir),
+        sysfs_root=str(sysfs_root),
+    ) as watcher:
+        # An event loop reader on fileno() runs the initial scan immediately
+        readable, _, _ = select.select([watcher.fileno()], [], [], 0)
+        assert readable
+        assert watcher.process_events() == 1
+        assert events == [str(dev_dir / "hidraw0")]
+        readable, _, _ = select.select([watcher.fileno()], [], [], 0)
+        assert not readable
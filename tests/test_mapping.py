@@ -0,0 +1,148 @@
+"""Tests for the input-to-action mapping engine."""
+
+import dataclasses
+
+import pytest
+
+import pyspacemouse
+from pyspacemouse import MappingEngine, MappingRule, SpaceMouseDevice
+from pyspacemouse.synthetic import encode_report
+
+
+def _channels(info):
+    return sorted(
+        {spec.channel for spec in info.mappings.values()}
+        | {spec.channel for spec in info.button_specs if spec.channel is not None}
+    )
+
+
+def _set(device, buttons=(), **axes):
+    """Send one report per channel carrying the given axes and buttons."""
+    info = device.info
+    pressed = [1 if name in buttons else 0 for name in info.button_names]
+    for channel in _channels(info):
+        device._process(encode_report(info, channel, axes, pressed))
+
+
+def test_rules_from_toml(tmp_path):
+    path = tmp_path / "mappings.toml"
+    path.write_text(
+        """
+[[rules]]
+action = "rotate"
+held = ["BTN_1"]
+axis = "yaw"
+above = 0.3
+
+[[rules]]
+action = "menu"
+pressed = "MENU"
+
+[[rules]]
+action = "other_device"
+pressed = "NOT_A_BUTTON"
+device = "SpaceNavigator"
+"""
+    )
+    fired = []
+    engine = MappingEngine.from_toml(path, callback=lambda a, s, v: fired.append((a, v)))
+    device = SpaceMouseDevice(info=pyspacemouse.get_device_specs()["SpaceMouseEnterprise"])
+    engine.attach(device)
+
+    _set(device, yaw=0.5)  # BTN_1 not held
+    _set(device, buttons=["BTN_1"], yaw=0.2)  # below threshold
+    _set(device, buttons=["BTN_1"], yaw=0.5)
+    _set(device, buttons=["BTN_1", "MENU"], yaw=0.0)  # MENU press edge
+    _set(device, buttons=["BTN_1", "MENU"], yaw=0.0)  # still held: no repeat
+    assert fired == [("rotate", 0.5), ("menu", 1.0)]
+
+    with pytest.raises(ValueError, match="NOT_A_BUTTON"):
+        engine.compile(pyspacemouse.get_device_specs()["SpaceNavigator"])
+
+
+def test_bound_actions_and_validation():
+    calls = []
+    engine = MappingEngine([MappingRule("left", axis="x", below=-0.5, held=["LEFT"])])
+    engine.bind("left", lambda state, value: calls.append(value))
+    device = SpaceMouseDevice(info=pyspacemouse.get_device_specs()["SpaceNavigator"])
+    engine.attach(device)
+    _set(device, buttons=["LEFT"], x=-0.8)
+    _set(device, buttons=["RIGHT"], x=-0.8)
+    assert calls == [-0.8]
+
+    with pytest.raises(ValueError):
+        MappingRule("bad", pressed="MENU", axis="x", above=0.1)
+    with pytest.raises(ValueError):
+        MappingRule("bad", axis="x")
+
+
+def test_axis_rules_only_run_for_reports_carrying_their_axis():
+    fired = []
+    engine = MappingEngine(
+        [
+            MappingRule("push", axis="z", above=0.5),
+            MappingRule("twist", axis="yaw", above=0.5),
+        ],
+        callback=lambda action, state, value: fired.append(action),
+    )
+    info = pyspacemouse.get_device_specs()["SpaceNavigator"]
+    device = SpaceMouseDevice(info=info)
+    engine.attach(device)
+    translation = info.mappings["z"].channel
+    rotation = info.mappings["yaw"].channel
+
+    device._process(encode_report(info, translation, {"z": 0.8}, [0, 0]))
+    device._process(encode_report(info, rotation, {"yaw": 0.8}, [0, 0]))
+    # Button-only report: no axis rule runs with the stale axis values
+    device._process(encode_report(info, info.button_specs[0].channel, {}, [1, 0]))
+    assert fired == ["push", "twist"]
+
+
+def test_rules_follow_spec_reload(tmp_path, caplog):
+    fired = []
+    engine = MappingEngine(
+        [MappingRule("right", pressed="RIGHT"), MappingRule("fit", pressed="FIT")],
+        callback=lambda action, state, value: fired.append(action),
+    )
+    device = SpaceMouseDevice(info=pyspacemouse.get_device_specs()["SpaceNavigator"])
+    engine.attach(device)
+    _set(device, buttons=["RIGHT"])
+    _set(device)
+    assert fired == ["right"]
+
+    # Add a FIT button: RIGHT moves to another bit of the button mask
+    toml = (
+        (pyspacemouse.loader.Path(pyspacemouse.loader.__file__).parent / "devices.toml")
+        .read_text()
+        .replace("RIGHT = [3, 1, 1]\n", "RIGHT = [3, 1, 1]\nFIT = [3, 1, 2]\n")
+    )
+    path = tmp_path / "override.toml"
+    path.write_text(toml)
+    device.reload_spec(toml_path=str(path))
+    assert list(device.info.button_names) == ["LEFT", "RIGHT", "FIT"]
+
+    fired.clear()
+    _set(device, buttons=["FIT"])
+    _set(device, buttons=["FIT", "RIGHT"])
+    _set(device)
+    assert fired == ["fit", "right"]
+
+    # A reload that leaves a device-specific rule without its button disables
+    # the rules instead of firing them for whatever button took its bit
+    engine.detach(device)
+    engine = MappingEngine(
+        [MappingRule("fit", pressed="FIT", device="SpaceNavigator")],
+        callback=lambda action, state, value: fired.append(action),
+    )
+    engine.attach(device)
+    fired.clear()
+    _set(device, buttons=["FIT"])
+    _set(device)
+    assert fired == ["fit"]
+    with caplog.at_level("WARNING", logger="pyspacemouse"):
+        device.reload_spec(
+            dataclasses.replace(device.info, button_names=("LEFT", "RIGHT", "OTHER"))
+        )
+    assert "Mapping rules disabled" in caplog.text
+    _set(device, buttons=["OTHER"])
+    assert fired == ["fit"]
@@ -0,0 +1,129 @@
+"""Tests for the process-per-device reader pool."""
+
+import multiprocessing
+import time
+
+import pytest
+
+import pyspacemouse
+from pyspacemouse import AxisConvention, DevicePool, SpaceMouseDevice
+from pyspacemouse.synthetic import SyntheticHIDDevice
+
+
+class _FailingHIDDevice(SyntheticHIDDevice):
+    def read(self, size=64, timeout=None):
+        if self.reports_sent >= 20:
+            raise OSError("device unplugged")
+        return super().read(size, timeout)
+
+
+class _HangingHIDDevice(SyntheticHIDDevice):
+    def read(self, size=64, timeout=None):
+        if self.reports_sent >= 20:
+            time.sleep(3600)  # A read that never returns
+        return super().read(size, timeout)
+
+
+_HID_CLASSES = {"failing": _FailingHIDDevice, "hanging": _HangingHIDDevice}
+
+
+def _synthetic_opener(path, axis_convention=None, backend="hidapi"):
+    info = pyspacemouse.apply_axis_convention(
+        pyspacemouse.get_device_specs()["SpaceNavigator"], axis_convention
+    )
+    hid_class = _HID_CLASSES.get(path, SyntheticHIDDevice)
+    device = SpaceMouseDevice(
+        info, device=hid_class(info, rate=1000.0), axis_convention=axis_convention
+    )
+    device.open()
+    return device
+
+
+def _positive_x_only(state):
+    return state if state.x >= 0 else None
+
+
+def _pool(paths, **kwargs):
+    return DevicePool(
+        paths,
+        axis_convention=AxisConvention.HID,
+        context=multiprocessing.get_context("spawn"),
+        opener=_synthetic_opener,
+        **kwargs,
+    )
+
+
+def test_pool_streams_filtered_frames():
+    seen = {0: [], 1: []}
+    with _pool(["a", "b"], filters=[_positive_x_only]) as pool:
+        assert [device.name for device in pool] == ["SpaceNavigator"] * 2
+        for index, device in enumerate(pool):
+            device.configure(callback=lambda state, index=index: seen[index].append(state.x))
+        deadline = time.monotonic() + 10
+        while min(len(v) for v in seen.values()) < 50 and time.monotonic() < deadline:
+            pool.poll(timeout=0.05)
+        assert all(device.connected for device in pool)
+        snapshot = pool[0].snapshot()
+
+    assert min(len(v) for v in seen.values()) >= 50
+    assert all(x >= 0 for v in seen.values() for x in v)
+    assert snapshot.t_ns > 0
+    assert not pool[0].connected
+
+
+def test_pool_restarts_crashed_worker():
+    events = []
+    with _pool(
+        ["failing"],
+        restart_delay=0.0,
+        on_disconnect=lambda device: events.append("lost"),
+        on_reconnect=lambda device: events.append("back"),
+    ) as pool:
+        deadline = time.monotonic() + 20
+        while "back" not in events and time.monotonic() < deadline:
+            pool[0].read()
+            time.sleep(0.01)
+        assert events[:2] == ["lost", "back"]
+        assert pool[0].restarts >= 1
+
+
+def test_pool_restarts_hung_worker(caplog):
+    events = []
+
+    def lost(device):
+        # Reset to rest, stamped with the time of the loss
+        snapshot = device.snapshot()
+        events.append(("lost", snapshot.x, snapshot.t_ns >= last_t_ns[0], device.connected))
+        # No motion extrapolated from before the loss
+        events.append(("predicted", device.sample_at().x))
+
+    last_t_ns = [0]
+    with _pool(
+        ["hanging", "a"],
+        restart_delay=0.0,
+        heartbeat_interval=0.05,
+        heartbeat_timeout=0.5,
+        on_disconnect=lost,
+        on_reconnect=lambda device: events.append(("back",)),
+    ) as pool:
+        pool[0].enable_prediction()
+        pool[0].add_listener(lambda state: last_t_ns.__setitem__(0, state.t_ns))
+        other = []
+        pool[1].add_listener(lambda state: other.append(state.t))
+        deadline = time.monotonic() + 20
+        with caplog.at_level("WARNING", logger="pyspacemouse"):
+            while ("back",) not in events and time.monotonic() < deadline:
+                pool.poll(timeout=0.01)
+        assert events[:3] == [("lost", 0.0, True, False), ("predicted", 0.0), ("back",)]
+        assert pool[0].restarts >= 1
+        # The other device kept streaming while the hung worker was replaced
+        assert len(other) > 100
+    assert "was terminated" in caplog.text
+
+
+def test_pool_reports_startup_failure():
+    def fail(path, **kwargs):
+        raise FileNotFoundError(path)
+
+    with pytest.raises(RuntimeError, match="FileNotFoundError"):
+        DevicePool(["missing"], context=multiprocessing.get_context("fork"), opener=fail)
@@ -0,0 +1,56 @@
+"""Tests for the real-time reader options."""
+
+import gc
+import os
+
+import pytest
+from conftest import FakeHIDDevice
+
+import pyspacemouse
+from pyspacemouse import RealtimeOptions, SpaceMouseDevice, realtime_scope
+
+needs_affinity = pytest.mark.skipif(
+    not hasattr(os, "sched_getaffinity"), reason="CPU affinity is Linux-only"
+)
+
+
+@needs_affinity
+def test_scope_applies_and_restores_settings():
+    before = os.sched_getaffinity(0)
+    cpu = min(before)
+    options = RealtimeOptions(cpus=[cpu], policy="fifo", priority=1, disable_gc=True)
+
+    with realtime_scope(options) as report:
+        assert report.cpus == (cpu,)
+        assert os.sched_getaffinity(0) == {cpu}
+        assert report.gc_disabled and not gc.isenabled()
+        # SCHED_FIFO needs privileges: either applied or reported
+        assert (report.policy == "fifo") != any("Scheduling" in e for e in report.errors)
+
+    assert os.sched_getaffinity(0) == before
+    assert gc.isenabled()
+    assert os.sched_getscheduler(0) == os.SCHED_OTHER
+
+
+@needs_affinity
+def test_invalid_settings_are_reported_not_raised():
+    with realtime_scope(RealtimeOptions(cpus=[100000])) as report:
+        assert report.cpus is None
+        assert not report.complete
+
+
+def test_run_reports_realtime_settings():
+    info = pyspacemouse.get_device_specs()["SpaceNavigator"]
+    device = SpaceMouseDevice(info=info, device=FakeHIDDevice(info.vendor_id, info.product_id))
+    device.open()
+    stats = device.run(duration=0.05, realtime=RealtimeOptions(disable_gc=True))
+    assert stats.realtime.gc_disabled
+    assert gc.isenabled()
+    assert device.run(duration=0.0).realtime is None
+
+
+def test_options_validation():
+    with pytest.raises(ValueError):
+        RealtimeOptions(policy="deadline")
+    with pytest.raises(ValueError):
+        RealtimeOptions(cpus=[])
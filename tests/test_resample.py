@@ -0,0 +1,65 @@
+"""Tests for the fixed-rate resampler using the synthetic device."""
+
+import asyncio
+import time
+
+import pytest
+from conftest import FakeHIDDevice
+
+import pyspacemouse
+from pyspacemouse import AxisConvention, Resampler, SpaceMouseDevice, apply_axis_convention
+from pyspacemouse.synthetic import SyntheticHIDDevice, encode_report
+
+
+def _synthetic_device(rate=250.0):
+    info = pyspacemouse.get_device_specs()["SpaceMousePro"]
+    device = SpaceMouseDevice(info=info, device=SyntheticHIDDevice(info, rate=rate))
+    device.open()
+    device.set_nonblocking(True)
+    return device
+
+
+def test_thread_produces_uniform_stream():
+    device = _synthetic_device()
+    samples = []
+    with Resampler(device, rate=100.0, callback=samples.append, mode="interpolate") as resampler:
+        resampler.start()
+        time.sleep(0.3)
+        resampler.stop()
+
+    assert 25 <= resampler.ticks + resampler.missed <= 32
+    intervals = [b.t - a.t for a, b in zip(samples, samples[1:])]
+    assert all(i == pytest.approx(0.01, abs=1e-9) for i in intervals)
+    assert len({s.x for s in samples[5:]}) > 1
+
+
+def test_timeout_decays_to_zero():
+    info = apply_axis_convention(
+        pyspacemouse.get_device_specs()["SpaceNavigator"], AxisConvention.HID
+    )
+    device = SpaceMouseDevice(info=info, device=FakeHIDDevice(info.vendor_id, info.product_id))
+    device.open()
+    resampler = Resampler(device, rate=100.0, callback=None, timeout=0.1, decay=0.1)
+    device._device.reports.append(bytes(encode_report(info, 1, {"x": 0.8}, [])))
+
+    now = time.perf_counter()
+    assert resampler.sample(now + 0.05).x == pytest.approx(0.8, abs=1e-2)
+    assert resampler.sample(now + 0.15).x == pytest.approx(0.4, abs=5e-2)
+    assert resampler.sample(now + 0.3).x == 0.0
+    resampler.close()
+
+
+def test_asyncio_driver():
+    device = _synthetic_device()
+    samples = []
+    resampler = Resampler(device, rate=200.0, callback=samples.append)
+
+    async def main():
+        task = asyncio.ensure_future(resampler.run_async())
+        await asyncio.sleep(0.1)
+        resampler.stop()
+        await task
+
+    asyncio.run(main())
+    assert 10 <= len(samples) <= 25
+    resampler.close()
@@ -0,0 +1,126 @@
+"""Tests for SessionLogger using the .npy backend (no optional dependencies)."""
+
+import ast
+import json
+import os
+import sys
+import threading
+from array import array
+
+import pytest
+from conftest import FakeHIDDevice
+
+import pyspacemouse
+from pyspacemouse import SessionLogger, SpaceMouseDevice
+from pyspacemouse.synthetic import encode_report
+
+
+def _load_npy(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data[:8] == b"\x93NUMPY\x01\x00"
+    header_len = int.from_bytes(data[8:10], "little")
+    header = ast.literal_eval(data[10 : 10 + header_len].decode("latin1"))
+    assert (10 + header_len) % 64 == 0
+    typecode = {"f8": "d", "u8": "Q", "u1": "B"}[header["descr"][1:]]
+    values = array(typecode, data[10 + header_len :])
+    assert len(values) == header["shape"][0]
+    return values
+
+
+def test_npy_segments(tmp_path):
+    info = pyspacemouse.get_device_specs()["SpaceNavigator"]
+    hid = FakeHIDDevice(info.vendor_id, info.product_id, serial_number="1234")
+    device = SpaceMouseDevice(info=info, device=hid)
+    device.open()
+
+    with SessionLogger(str(tmp_path), chunk_size=4, format="npy") as logger:
+        logger.attach(device)
+        for i in range(10):
+            hid.reports.append(bytes([1, i, 0, 0, 0, 0, 0]))
+            device.read()
+        logger.detach(device)
+        device.read()  # not logged after detach
+
+    assert logger.rows_written == 10
+    assert logger.dropped == 0
+    segments = sorted(os.listdir(tmp_path))
+    assert segments == ["devices.json", "segment-000000", "segment-000001", "segment-000002"]
+    t = _load_npy(tmp_path / "segment-000002" / "t.npy")
+    assert len(t) == 2
+    x = [v for s in segments[1:] for v in _load_npy(tmp_path / s / "x.npy")]
+    assert [round(v * info.axis_scale) for v in x] == list(range(10))
+    assert list(_load_npy(tmp_path / "segment-000000" / "device.npy")) == [0] * 4
+    assert json.loads((tmp_path / "devices.json").read_text()) == [
+        {"name": "SpaceNavigator", "serial": device.serial_number}
+    ]
+
+
+def _open(serial_number):
+    info = pyspacemouse.get_device_specs()["SpaceNavigator"]
+    hid = FakeHIDDevice(info.vendor_id, info.product_id, serial_number=serial_number)
+    device = SpaceMouseDevice(info=info, device=hid)
+    device.open()
+    return device
+
+
+def test_devices_read_from_separate_threads(tmp_path):
+    devices = [_open("A"), _open("B")]
+    n_reports = 5000
+    reports = [bytes(encode_report(devices[0].info, 1, {"x": v}, [])) for v in (0.25, -0.5)]
+
+    def reader(device):
+        for i in range(n_reports):
+            device._process(reports[i % 2], 1_000_000 * (i + 1))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+    try:
+        with SessionLogger(str(tmp_path), chunk_size=64, max_chunks=512, format="npy") as logger:
+            for device in devices:
+                logger.attach(device)
+            threads = [threading.Thread(target=reader, args=(d,)) for d in devices]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert logger.dropped == 0
+    assert logger.rows_written == 2 * n_reports
+    segments = sorted(p for p in os.listdir(tmp_path) if p.startswith("segment-"))
+    t = [v for s in segments for v in _load_npy(tmp_path / s / "t.npy")]
+    index = [v for s in segments for v in _load_npy(tmp_path / s / "device.npy")]
+    assert len(t) == 2 * n_reports
+    for device_index in (0, 1):
+        times = [v for v, d in zip(t, index) if d == device_index]
+        assert times == [pytest.approx(1e-3 * (i + 1)) for i in range(n_reports)]
+
+
+def test_parquet_round_trip(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    devices = [_open("A"), _open("B")]
+    path = tmp_path / "session.parquet"
+    with SessionLogger(str(path), chunk_size=4, max_chunks=8, format="parquet") as logger:
+        for device in devices:
+            logger.attach(device)
+        for i in range(10):
+            device = devices[i % 2]
+            device._process(
+                bytes(encode_report(device.info, 3, {}, [i % 2, 1])), 1_000_000 * (i + 1)
+            )
+            device._process(
+                bytes(encode_report(device.info, 1, {"x": i / 10}, [])), 1_000_000 * (i + 1)
+            )
+
+    assert logger.rows_written == 20
+    parquet = pq.ParquetFile(str(path))
+    assert parquet.metadata.num_row_groups == 5
+    table = parquet.read().to_pydict()
+    assert list(table) == ["t", "x", "y", "z", "roll", "pitch", "yaw", "buttons", "name", "serial"]
+    assert table["t"] == pytest.approx([1e-3 * (i // 2 + 1) for i in range(20)])
+    assert table["x"][1::2] == pytest.approx([i / 10 for i in range(10)], abs=1e-2)
+    assert table["buttons"][0::2] == [int(pyspacemouse.ButtonState([i % 2, 1])) for i in range(10)]
+    assert table["serial"] == [devices[i // 2 % 2].serial_number for i in range(20)]
+    assert set(table["name"]) == {"SpaceNavigator"}
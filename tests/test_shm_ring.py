@@ -0,0 +1,62 @@
+"""Tests for the shared-memory raw report ring."""
+
+import multiprocessing
+
+import pytest
+from conftest import FakeHIDDevice
+
+import pyspacemouse
+from pyspacemouse import AxisConvention, ReportRing, ReportRingReader, SpaceMouseDevice
+from pyspacemouse.synthetic import encode_report
+
+
+def _device():
+    base = pyspacemouse.get_device_specs()["SpaceNavigator"]
+    info = pyspacemouse.apply_axis_convention(base, AxisConvention.HID_Z_UP)
+    hid = FakeHIDDevice(info.vendor_id, info.product_id)
+    device = SpaceMouseDevice(info=info, device=hid, axis_convention=AxisConvention.HID_Z_UP)
+    device.open()
+    return device, hid
+
+
+def _push(device, hid, value):
+    hid.reports.append(bytes(encode_report(device.info, 1, {"x": value, "z": value}, [])))
+    device.read()
+
+
+def test_reader_decodes_every_report_and_detects_lapping():
+    device, hid = _device()
+    with ReportRing(device, slots=4) as ring:
+        reader = ReportRingReader(ring.name)
+        states = []
+        reader.device.configure(callback=lambda s: states.append((s.x, s.z)))
+
+        for value in (0.1, 0.2, 0.3):
+            _push(device, hid, value)
+        assert reader.process() == 3
+        assert states == [pytest.approx((v, v), abs=1e-2) for v in (0.1, 0.2, 0.3)]
+
+        for i in range(6):
+            _push(device, hid, i / 10)
+        assert reader.process() == 4
+        assert reader.lapped == 2
+        reader.close()
+
+
+def _consume(name, queue):
+    with ReportRingReader(name, from_start=True) as reader:
+        queue.put([seq for seq, _, _ in reader.reports()])
+
+
+def test_consumer_process():
+    device, hid = _device()
+    with ReportRing(device, slots=16) as ring:
+        for i in range(5):
+            _push(device, hid, i / 10)
+        queue = multiprocessing.get_context("spawn").Queue()
+        process = multiprocessing.get_context("spawn").Process(
+            target=_consume, args=(ring.name, queue)
+        )
+        process.start()
+        assert queue.get(timeout=30) == [0, 1, 2, 3, 4]
+        process.join()
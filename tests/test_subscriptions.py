@@ -0,0 +1,137 @@
+"""Tests for axis predicate subscriptions."""
+
+import random
+
+import pytest
+
+import pyspacemouse
+from pyspacemouse import (
+    SpaceMouseDevice,
+    SubscriptionIndex,
+    above,
+    below,
+    between,
+    crosses,
+    outside,
+)
+from pyspacemouse.synthetic import encode_report
+
+
+def _device():
+    info = pyspacemouse.apply_axis_convention(
+        pyspacemouse.get_device_specs()["SpaceNavigator"], pyspacemouse.AxisConvention.HID
+    )
+    return SpaceMouseDevice(info=info, axis_convention=pyspacemouse.AxisConvention.HID)
+
+
+def _push(device, **values):
+    device._process(bytes(encode_report(device.info, 1, values, [])))
+
+
+def test_thresholds_and_crossings():
+    device = _device()
+    index = SubscriptionIndex()
+    events = []
+    index.subscribe(outside("z", 0.2), lambda s, v: events.append(("|z|>0.2", round(v, 1))))
+    index.subscribe(crosses("x", 0.0), lambda s, v: events.append(("x crosses", round(v, 1))))
+    index.subscribe(
+        crosses("x", 0.5, direction=-1), lambda s, v: events.append(("x down 0.5", round(v, 1)))
+    )
+    held = index.subscribe(
+        between("x", 0.1, 0.6), lambda s, v: events.append(("x held", round(v, 1))), repeat=True
+    )
+    index.attach(device)
+
+    for x, z in ((0.3, 0.1), (0.3, 0.3), (0.7, -0.5), (0.4, 0.5), (-0.2, 0.0)):
+        _push(device, x=x, z=z)
+    # Rest at 0 is on neither side of 0, so leaving it is not a crossing;
+    # z going from 0.3 to -0.5 stays outside +-0.2 and does not enter again
+    assert events == [
+        ("x held", 0.3),
+        ("x held", 0.3),
+        ("|z|>0.2", 0.3),
+        ("x held", 0.4),
+        ("x down 0.5", 0.4),
+        ("x crosses", -0.2),
+    ]
+
+    events.clear()
+    held.remove()
+    index.detach(device)
+    _push(device, x=0.3, z=0.9)
+    assert events == []
+    assert len(index) == 3
+
+
+def test_crossings_are_symmetric():
+    device = _device()
+    index = SubscriptionIndex()
+    events = []
+    index.subscribe(crosses("x", 0.0), lambda s, v: events.append(("both", round(v, 1))))
+    index.subscribe(crosses("x", 0.0, 1), lambda s, v: events.append(("up", round(v, 1))))
+    index.subscribe(crosses("x", 0.0, -1), lambda s, v: events.append(("down", round(v, 1))))
+    index.attach(device)
+
+    # Touching 0 and returning is no crossing; passing through 0 is one,
+    # reported when the other side is reached, in both directions alike
+    for x in (0.3, 0.0, 0.3, 0.0, -0.3, 0.0, -0.3, 0.0, 0.3):
+        _push(device, x=x)
+    assert events == [("both", -0.3), ("down", -0.3), ("both", 0.3), ("up", 0.3)]
+
+
+def test_index_matches_direct_evaluation():
+    rng = random.Random(1)
+    predicates = []
+    for _ in range(200):
+        a, b = sorted(round(rng.uniform(-1, 1), 1) for _ in range(2))
+        predicates.append(
+            rng.choice([above("y", a), below("y", b), between("y", a, b), outside("y", abs(a))])
+        )
+    fired = []
+    index = SubscriptionIndex()
+    for i, predicate in enumerate(predicates):
+        index.subscribe(predicate, lambda s, v, i=i: fired.append(i), repeat=True)
+    device = _device()
+    index.attach(device)
+
+    for _ in range(100):
+        value = round(rng.uniform(-1, 1), 1)
+        fired.clear()
+        _push(device, y=value)
+        y = device.snapshot().y
+        assert fired == [i for i, p in enumerate(predicates) if p.holds(y)]
+
+
+def test_predicate_validation():
+    with pytest.raises(ValueError):
+        above("w", 0.1)
+    with pytest.raises(ValueError):
+        between("x", 0.5, 0.1)
+
+
+def test_entering_matches_direct_evaluation():
+    rng = random.Random(2)
+    predicates = []
+    for _ in range(100):
+        a, b = sorted(round(rng.uniform(-1, 1), 1) for _ in range(2))
+        predicates.append(
+            rng.choice([above("y", a), below("y", b), between("y", a, b), outside("y", abs(a))])
+        )
+    fired = []
+    index = SubscriptionIndex()
+    for i, predicate in enumerate(predicates):
+        index.subscribe(predicate, lambda s, v, i=i: fired.append(i), repeat=i % 3 == 0)
+    device = _device()
+    index.attach(device)
+
+    previous = 0.0
+    for _ in range(200):
+        fired.clear()
+        _push(device, y=round(rng.uniform(-1, 1), 1))
+        y = device.snapshot().y
+        assert fired == [
+            i
+            for i, p in enumerate(predicates)
+            if p.holds(y) and (i % 3 == 0 or not p.holds(previous))
+        ]
+        previous = y
@@ -0,0 +1,71 @@
+"""Tests for the report timing model."""
+
+import random
+
+import pytest
+
+from pyspacemouse import ReportClock
+
+PERIOD = 8_000_000  # 8 ms
+
+
+def _jittered(n, seed=1, start=1_000_000_000):
+    rng = random.Random(seed)
+    return [start + i * PERIOD + rng.randint(0, 1_500_000) for i in range(n)]
+
+
+def test_period_and_smoothing_converge():
+    clock = ReportClock()
+    raw = _jittered(400)
+    smoothed = [clock.update(t) for t in raw]
+    assert clock.period == pytest.approx(PERIOD * 1e-9, rel=0.02)
+    assert clock.jitter > 0
+
+    # Smoothed intervals are much more regular than raw intervals
+    def spread(ts):
+        deltas = [b - a for a, b in zip(ts[200:], ts[201:])]
+        return max(deltas) - min(deltas)
+
+    assert spread(smoothed) < spread(raw) / 3
+
+
+def test_resyncs_after_idle_gap_and_recovers_from_bursts():
+    clock = ReportClock()
+    for t in _jittered(50):
+        clock.update(t)
+    resume = 5_000_000_000
+    assert clock.update(resume) == resume
+
+    # A burst of queued reports must not leave a collapsed period behind
+    for t in (resume + 10, resume + 20, resume + 30, resume + 40, resume + 50):
+        clock.update(t)
+    assert clock.period == pytest.approx(PERIOD * 1e-9, rel=0.05)
+    assert clock.backlog == 5
+    dropped = clock.dropped
+    for i in range(1, 20):
+        clock.update(resume + 50 + i * PERIOD)
+    assert clock.period == pytest.approx(PERIOD * 1e-9, rel=0.05)
+    assert clock.dropped == dropped
+
+
+def test_period_reestimated_from_repeated_gaps():
+    clock = ReportClock()
+    # Two reports of a drained burst give a far too short first estimate
+    clock.update(1_000_000_000)
+    clock.update(1_000_000_100)
+    for i in range(1, 40):
+        clock.update(1_000_000_100 + i * PERIOD)
+    assert clock.period == pytest.approx(PERIOD * 1e-9, rel=0.05)
+
+
+def test_resync_starts_new_stream():
+    clock = ReportClock()
+    raw = _jittered(50)
+    for t in raw:
+        clock.update(t)
+    clock.resync()
+    # Two periods later: not counted as dropped reports after a resync
+    resume = raw[-1] + 2 * PERIOD
+    assert clock.update(resume) == resume
+    assert clock.dropped == 0
+    assert clock.period == pytest.approx(PERIOD * 1e-9, rel=0.05)
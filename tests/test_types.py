@@ -0,0 +1,42 @@
+"""Tests for SpaceMouseState buffer export."""
+
+from array import array
+
+import pytest
+
+from pyspacemouse import ButtonState, SpaceMouseState
+
+
+def _state():
+    return SpaceMouseState(
+        t=2.5, x=0.1, y=0.2, z=0.3, roll=0.4, pitch=0.5, yaw=0.6, buttons=ButtonState([1, 0])
+    )
+
+
+def test_as_array_layout():
+    state = _state()
+    assert list(state.as_array()) == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+    assert list(state.as_array(t=True, buttons=True)) == [2.5, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 2.0]
+
+
+def test_write_into_row_of_log():
+    log = array("d", [0.0] * 14)
+    row = memoryview(log)[7:]
+    assert _state().write_into(row, t=True) == 7
+    assert list(log[7:]) == [2.5, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+    assert list(log[:7]) == [0.0] * 7
+
+
+def test_write_into_float32_with_offset():
+    buf = array("f", [0.0] * 8)
+    _state().write_into(buf, offset=1, buttons=True)
+    assert list(buf)[1:] == pytest.approx([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 2.0])
+
+
+def test_write_into_rejects_bad_buffers():
+    with pytest.raises(TypeError):
+        _state().write_into(bytes(64))
+    with pytest.raises(TypeError):
+        _state().write_into(array("i", [0] * 6))
+    with pytest.raises(ValueError):
+        _state().write_into(array("d", [0.0] * 6), t=True)